@@ -0,0 +1,71 @@
+from typing import Callable
+
+from pydantic import BaseModel
+
+from shared.composio_tools.lib import Action
+
+from .oauth import authorised_headers, authorised_headers_async
+
+
+class TinyURLAction(Action):
+    """
+    Base class of the TinyURL actions.
+
+    Subclasses declare the usual `_display_name`, `_request_schema`, `_response_schema`, `_tags` and
+    `_tool_name` attributes and implement `execute`/`execute_async` by handing their own work to `run`/`run_async`.
+    The request may also be passed as a plain dict, it is then validated against `_request_schema`.
+    """
+
+    @property
+    def display_name(self) -> str:
+        return self._display_name
+
+    @property
+    def request_schema(self) -> BaseModel:
+        return self._request_schema
+
+    @property
+    def response_schema(self) -> BaseModel:
+        return self._response_schema
+
+    def run(self, request, authorisation_data: dict, work: Callable) -> dict:
+        """
+        Run one call of the action and return its `execution_details`/`response_data` result.
+
+        Resolves the connection's headers, validates `request`, then calls `work(request, authorisation_data, headers)`,
+        which returns `(success, response)`. Any exception is reported as a failed response instead of being raised.
+        """
+        execution_details = {"executed": False}
+        response_data = {"success": False, "response": None}
+
+        try:
+            headers = authorised_headers(authorisation_data)
+            if isinstance(request, dict):
+                request = self._request_schema.model_validate(request)
+            response_data["success"], response_data["response"] = work(request, authorisation_data, headers)
+            execution_details["executed"] = True
+
+        except Exception as e:
+            response_data["response"] = str(e)
+
+        return {"execution_details": execution_details, "response_data": response_data}
+
+    async def run_async(self, request, authorisation_data: dict, work: Callable) -> dict:
+        """Asyncio counterpart of `run`, `work` being a coroutine function."""
+        execution_details = {"executed": False}
+        response_data = {"success": False, "response": None}
+
+        try:
+            headers = await authorised_headers_async(authorisation_data)
+            if isinstance(request, dict):
+                request = self._request_schema.model_validate(request)
+            response_data["success"], response_data["response"] = await work(request, authorisation_data, headers)
+            execution_details["executed"] = True
+
+        except Exception as e:
+            response_data["response"] = str(e)
+
+        return {"execution_details": execution_details, "response_data": response_data}
+
+
+__all__ = ["TinyURLAction"]
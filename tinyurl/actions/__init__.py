@@ -0,0 +1,27 @@
+import importlib
+
+# Action classes are imported on first access so that loading the tool only builds the request and
+# response models of the actions that are actually used.
+_ACTION_MODULES = {
+    "BulkShortenURLsAction": "bulk_shorten",
+    "CheckAliasesAction": "check_aliases",
+    "CreateTinyURLAction": "create_tinyurl",
+    "GetClickAnalyticsAction": "click_analytics",
+    "ListTinyURLsAction": "list_tinyurls",
+}
+
+
+def __getattr__(name):
+    module = _ACTION_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    action = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = action
+    return action
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ACTION_MODULES))
+
+
+__all__ = list(_ACTION_MODULES)
@@ -0,0 +1,164 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, Field
+
+from tool_runtime.credentials import credential_fingerprint
+
+from ..action import TinyURLAction
+from ..aliases import get_alias_index
+from ..transport import get_transport
+from ..url_cache import get_url_cache
+from ..urls import normalize_url
+from .create_tinyurl import DEFAULT_DOMAIN, create_body, created_link
+
+
+class BulkShortenURLsRequest(BaseModel):
+    urls: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="The long URLs to shorten, at most 10000. Example: ['https://example.com/a', 'https://example.com/b'].",
+        examples=[["https://example.com/a", "https://example.com/b"]],
+    )
+    domain: str = Field(
+        default=DEFAULT_DOMAIN,
+        description="The domain of the short links, 'tinyurl.com' or a branded domain of the account. Example: 'tinyurl.com'.",
+        examples=["tinyurl.com"],
+    )
+    tags: list[str] = Field(
+        default=None,
+        description="Tags to attach to the short links created by this call. Example: ['campaign'].",
+        examples=[["campaign"]],
+    )
+    concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="The number of links created concurrently. Requests are additionally paced by the account's rate limit. Example: 8.",
+        examples=[8],
+    )
+    use_cache: bool = Field(
+        default=True,
+        description="Whether to reuse the short links already created for the same URLs instead of creating new ones. Example: true.",
+        examples=[True],
+    )
+
+
+class BulkShortenURLsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if every URL was shortened.",
+    )
+    response: dict = Field(
+        ...,
+        description="The short link of each URL, in request order, with counts and the number of API calls made.",
+    )
+
+
+class _Batch:
+    """The unique normalized URLs of a request, the short links found for them and the per-URL errors."""
+
+    def __init__(self, request: BulkShortenURLsRequest, headers: dict):
+        self.request = request
+        self.credential = credential_fingerprint(headers)
+        self.normalized = []
+        self.errors = {}
+        for url in request.urls:
+            try:
+                self.normalized.append(normalize_url(url))
+            except ValueError as e:
+                self.normalized.append(None)
+                self.errors[url] = str(e)
+        unique = list(dict.fromkeys(url for url in self.normalized if url is not None))
+        self.cached = get_url_cache().get_many(self.credential, request.domain, unique) if request.use_cache else {}
+        self.missing = [url for url in unique if url not in self.cached]
+        self.created = {}
+
+    def body(self, url: str) -> dict:
+        return create_body(url, self.request.domain, tags=self.request.tags)
+
+    def store(self) -> None:
+        get_url_cache().put_many(self.credential, self.request.domain, self.created)
+        get_alias_index().record(self.created.values())
+
+    def report(self) -> dict:
+        results, counts, seen = [], {}, set()
+        for url, normalized in zip(self.request.urls, self.normalized):
+            result = {"url": url, "normalized_url": normalized}
+            link = self.created.get(normalized) or self.cached.get(normalized)
+            if normalized is None or link is None:
+                result.update(status="failed", error=self.errors.get(url) if normalized is None else self.errors.get(normalized))
+            elif normalized in seen:
+                result.update(status="duplicate", tiny_url=link["tiny_url"])
+            else:
+                result.update(status="created" if normalized in self.created else "cached", tiny_url=link["tiny_url"])
+            if normalized is not None:
+                seen.add(normalized)
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+            results.append(result)
+        return {"results": results, "counts": counts, "api_calls": len(self.missing)}
+
+
+class BulkShortenURLsAction(TinyURLAction):
+    """
+    This action shortens a batch of long URLs. URLs are normalized first (see `tinyurl.urls.normalize_url`), so equivalent spellings of a link share one short link. Duplicates within the batch are shortened once, links already created for the same URL and domain are reused from the persistent short link cache (see `tinyurl.url_cache`), and only the remaining URLs are sent to the API, concurrently and within the account's rate limit. The response will include the short link of each URL in request order.
+
+    Edge Cases:
+    - If urls is empty or holds more than 10000 URLs, the action will raise a validation error.
+    - A URL that is not an absolute http or https URL, or that the API rejects, is reported as `failed` with its error and does not stop the others; `success` is `true` only if every URL was shortened.
+    - Tags only apply to the links created by the call, reused links keep their tags. Set `use_cache` to `false` to always create new links.
+
+    Use Cases:
+    - Shortening every link of an outbound campaign before sending it.
+    - Re-running a campaign export without paying for the links shortened by earlier runs.
+    """
+
+    _display_name = "Bulk Shorten URLs"
+    _request_schema = BulkShortenURLsRequest
+    _response_schema = BulkShortenURLsResponse
+    _tags = ["tinyurl", "link"]
+    _tool_name = "tinyurl"
+
+    def _outcome(self, batch: _Batch) -> tuple:
+        batch.store()
+        report = batch.report()
+        return "failed" not in report["counts"], report
+
+    def _shorten(self, request: BulkShortenURLsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        batch = _Batch(request, authorisation_data["headers"])
+        transport = get_transport()
+
+        def create(url):
+            try:
+                batch.created[url] = created_link(transport.request("POST", "/create", headers=headers, json=batch.body(url)))
+            except Exception as e:
+                batch.errors[url] = str(e)
+
+        if batch.missing:
+            with ThreadPoolExecutor(max_workers=min(request.concurrency, len(batch.missing)), thread_name_prefix="tinyurl-bulk") as executor:
+                list(executor.map(create, batch.missing))
+        return self._outcome(batch)
+
+    async def _shorten_async(self, request: BulkShortenURLsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        # The short link cache is kept in SQLite: its lookups and writes run in a worker thread.
+        batch = await asyncio.to_thread(_Batch, request, authorisation_data["headers"])
+        transport = get_transport()
+        slots = asyncio.Semaphore(request.concurrency)
+
+        async def create(url):
+            async with slots:
+                try:
+                    response = await transport.request_async("POST", "/create", headers=headers, json=batch.body(url))
+                    batch.created[url] = created_link(response)
+                except Exception as e:
+                    batch.errors[url] = str(e)
+
+        await asyncio.gather(*(create(url) for url in batch.missing))
+        return await asyncio.to_thread(self._outcome, batch)
+
+    def execute(self, request: BulkShortenURLsRequest, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._shorten)
+
+    async def execute_async(self, request: BulkShortenURLsRequest, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._shorten_async)
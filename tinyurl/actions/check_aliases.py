@@ -0,0 +1,66 @@
+from pydantic import BaseModel, Field
+
+from ..action import TinyURLAction
+from ..aliases import get_alias_index
+from .create_tinyurl import DEFAULT_DOMAIN
+
+
+class CheckAliasesRequest(BaseModel):
+    candidates: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="The custom aliases to check. Example: ['spring-sale', 'spring-sale-2024'].",
+        examples=[["spring-sale", "spring-sale-2024"]],
+    )
+    domain: str = Field(
+        default=DEFAULT_DOMAIN,
+        description="The domain the aliases would be created on. Example: 'tinyurl.com'.",
+        examples=["tinyurl.com"],
+    )
+
+
+class CheckAliasesResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the candidates were checked.",
+    )
+    response: dict = Field(
+        ...,
+        description="The candidates that may be free and the ones known to be taken.",
+    )
+
+
+class CheckAliasesAction(TinyURLAction):
+    """
+    This action pre-screens custom alias candidates against the local index of aliases known to be taken (see `tinyurl.aliases`), without any API call. The response will include the candidates that may be free, in order, and the ones known to be taken.
+
+    Edge Cases:
+    - If candidates is empty, the action will raise a validation error.
+    - The index only knows the aliases seen in listing and create responses and the aliases the API refused. A candidate reported as possibly free may still be taken by another account; creating the link is the only definitive check.
+
+    Use Cases:
+    - Picking a branded alias among many generated variants before creating the link.
+    - Filtering alias suggestions shown to a user.
+    """
+
+    _display_name = "Check Aliases"
+    _request_schema = CheckAliasesRequest
+    _response_schema = CheckAliasesResponse
+    _tags = ["tinyurl", "link"]
+    _tool_name = "tinyurl"
+
+    def _check(self, request: CheckAliasesRequest, authorisation_data: dict, headers: dict) -> tuple:
+        free = get_alias_index().screen(request.domain, request.candidates)
+        available = set(free)
+        taken = [candidate for candidate in dict.fromkeys(request.candidates) if candidate not in available]
+        return True, {"domain": request.domain, "probably_free": free, "taken": taken}
+
+    async def _check_async(self, request: CheckAliasesRequest, authorisation_data: dict, headers: dict) -> tuple:
+        return self._check(request, authorisation_data, headers)
+
+    def execute(self, request: CheckAliasesRequest, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._check)
+
+    async def execute_async(self, request: CheckAliasesRequest, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._check_async)
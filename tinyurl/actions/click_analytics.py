@@ -0,0 +1,163 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, Field
+
+from tool_runtime.credentials import credential_fingerprint
+
+from ..action import TinyURLAction
+from ..analytics import TIMELINE_PATH, get_click_store, iso_day, parse_link, timeline, timeline_params, to_day, window_days
+from ..transport import get_transport
+
+
+class GetClickAnalyticsRequest(BaseModel):
+    links: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=50000,
+        description="The short links to report on, as 'https://tinyurl.com/alias', 'domain/alias' or a bare alias on tinyurl.com. Example: ['https://tinyurl.com/spring-sale'].",
+        examples=[["https://tinyurl.com/spring-sale", "tinyurl.com/summer-sale"]],
+    )
+    days: int = Field(
+        default=30,
+        ge=1,
+        le=3650,
+        description="The length of the reporting window, in days, ending on `end_date`. Example: 30.",
+        examples=[7, 30],
+    )
+    end_date: str = Field(
+        default=None,
+        description="The last day of the reporting window, as YYYY-MM-DD (UTC). Defaults to today. Example: '2024-06-30'.",
+        examples=["2024-06-30"],
+    )
+    top: int = Field(
+        default=10,
+        ge=0,
+        le=1000,
+        description="The number of most clicked links to return. Example: 10.",
+        examples=[10],
+    )
+    sync: bool = Field(
+        default=True,
+        description="Whether to fetch the clicks recorded since the last sync before answering. When false, the report only uses the local store. Example: true.",
+        examples=[True],
+    )
+    max_age: int = Field(
+        default=300,
+        ge=0,
+        description="Links synced less than this many seconds ago are not fetched again. Example: 300.",
+        examples=[300],
+    )
+    backfill_days: int = Field(
+        default=90,
+        ge=1,
+        le=3650,
+        description="How many days of history are fetched for a link that was never synced. Example: 90.",
+        examples=[90],
+    )
+    concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="The number of links fetched concurrently. Requests are additionally paced by the account's rate limit. Example: 8.",
+        examples=[8],
+    )
+
+
+class GetClickAnalyticsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the report was built and every stale link was synced.",
+    )
+    response: dict = Field(
+        ...,
+        description="The total clicks of the window, the daily series, the top links and sync statistics.",
+    )
+
+
+class _Sync:
+    def __init__(self, request: GetClickAnalyticsRequest, headers: dict):
+        self.request = request
+        self.credential = credential_fingerprint(headers)
+        self.links = list(dict.fromkeys(parse_link(link) for link in request.links))
+        self.stale = get_click_store().stale(self.credential, self.links, request.max_age, request.backfill_days) if request.sync else []
+        self.updates = {}
+        self.errors = {}
+
+    def report(self) -> dict:
+        store = get_click_store()
+        store.apply(self.credential, self.updates)
+        first, last = window_days(self.request.days, to_day(self.request.end_date) if self.request.end_date else None)
+        totals = store.window(self.credential, self.links, first, last)
+        return {
+            "window": {"from": iso_day(first), "to": iso_day(last)},
+            "total_clicks": sum(totals.values()),
+            "daily": store.series(self.credential, self.links, first, last),
+            "top": [{"link": f"{domain}/{alias}", "clicks": clicks} for (domain, alias), clicks in store.top(totals, self.request.top)],
+            "links": len(self.links),
+            "synced": len(self.updates),
+            "api_calls": len(self.stale),
+            "failed": [{"link": f"{domain}/{alias}", "error": error} for (domain, alias), error in self.errors.items()],
+        }
+
+
+class GetClickAnalyticsAction(TinyURLAction):
+    """
+    This action reports the clicks of TinyURL short links over a time window: the total, the daily series and the most clicked links. Click counts are kept locally as per-day counters (see `tinyurl.analytics`); each call only fetches, for the links not synced within `max_age` seconds, the days since their last sync, so refreshing a report over many links costs one small request per stale link. The response will include the report and how many links were synced.
+
+    Edge Cases:
+    - If links is empty, or `end_date` is not a YYYY-MM-DD date, the action will raise a validation error or return a response with `success` set to `false`.
+    - A link that cannot be fetched keeps its previously synced counts, is listed in `failed` with its error and sets `success` to `false`; the report is still returned.
+    - Links never synced are backfilled with `backfill_days` of history; clicks older than that are not counted.
+
+    Use Cases:
+    - Refreshing a campaign dashboard over tens of thousands of links.
+    - Finding the best performing links of the last week.
+    """
+
+    _display_name = "Get Click Analytics"
+    _request_schema = GetClickAnalyticsRequest
+    _response_schema = GetClickAnalyticsResponse
+    _tags = ["tinyurl", "analytics"]
+    _tool_name = "tinyurl"
+
+    def _sync(self, request: GetClickAnalyticsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        sync = _Sync(request, authorisation_data["headers"])
+        transport = get_transport()
+
+        def fetch(stale):
+            domain, alias, first = stale
+            try:
+                response = transport.request("GET", TIMELINE_PATH, headers=headers, params=timeline_params(domain, alias, first))
+                sync.updates[(domain, alias)] = (first, timeline(response))
+            except Exception as e:
+                sync.errors[(domain, alias)] = str(e)
+
+        if sync.stale:
+            with ThreadPoolExecutor(max_workers=min(request.concurrency, len(sync.stale)), thread_name_prefix="tinyurl-analytics") as executor:
+                list(executor.map(fetch, sync.stale))
+        return not sync.errors, sync.report()
+
+    async def _sync_async(self, request: GetClickAnalyticsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        # The click store is kept in SQLite: finding the stale links and building the report run in a worker thread.
+        sync = await asyncio.to_thread(_Sync, request, authorisation_data["headers"])
+        transport = get_transport()
+        slots = asyncio.Semaphore(request.concurrency)
+
+        async def fetch(stale):
+            domain, alias, first = stale
+            async with slots:
+                try:
+                    response = await transport.request_async("GET", TIMELINE_PATH, headers=headers, params=timeline_params(domain, alias, first))
+                    sync.updates[(domain, alias)] = (first, timeline(response))
+                except Exception as e:
+                    sync.errors[(domain, alias)] = str(e)
+
+        await asyncio.gather(*(fetch(stale) for stale in sync.stale))
+        return not sync.errors, await asyncio.to_thread(sync.report)
+
+    def execute(self, request: GetClickAnalyticsRequest, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._sync)
+
+    async def execute_async(self, request: GetClickAnalyticsRequest, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._sync_async)
@@ -0,0 +1,155 @@
+from pydantic import BaseModel, Field
+
+from tool_runtime.credentials import credential_fingerprint
+
+from ..action import TinyURLAction
+from ..aliases import get_alias_index
+from ..transport import TinyURLError, get_transport, raise_for_status
+from ..url_cache import get_url_cache
+from ..urls import normalize_url
+
+DEFAULT_DOMAIN = "tinyurl.com"
+
+
+class CreateTinyURLRequest(BaseModel):
+    url: str = Field(
+        ...,
+        description="The long URL to shorten. Example: 'https://example.com/campaigns/spring?utm_source=newsletter'.",
+        examples=["https://example.com/campaigns/spring?utm_source=newsletter"],
+    )
+    domain: str = Field(
+        default=DEFAULT_DOMAIN,
+        description="The domain of the short link, 'tinyurl.com' or a branded domain of the account. Example: 'tinyurl.com'.",
+        examples=["tinyurl.com"],
+    )
+    alias: str = Field(
+        default=None,
+        description="A custom alias for the short link, the part after the domain. A random alias is generated when not set. Example: 'spring-sale'.",
+        examples=["spring-sale"],
+    )
+    alias_candidates: list[str] = Field(
+        default=None,
+        description="Fallback aliases tried in order when `alias` is taken. Candidates known to be taken are skipped without an API call. Example: ['spring-sale-2024', 'spring-sale-eu'].",
+        examples=[["spring-sale-2024", "spring-sale-eu"]],
+    )
+    tags: list[str] = Field(
+        default=None,
+        description="Tags to attach to the short link. Example: ['campaign', 'spring'].",
+        examples=[["campaign", "spring"]],
+    )
+    expires_at: str = Field(
+        default=None,
+        description="When the short link stops working, as an ISO 8601 timestamp. Example: '2025-12-31 23:59:59'.",
+        examples=["2025-12-31 23:59:59"],
+    )
+    description: str = Field(
+        default=None,
+        description="A description of the short link. Example: 'Spring newsletter'.",
+        examples=["Spring newsletter"],
+    )
+
+
+class CreateTinyURLResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the short link was created successfully.",
+    )
+    response: dict = Field(
+        ...,
+        description="The short link as returned by the TinyURL API, including `tiny_url`, `alias` and `domain`.",
+    )
+
+
+def create_body(url: str, domain: str, alias: str = None, tags: list = None, expires_at: str = None, description: str = None) -> dict:
+    body = {"url": url, "domain": domain}
+    for key, value in (("alias", alias), ("tags", tags), ("expires_at", expires_at), ("description", description)):
+        if value:
+            body[key] = value
+    return body
+
+
+def created_link(response) -> dict:
+    """Return the `data` member of a `/create` response, raising for error responses."""
+    raise_for_status(response)
+    return response.json()["data"]
+
+
+def cacheable(request) -> bool:
+    """Whether the link created for `request` may be reused for the same long URL: not for aliases or expiring links."""
+    return not request.alias and not request.alias_candidates and not request.expires_at
+
+
+def alias_taken(error: Exception) -> bool:
+    """Whether `error` is the API refusing an alias that is already taken."""
+    return isinstance(error, TinyURLError) and error.status == 422 and any("alias" in message.lower() for message in error.errors)
+
+
+class CreateTinyURLAction(TinyURLAction):
+    """
+    This action shortens a long URL into a TinyURL short link, optionally with a custom alias, tags and an expiry date. The response will include the short link as returned by the TinyURL API.
+
+    Edge Cases:
+    - If the url is not an absolute http or https URL, the action will return a response with `success` set to `false`.
+    - If the alias is already taken on the domain, the next of `alias_candidates` is tried. Aliases known to be taken from earlier listing and create responses (see `tinyurl.aliases`) are skipped without an API call; when no candidate is left, the action will return a response with `success` set to `false`.
+    - Links created without an alias or an expiry are recorded in the short link cache (see `tinyurl.url_cache`), so that `BulkShortenURLsAction` reuses them.
+
+    Use Cases:
+    - Creating a branded short link for a campaign.
+    - Shortening a link before sharing it in a message with a length limit.
+    """
+
+    _display_name = "Create TinyURL"
+    _request_schema = CreateTinyURLRequest
+    _response_schema = CreateTinyURLResponse
+    _tags = ["tinyurl", "link"]
+    _tool_name = "tinyurl"
+
+    def _attempts(self, request: CreateTinyURLRequest) -> tuple:
+        # Returns the normalized URL and the bodies to try in order, one per alias that may be free.
+        url = normalize_url(request.url)
+        if not request.alias and not request.alias_candidates:
+            return url, [create_body(url, request.domain, None, request.tags, request.expires_at, request.description)]
+        aliases = get_alias_index().screen(request.domain, [request.alias, *(request.alias_candidates or ())])
+        if not aliases:
+            raise ValueError(f"Every alias candidate is already taken on {request.domain}.")
+        return url, [create_body(url, request.domain, alias, request.tags, request.expires_at, request.description) for alias in aliases]
+
+    def _refused(self, request: CreateTinyURLRequest, body: dict, error: Exception, last: bool) -> None:
+        if not alias_taken(error) or "alias" not in body:
+            raise error
+        get_alias_index().add(request.domain, body["alias"])
+        if last:
+            raise error
+
+    def _record(self, request: CreateTinyURLRequest, headers: dict, url: str, link: dict) -> None:
+        get_alias_index().record((link,))
+        if cacheable(request):
+            get_url_cache().put_many(credential_fingerprint(headers), request.domain, {url: link})
+
+    def _create(self, request: CreateTinyURLRequest, authorisation_data: dict, headers: dict) -> tuple:
+        url, attempts = self._attempts(request)
+        for i, body in enumerate(attempts):
+            try:
+                link = created_link(get_transport().request("POST", "/create", headers=headers, json=body))
+                break
+            except Exception as e:
+                self._refused(request, body, e, i == len(attempts) - 1)
+        self._record(request, authorisation_data["headers"], url, link)
+        return True, link
+
+    async def _create_async(self, request: CreateTinyURLRequest, authorisation_data: dict, headers: dict) -> tuple:
+        url, attempts = self._attempts(request)
+        for i, body in enumerate(attempts):
+            try:
+                link = created_link(await get_transport().request_async("POST", "/create", headers=headers, json=body))
+                break
+            except Exception as e:
+                self._refused(request, body, e, i == len(attempts) - 1)
+        self._record(request, authorisation_data["headers"], url, link)
+        return True, link
+
+    def execute(self, request: CreateTinyURLRequest, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._create)
+
+    async def execute_async(self, request: CreateTinyURLRequest, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._create_async)
@@ -0,0 +1,88 @@
+from pydantic import BaseModel, Field
+
+from ..action import TinyURLAction
+from ..aliases import get_alias_index
+from ..transport import get_transport, raise_for_status
+
+
+class ListTinyURLsRequest(BaseModel):
+    type: str = Field(
+        default="available",
+        description="Which links to list: 'available' for active links or 'archived'. Example: 'available'.",
+        examples=["available", "archived"],
+    )
+    search: str = Field(
+        default=None,
+        description="Only list links whose URL or alias contains this text. Example: 'spring'.",
+        examples=["spring"],
+    )
+    tag: str = Field(
+        default=None,
+        description="Only list links with this tag. Example: 'campaign'.",
+        examples=["campaign"],
+    )
+    created_after: str = Field(
+        default=None,
+        description="Only list links created after this time, as 'YYYY-MM-DD HH:MM:SS'. Example: '2024-01-01 00:00:00'.",
+        examples=["2024-01-01 00:00:00"],
+    )
+    created_before: str = Field(
+        default=None,
+        description="Only list links created before this time, as 'YYYY-MM-DD HH:MM:SS'. Example: '2024-12-31 23:59:59'.",
+        examples=["2024-12-31 23:59:59"],
+    )
+
+
+class ListTinyURLsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the links were listed successfully.",
+    )
+    response: dict = Field(
+        ...,
+        description="The links of the account as returned by the TinyURL API, under `data`.",
+    )
+
+
+def _params(request: ListTinyURLsRequest) -> dict:
+    fields = (("search", request.search), ("tag", request.tag), ("from", request.created_after), ("to", request.created_before))
+    return {key: value for key, value in fields if value is not None}
+
+
+def _listed(response) -> dict:
+    raise_for_status(response)
+    body = response.json()
+    get_alias_index().record(body.get("data"))
+    return body
+
+
+class ListTinyURLsAction(TinyURLAction):
+    """
+    This action lists the TinyURL short links of the account, optionally filtered by text, tag or creation time. The response will include the links as returned by the TinyURL API.
+
+    Edge Cases:
+    - If type is neither 'available' nor 'archived', the API request fails and the action will return a response with `success` set to `false`.
+    - The aliases of the listed links are added to the local alias index (see `tinyurl.aliases`), so that `CreateTinyURLAction` and `CheckAliasesAction` skip them without an API call.
+
+    Use Cases:
+    - Reviewing the links created for a campaign.
+    - Seeding the alias index before creating many branded links.
+    """
+
+    _display_name = "List TinyURLs"
+    _request_schema = ListTinyURLsRequest
+    _response_schema = ListTinyURLsResponse
+    _tags = ["tinyurl", "link"]
+    _tool_name = "tinyurl"
+
+    def _list(self, request: ListTinyURLsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        return True, _listed(get_transport().request("GET", f"/urls/{request.type}", headers=headers, params=_params(request)))
+
+    async def _list_async(self, request: ListTinyURLsRequest, authorisation_data: dict, headers: dict) -> tuple:
+        return True, _listed(await get_transport().request_async("GET", f"/urls/{request.type}", headers=headers, params=_params(request)))
+
+    def execute(self, request: ListTinyURLsRequest, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._list)
+
+    async def execute_async(self, request: ListTinyURLsRequest, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._list_async)
@@ -0,0 +1,166 @@
+"""
+Local index of the TinyURL aliases known to be taken, per domain.
+
+Creating a link with a custom alias that is already taken costs a full round trip only to learn that it
+is. The index remembers every alias seen in listing and create responses, and every alias the API
+refused, so candidates can be screened locally and only the ones that may be free are sent to the API.
+
+Aliases are stored as 64-bit hashes in a sorted `array` per domain (8 bytes per alias) with a small set
+absorbing recent additions, and an optional Bloom filter in front answers most lookups of free aliases
+without touching the array. A hash collision can only make a free alias look taken, never the reverse,
+and the API remains the authority: an alias that looks free may still be taken by another account.
+"""
+
+import hashlib
+import math
+import threading
+from array import array
+from bisect import bisect_left
+
+# The number of recent additions kept in a set before they are merged into the sorted array.
+_MERGE_AT = 4096
+
+
+def _hash(alias: str) -> int:
+    return int.from_bytes(hashlib.blake2b(alias.casefold().encode(), digest_size=8).digest(), "little")
+
+
+class BloomFilter:
+    """
+    Bloom filter over 64-bit hashes, sized for `capacity` items at a false-positive rate of `error_rate`.
+
+    The `k` probe positions are derived from the two 32-bit halves of the hash (double hashing), so no
+    further hashing is needed per probe.
+    """
+
+    __slots__ = ("size", "probes", "bits")
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 0.01):
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.probes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: int):
+        low, high = value & 0xFFFFFFFF, value >> 32
+        for i in range(self.probes):
+            yield (low + i * high) % self.size
+
+    def add(self, value: int) -> None:
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: int) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class _DomainAliases:
+    __slots__ = ("sorted", "recent", "bloom")
+
+    def __init__(self, bloom: BloomFilter = None):
+        self.sorted = array("Q")
+        self.recent = set()
+        self.bloom = bloom
+
+    def add(self, value: int) -> None:
+        if value in self.recent or self._in_sorted(value):
+            return
+        self.recent.add(value)
+        if self.bloom is not None:
+            self.bloom.add(value)
+        if len(self.recent) >= _MERGE_AT:
+            self.sorted = array("Q", sorted((*self.sorted, *self.recent)))
+            self.recent.clear()
+
+    def _in_sorted(self, value: int) -> bool:
+        index = bisect_left(self.sorted, value)
+        return index < len(self.sorted) and self.sorted[index] == value
+
+    def __contains__(self, value: int) -> bool:
+        if self.bloom is not None and value not in self.bloom:
+            return False
+        return value in self.recent or self._in_sorted(value)
+
+    def __len__(self) -> int:
+        return len(self.sorted) + len(self.recent)
+
+
+class AliasIndex:
+    """
+    Taken aliases per domain, see the module documentation.
+
+    Aliases are compared case-insensitively, which can only make the screening more conservative.
+
+    Args:
+        bloom: Whether to put a Bloom filter in front of each domain's aliases.
+        capacity: The number of aliases per domain each Bloom filter is sized for; beyond it the false-positive
+            rate grows, which only costs an exact lookup.
+        error_rate: The false-positive rate of the Bloom filters at `capacity`.
+    """
+
+    def __init__(self, bloom: bool = True, capacity: int = 100_000, error_rate: float = 0.01):
+        self.bloom = bloom
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._domains = {}
+        self._lock = threading.Lock()
+
+    def _domain(self, domain: str) -> _DomainAliases:
+        aliases = self._domains.get(domain)
+        if aliases is None:
+            aliases = self._domains[domain] = _DomainAliases(BloomFilter(self.capacity, self.error_rate) if self.bloom else None)
+        return aliases
+
+    def add(self, domain: str, alias: str) -> None:
+        self.add_many(domain, (alias,))
+
+    def add_many(self, domain: str, aliases) -> None:
+        values = [_hash(alias) for alias in aliases if alias]
+        with self._lock:
+            known = self._domain(domain.lower())
+            for value in values:
+                known.add(value)
+
+    def record(self, links) -> None:
+        """Add the `domain` and `alias` of link objects as returned by the API."""
+        for link in links or ():
+            if isinstance(link, dict) and link.get("domain") and link.get("alias"):
+                self.add(link["domain"], link["alias"])
+
+    def is_taken(self, domain: str, alias: str) -> bool:
+        """Whether `alias` is known to be taken on `domain`."""
+        known = self._domains.get(domain.lower())
+        return known is not None and _hash(alias) in known
+
+    def screen(self, domain: str, candidates) -> list:
+        """Return the `candidates` not known to be taken on `domain`, in order and without duplicates."""
+        known = self._domains.get(domain.lower())
+        unique = dict.fromkeys(candidate for candidate in candidates if candidate)
+        if known is None:
+            return list(unique)
+        return [candidate for candidate in unique if _hash(candidate) not in known]
+
+    def size(self, domain: str) -> int:
+        known = self._domains.get(domain.lower())
+        return 0 if known is None else len(known)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._domains.clear()
+
+
+_index = AliasIndex()
+
+
+def get_alias_index() -> AliasIndex:
+    """Return the process-wide alias index."""
+    return _index
+
+
+def configure_alias_index(**kwargs) -> AliasIndex:
+    """Replace the process-wide alias index with one built from `kwargs` (see `AliasIndex`)."""
+    global _index
+    _index = AliasIndex(**kwargs)
+    return _index
+
+
+__all__ = ["AliasIndex", "BloomFilter", "configure_alias_index", "get_alias_index"]
@@ -0,0 +1,317 @@
+"""
+Local store of TinyURL click counts, synced incrementally.
+
+Each link's clicks are kept as one unsigned 32-bit counter per UTC day in an `array`, from the first day
+fetched to the last one, together with its high-water mark: the day up to which the counts were synced
+and when. A sync only asks the API for the days from the high-water mark on (that last day was still
+open when it was fetched), so refreshing a report costs one small request per stale link however long
+its history is. Window totals, daily series and top-N rankings are then computed from the arrays
+without any API call.
+
+The counters are persisted to a SQLite database, one row per link and credential, so the history
+survives restarts; a process reads a credential's rows once, on first use.
+"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+from .transport import raise_for_status
+
+DEFAULT_PATH = Path(os.environ.get("TINYURL_ANALYTICS_PATH", Path.home() / ".cache" / "tinyurl" / "analytics.sqlite3"))
+
+DEFAULT_DOMAIN = "tinyurl.com"
+
+TIMELINE_PATH = "/analytics/timeline"
+
+_EPOCH = date(1970, 1, 1).toordinal()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS clicks (
+    credential TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    alias TEXT NOT NULL,
+    start_day INTEGER NOT NULL,
+    counts BLOB NOT NULL,
+    synced_day INTEGER NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (credential, domain, alias)
+) WITHOUT ROWID
+"""
+
+
+def day_number(value: date) -> int:
+    """Return the number of days between 1970-01-01 and `value`."""
+    return value.toordinal() - _EPOCH
+
+
+def day_date(day: int) -> date:
+    return date.fromordinal(day + _EPOCH)
+
+
+def today() -> int:
+    return day_number(datetime.now(timezone.utc).date())
+
+
+def parse_link(link: str) -> tuple:
+    """Return `(domain, alias)` of a short link given as `https://domain/alias`, `domain/alias` or a bare alias."""
+    link = link.strip()
+    if "://" in link:
+        link = link.split("://", 1)[1]
+    domain, _, alias = link.rstrip("/").rpartition("/")
+    if not alias:
+        raise ValueError(f"Not a short link: {link!r}")
+    return domain or DEFAULT_DOMAIN, alias
+
+
+class DailyCounts:
+    """The per-day click counters of one link and its high-water mark."""
+
+    __slots__ = ("start", "counts", "synced_day", "synced_at")
+
+    def __init__(self, start: int, counts: array = None, synced_day: int = None, synced_at: float = 0.0):
+        self.start = start
+        self.counts = counts if counts is not None else array("I")
+        self.synced_day = synced_day
+        self.synced_at = synced_at
+
+    def set(self, day: int, count: int) -> None:
+        if day < self.start:
+            self.counts[0:0] = array("I", bytes(4 * (self.start - day)))
+            self.start = day
+        index = day - self.start
+        if index >= len(self.counts):
+            self.counts.extend(array("I", bytes(4 * (index + 1 - len(self.counts)))))
+        self.counts[index] = count
+
+    def clear(self, first: int, last: int) -> None:
+        """Zero the counters from day `first` to day `last`, both included."""
+        lo = max(first - self.start, 0)
+        hi = min(last - self.start + 1, len(self.counts))
+        if lo < hi:
+            self.counts[lo:hi] = array("I", bytes(4 * (hi - lo)))
+
+    def total(self, first: int, last: int) -> int:
+        """Clicks from day `first` to day `last`, both included."""
+        lo = max(first - self.start, 0)
+        hi = min(last - self.start + 1, len(self.counts))
+        return sum(self.counts[lo:hi]) if lo < hi else 0
+
+    def add_to(self, series: list, first: int) -> None:
+        """Add the daily counts to `series`, whose element 0 is day `first`."""
+        lo = max(first - self.start, 0)
+        hi = min(first + len(series) - self.start, len(self.counts))
+        offset = self.start - first
+        for index in range(lo, hi):
+            series[index + offset] += self.counts[index]
+
+
+def daily_counts(body) -> dict:
+    """
+    Return `{day number: clicks}` from a timeline response.
+
+    The timeline is accepted as a `{date: clicks}` mapping or as a list of `{date, clicks}` objects, where
+    the date may be named `date`, `day`, `key` or `timestamp` and the clicks `clicks`, `count` or `value`;
+    it may be wrapped in `data` and `timeline` members.
+    """
+    data = body.get("data", body) if isinstance(body, dict) else body
+    if isinstance(data, dict) and "timeline" in data:
+        data = data["timeline"]
+    if isinstance(data, dict):
+        pairs = data.items()
+    else:
+        pairs = []
+        for point in data or ():
+            when = next((point[key] for key in ("date", "day", "key", "timestamp") if key in point), None)
+            clicks = next((point[key] for key in ("clicks", "count", "value") if key in point), 0)
+            pairs.append((when, clicks))
+    counts = {}
+    for when, clicks in pairs:
+        if when is None:
+            continue
+        day = day_number(date.fromisoformat(str(when)[:10]))
+        counts[day] = counts.get(day, 0) + int(clicks or 0)
+    return counts
+
+
+def timeline_params(domain: str, alias: str, first: int) -> dict:
+    start = datetime.combine(day_date(first), datetime.min.time())
+    end = datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+    return {
+        "domain": domain,
+        "alias": alias,
+        "from": start.strftime("%Y-%m-%d %H:%M:%S"),
+        "to": end.strftime("%Y-%m-%d %H:%M:%S"),
+        "interval": "day",
+    }
+
+
+def timeline(response) -> dict:
+    raise_for_status(response)
+    return daily_counts(response.json())
+
+
+class ClickStore:
+    """
+    Per-credential click counters of TinyURL links, see the module documentation.
+
+    Args:
+        path: The SQLite database the counters are persisted to, `":memory:"` to keep them in this process only.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._links = {}
+        self._loaded = set()
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if str(self.path) != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _load(self, credential: str) -> None:
+        if credential in self._loaded:
+            return
+        rows = self._connect().execute(
+            "SELECT domain, alias, start_day, counts, synced_day, synced_at FROM clicks WHERE credential = ?", (credential,)
+        )
+        for domain, alias, start, blob, synced_day, synced_at in rows:
+            counts = array("I")
+            counts.frombytes(blob)
+            self._links[(credential, domain, alias)] = DailyCounts(start, counts, synced_day, synced_at)
+        self._loaded.add(credential)
+
+    def get(self, credential: str, domain: str, alias: str):
+        with self._lock:
+            self._load(credential)
+            return self._links.get((credential, domain, alias))
+
+    def stale(self, credential: str, links: list, max_age: float, backfill: int) -> list:
+        """Return `(domain, alias, first day to fetch)` for the `links` not synced within `max_age` seconds."""
+        now, first_day = time.time(), today() - backfill + 1
+        stale = []
+        with self._lock:
+            self._load(credential)
+            for domain, alias in links:
+                counts = self._links.get((credential, domain, alias))
+                if counts is None:
+                    stale.append((domain, alias, first_day))
+                elif now - counts.synced_at >= max_age:
+                    stale.append((domain, alias, counts.synced_day))
+        return stale
+
+    def apply(self, credential: str, updates: dict) -> None:
+        """
+        Store `{(domain, alias): (first day fetched, {day: clicks})}` and persist the links updated.
+
+        The fetched days replace the stored ones, so a re-fetched day is never counted twice, and each link's
+        high-water mark moves to today.
+        """
+        synced_day, synced_at = today(), time.time()
+        rows = []
+        with self._lock:
+            self._load(credential)
+            for (domain, alias), (first, daily) in updates.items():
+                counts = self._links.get((credential, domain, alias))
+                if counts is None:
+                    counts = self._links[(credential, domain, alias)] = DailyCounts(first)
+                counts.clear(first, synced_day)
+                for day, clicks in daily.items():
+                    counts.set(day, clicks)
+                counts.synced_day, counts.synced_at = synced_day, synced_at
+                rows.append((credential, domain, alias, counts.start, counts.counts.tobytes(), synced_day, synced_at))
+            if rows:
+                connection = self._connect()
+                with connection:
+                    connection.execute("BEGIN")
+                    connection.executemany("INSERT OR REPLACE INTO clicks VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def window(self, credential: str, links: list, first: int, last: int) -> dict:
+        """Return `{(domain, alias): clicks}` from day `first` to day `last` for the `links` that have counters."""
+        with self._lock:
+            self._load(credential)
+            found = ((link, self._links.get((credential, *link))) for link in links)
+            return {link: counts.total(first, last) for link, counts in found if counts is not None}
+
+    def series(self, credential: str, links: list, first: int, last: int) -> list:
+        """Return the daily clicks of the `links` summed, one value per day from `first` to `last`."""
+        series = [0] * (last - first + 1)
+        with self._lock:
+            self._load(credential)
+            for link in links:
+                counts = self._links.get((credential, *link))
+                if counts is not None:
+                    counts.add_to(series, first)
+        return series
+
+    @staticmethod
+    def top(totals: dict, n: int) -> list:
+        return heapq.nlargest(n, totals.items(), key=lambda item: item[1])
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+            self._loaded.clear()
+            self._links.clear()
+        if connection is not None:
+            connection.close()
+
+
+def window_days(days: int, end: int = None) -> tuple:
+    """Return the first and last day of the `days`-day window ending on day `end`, today by default."""
+    last = today() if end is None else end
+    return last - days + 1, last
+
+
+def iso_day(day: int) -> str:
+    return day_date(day).isoformat()
+
+
+def to_day(value: str) -> int:
+    return day_number(date.fromisoformat(value))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_click_store() -> ClickStore:
+    """Return the process-wide click store, persisted at `DEFAULT_PATH` unless configured otherwise."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ClickStore()
+        return _store
+
+
+def configure_click_store(**kwargs) -> ClickStore:
+    """Replace the process-wide click store with one built from `kwargs` (see `ClickStore`)."""
+    global _store
+    with _store_lock:
+        previous, _store = _store, ClickStore(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _store
+
+
+__all__ = [
+    "ClickStore",
+    "DEFAULT_PATH",
+    "DailyCounts",
+    "configure_click_store",
+    "daily_counts",
+    "get_click_store",
+    "parse_link",
+]
@@ -0,0 +1,85 @@
+"""
+Shared cache of the access tokens of TinyURL OAuth connections.
+
+Connections made through the `tinyurl_oauth2` scheme hold a short-lived access token and a refresh token.
+`authorised_headers` returns the headers an action sends: the connection's headers with the current
+access token, renewed through the TinyURL token endpoint `refresh_margin` seconds before it expires.
+Authorisation data without a `refresh_token` (API tokens, or access tokens renewed by the platform) is
+used as is. The cache itself, including how workers sharing a `path` coordinate their refreshes, is
+`tool_runtime.oauth.TokenCache`; this module only points it at TinyURL's endpoint, transport and client.
+
+The short link cache and the click store keep keying a connection by the headers it was given, so a
+renewed access token does not orphan what was stored under the previous one.
+
+    configure_token_cache(path="/var/cache/tinyurl/oauth-tokens.sqlite3", client_id="...", client_secret="...")
+"""
+
+import threading
+
+from tool_runtime.oauth import OAuthToken, TokenCache
+
+from .transport import get_transport, raise_for_status
+
+TOKEN_URL = "https://tinyurl.com/oauth/access_token"
+
+
+class TinyURLTokenCache(TokenCache):
+    """`TokenCache` renewing tokens through the TinyURL token endpoint, see `tool_runtime.oauth.TokenCache` for the arguments."""
+
+    _client_env = "TINYURL_OAUTH"
+
+    def __init__(self, token_url: str = TOKEN_URL, **kwargs):
+        super().__init__(token_url, **kwargs)
+
+    def _request_token(self, data: dict) -> dict:
+        response = get_transport().session.post(self.token_url, data=data, timeout=self.timeout)
+        raise_for_status(response)
+        return response.json()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TinyURLTokenCache:
+    """Return the process-wide token cache, in memory only unless configured otherwise."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TinyURLTokenCache()
+        return _cache
+
+
+def configure_token_cache(**kwargs) -> TinyURLTokenCache:
+    """Replace the process-wide token cache with one built from `kwargs` (see `TinyURLTokenCache`)."""
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, TinyURLTokenCache(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _cache
+
+
+def authorised_headers(authorisation_data: dict) -> dict:
+    """Return the headers to send for `authorisation_data` through the process-wide cache (see `TokenCache.authorised_headers`)."""
+    if not authorisation_data.get("refresh_token"):
+        return authorisation_data["headers"]
+    return get_token_cache().authorised_headers(authorisation_data)
+
+
+async def authorised_headers_async(authorisation_data: dict) -> dict:
+    """Asyncio counterpart of `authorised_headers`."""
+    if not authorisation_data.get("refresh_token"):
+        return authorisation_data["headers"]
+    return await get_token_cache().authorised_headers_async(authorisation_data)
+
+
+__all__ = [
+    "OAuthToken",
+    "TOKEN_URL",
+    "TinyURLTokenCache",
+    "authorised_headers",
+    "authorised_headers_async",
+    "configure_token_cache",
+    "get_token_cache",
+]
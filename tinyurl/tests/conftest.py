@@ -0,0 +1,118 @@
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from tinyurl.aliases import configure_alias_index
+from tinyurl.analytics import configure_click_store
+from tinyurl.transport import configure_transport
+from tinyurl.url_cache import configure_url_cache
+
+
+class MockTinyURLAPI:
+    """
+    In-process stand-in for the TinyURL endpoints used by the actions: `/create`, `/urls/{type}` and the
+    analytics timeline.
+
+    `links` holds the account's links by `(domain, alias)`, `clicks` the clicks of a link by ISO date and
+    `taken` the aliases owned by other accounts. Every request is logged in `requests` as
+    `(method, path, query)`.
+    """
+
+    def __init__(self):
+        self.links = {}
+        self.clicks = {}
+        self.taken = set()
+        self.requests = []
+        self._aliases = (f"mock{i}" for i in itertools.count())
+        self._lock = threading.Lock()
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_link(self, url: str, alias: str, domain: str = "tinyurl.com") -> dict:
+        link = {"url": url, "domain": domain, "alias": alias, "tiny_url": f"https://{domain}/{alias}", "tags": []}
+        self.links[(domain, alias)] = link
+        return link
+
+    def calls(self, method: str, path: str) -> list:
+        """Return the query of every `method` request to `path`, in order."""
+        return [query for logged_method, logged_path, query in self.requests if (logged_method, logged_path) == (method, path)]
+
+    def __enter__(self) -> "MockTinyURLAPI":
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                api._serve(self)
+
+            do_GET = do_POST = _handle
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="mock-tinyurl-api", daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        parts = urlsplit(handler.path)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = json.loads(handler.rfile.read(length)) if length else None
+        with self._lock:
+            self.requests.append((handler.command, parts.path, query))
+            if handler.command == "POST" and parts.path == "/create":
+                status, reply = self._create(body)
+            elif handler.command == "GET" and parts.path.startswith("/urls/"):
+                status, reply = 200, {"data": list(self.links.values()), "code": 0, "errors": []}
+            elif handler.command == "GET" and parts.path == "/analytics/timeline":
+                status, reply = 200, {"data": {"timeline": self._timeline(query)}, "code": 0, "errors": []}
+            else:
+                status, reply = 404, {"data": [], "code": 404, "errors": [f"No route for {handler.command} {parts.path}"]}
+        payload = json.dumps(reply).encode()
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _create(self, body: dict) -> tuple:
+        domain = body.get("domain", "tinyurl.com")
+        alias = body.get("alias")
+        if alias is not None and ((domain, alias) in self.links or (domain, alias) in self.taken):
+            return 422, {"data": [], "code": 5, "errors": ["Alias is not available."]}
+        link = self.add_link(body["url"], alias or next(self._aliases), domain)
+        link["tags"] = body.get("tags") or []
+        return 200, {"data": link, "code": 0, "errors": []}
+
+    def _timeline(self, query: dict) -> list:
+        first, last = query["from"][:10], query["to"][:10]
+        clicks = self.clicks.get((query["domain"], query["alias"]), {})
+        return [{"date": day, "clicks": count} for day, count in sorted(clicks.items()) if first <= day <= last]
+
+
+@pytest.fixture
+def mock():
+    configure_alias_index()
+    configure_url_cache(path=":memory:")
+    configure_click_store(path=":memory:")
+    with MockTinyURLAPI() as mock:
+        configure_transport(base_url=mock.url)
+        yield mock
+    configure_transport()
@@ -0,0 +1,41 @@
+from tinyurl.actions.check_aliases import CheckAliasesAction
+from tinyurl.actions.create_tinyurl import CreateTinyURLAction
+from tinyurl.actions.list_tinyurls import ListTinyURLsAction
+from tinyurl.aliases import get_alias_index
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+def check(*candidates) -> dict:
+    return CheckAliasesAction().execute({"candidates": list(candidates)}, AUTH)["response_data"]["response"]
+
+
+def test_listing_seeds_the_index(mock):
+    mock.add_link("https://example.com/spring", "spring")
+    mock.add_link("https://example.com/summer", "summer")
+    assert check("spring", "autumn")["probably_free"] == ["spring", "autumn"]
+    assert ListTinyURLsAction().execute({}, AUTH)["response_data"]["success"] is True
+    screened = check("spring", "autumn", "summer", "autumn")
+    assert screened["probably_free"] == ["autumn"]
+    assert screened["taken"] == ["spring", "summer"]
+
+
+def test_created_and_refused_aliases_are_recorded(mock):
+    mock.taken.add(("tinyurl.com", "launch"))
+    request = {"url": "https://example.com/launch", "alias": "launch", "alias_candidates": ["launch-2024"]}
+    response = CreateTinyURLAction().execute(request, AUTH)["response_data"]
+    assert response["success"] is True
+    assert response["response"]["alias"] == "launch-2024"
+    assert len(mock.calls("POST", "/create")) == 2
+    assert check("launch", "launch-2024", "launch-2025")["probably_free"] == ["launch-2025"]
+
+
+def test_known_taken_aliases_are_skipped_without_an_api_call(mock):
+    get_alias_index().add("tinyurl.com", "spring")
+    response = CreateTinyURLAction().execute({"url": "https://example.com/", "alias": "spring", "alias_candidates": ["spring-sale"]}, AUTH)["response_data"]
+    assert response["response"]["alias"] == "spring-sale"
+    assert len(mock.calls("POST", "/create")) == 1
+
+    refused = CreateTinyURLAction().execute({"url": "https://example.com/", "alias": "spring"}, AUTH)["response_data"]
+    assert refused["success"] is False
+    assert len(mock.calls("POST", "/create")) == 1
@@ -0,0 +1,41 @@
+import asyncio
+
+from tinyurl.actions.bulk_shorten import BulkShortenURLsAction
+from tinyurl.actions.create_tinyurl import CreateTinyURLAction
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+def test_equivalent_urls_are_shortened_once(mock):
+    urls = ["https://Example.com", "HTTPS://example.com:443/", "https://example.com/a%7Eb", "https://example.com/a~b", "ftp://example.com/"]
+    response = BulkShortenURLsAction().execute({"urls": urls}, AUTH)["response_data"]
+    results = response["response"]["results"]
+    assert [result["status"] for result in results] == ["created", "duplicate", "created", "duplicate", "failed"]
+    assert [result["normalized_url"] for result in results[:4]] == ["https://example.com/", "https://example.com/", "https://example.com/a~b", "https://example.com/a~b"]
+    assert results[0]["tiny_url"] == results[1]["tiny_url"] != results[2]["tiny_url"]
+    assert response["response"]["api_calls"] == 2
+    assert response["success"] is False
+    assert sorted(link["url"] for link in mock.links.values()) == ["https://example.com/", "https://example.com/a~b"]
+
+
+def test_cached_links_are_reused_without_calling_the_api(mock):
+    created = CreateTinyURLAction().execute({"url": "https://example.com/spring"}, AUTH)["response_data"]["response"]
+    assert len(mock.calls("POST", "/create")) == 1
+
+    response = asyncio.run(BulkShortenURLsAction().execute_async({"urls": ["https://EXAMPLE.com/spring", "https://example.com/summer"]}, AUTH))["response_data"]
+    results = response["response"]["results"]
+    assert [result["status"] for result in results] == ["cached", "created"]
+    assert results[0]["tiny_url"] == created["tiny_url"]
+    assert response["response"]["api_calls"] == 1
+    assert len(mock.calls("POST", "/create")) == 2
+
+    again = BulkShortenURLsAction().execute({"urls": ["https://example.com/summer"]}, AUTH)["response_data"]["response"]
+    assert again["counts"] == {"cached": 1}
+    assert len(mock.calls("POST", "/create")) == 2
+
+
+def test_cache_can_be_bypassed(mock):
+    BulkShortenURLsAction().execute({"urls": ["https://example.com/"]}, AUTH)
+    response = BulkShortenURLsAction().execute({"urls": ["https://example.com/"], "use_cache": False}, AUTH)["response_data"]
+    assert response["response"]["counts"] == {"created": 1}
+    assert len(mock.calls("POST", "/create")) == 2
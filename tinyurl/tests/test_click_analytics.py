@@ -0,0 +1,34 @@
+from tinyurl.actions.click_analytics import GetClickAnalyticsAction
+from tinyurl.analytics import TIMELINE_PATH, iso_day, today
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+def report(**request) -> dict:
+    response = GetClickAnalyticsAction().execute({"links": ["tinyurl.com/spring"], "days": 7, **request}, AUTH)["response_data"]
+    assert response["success"] is True
+    return response["response"]
+
+
+def test_sync_only_fetches_from_the_high_water_mark(mock):
+    day = today()
+    mock.clicks[("tinyurl.com", "spring")] = {iso_day(day - 2): 3, iso_day(day - 1): 4, iso_day(day): 5}
+    first = report(backfill_days=7)
+    assert first["total_clicks"] == 12
+    assert first["daily"][-3:] == [3, 4, 5]
+    assert mock.calls("GET", TIMELINE_PATH)[0]["from"].startswith(iso_day(day - 6))
+
+    mock.clicks[("tinyurl.com", "spring")][iso_day(day)] = 8
+    second = report(max_age=0)
+    assert mock.calls("GET", TIMELINE_PATH)[1]["from"].startswith(iso_day(day))
+    assert second["total_clicks"] == 15
+    assert second["daily"][-3:] == [3, 4, 8]
+    assert second["api_calls"] == 1
+
+
+def test_recently_synced_links_are_answered_locally(mock):
+    mock.clicks[("tinyurl.com", "spring")] = {iso_day(today()): 2}
+    report()
+    assert report()["api_calls"] == 0
+    assert report(sync=False)["total_clicks"] == 2
+    assert len(mock.calls("GET", TIMELINE_PATH)) == 1
@@ -0,0 +1,35 @@
+from shared.composio_tools.lib import Action, Tool
+
+from . import actions as tinyurl_actions
+
+ACTION_NAMES = (
+    "CreateTinyURLAction",
+    "BulkShortenURLsAction",
+    "ListTinyURLsAction",
+    "CheckAliasesAction",
+    "GetClickAnalyticsAction",
+)
+
+
+class TinyURL(Tool):
+    """
+    Tool for shortening URLs with TinyURL.
+
+    Action classes are resolved lazily: `action` imports only the requested action's module, while
+    `actions` resolves all of them. Every action shares one pooled, rate-limited transport (see
+    `tinyurl.transport`), the persistent short link cache (see `tinyurl.url_cache`) and the local click
+    store the analytics are answered from (see `tinyurl.analytics`).
+    """
+
+    def actions(self) -> list:
+        return [getattr(tinyurl_actions, name) for name in ACTION_NAMES]
+
+    def action(self, name: str) -> type:
+        if name not in ACTION_NAMES:
+            raise ValueError(f"Unknown TinyURL action: {name}")
+        return getattr(tinyurl_actions, name)
+
+    def triggers(self) -> list:
+        return []
+
+__all__ = ["TinyURL"]
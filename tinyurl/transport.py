@@ -0,0 +1,196 @@
+import threading
+import weakref
+from typing import TYPE_CHECKING
+
+from tool_runtime.credentials import credential_fingerprint
+from tool_runtime.ratelimit import RateLimiter, RetryPolicy, TokenBucket
+
+if TYPE_CHECKING:
+    import requests
+
+BASE_URL = "https://api.tinyurl.com"
+
+
+class TinyURLError(Exception):
+    """An error response of the TinyURL API, with the messages of its `errors` list."""
+
+    def __init__(self, status: int, errors: list):
+        self.status = status
+        self.errors = errors
+        super().__init__(f"TinyURL API error {status}: {'; '.join(errors) or 'no details'}")
+
+
+def raise_for_status(response) -> None:
+    """Raise `TinyURLError` for an error response of `requests` or `httpx`."""
+    if response.status_code < 400:
+        return
+    try:
+        errors = response.json().get("errors") or []
+    except (ValueError, AttributeError):
+        errors = []
+    raise TinyURLError(response.status_code, [str(error) for error in errors])
+
+
+class TinyURLTransport:
+    """
+    Shared HTTP transport used by every TinyURL action.
+
+    One pooled `requests.Session` (and one `httpx.AsyncClient` per event loop) is kept so connections to
+    the API are reused across calls; both libraries are imported on first use. The pacing and retry loop is
+    the Vercel transport's (see `tool_runtime.ratelimit.RetryPolicy.run`): requests are paced through a per-credential token
+    bucket that follows the `X-RateLimit-*` headers, and a request that would wait longer than
+    `backoff_max` for it raises `RateLimitError`. Requests are retried with full-jitter exponential
+    backoff, on 429 for every request, since a rate-limited request was not processed, and on 5xx and
+    connection errors only for idempotent ones. A `Retry-After` header takes precedence over the backoff.
+
+    Args:
+        base_url: The TinyURL API origin.
+        rate: Requests per second each credential may send.
+        burst: The burst size of each credential's bucket.
+        pool_maxsize: The maximum number of keep-alive connections kept.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
+        max_retries: The maximum number of retries per request.
+        backoff_base: The backoff ceiling, in seconds, of the first retry; it doubles on every attempt.
+        backoff_max: The maximum backoff, in seconds.
+        max_buckets: The maximum number of credentials tracked at once.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        rate: float = 5.0,
+        burst: int = 10,
+        pool_maxsize: int = 32,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        max_buckets: int = 4096,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.rate_limiter = RateLimiter(rate, burst, max_buckets)
+        self.retry_policy = RetryPolicy(max_retries, backoff_base, backoff_max, always_retry_statuses=frozenset({429}))
+        self._session = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def bucket(self, headers: dict) -> TokenBucket:
+        """Return the token bucket of the credential in `headers`. TinyURL limits each account as a whole."""
+        return self.rate_limiter.bucket(credential_fingerprint(headers or {}))
+
+    @property
+    def session(self) -> "requests.Session":
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+                session = self._session
+        return session
+
+    def request(self, method: str, path: str, headers: dict = None, **kwargs) -> "requests.Response":
+        """Send a request to `path`, paced by the credential's bucket and retried as described above."""
+        import requests
+
+        kwargs.setdefault("timeout", (self.connect_timeout, self.read_timeout))
+        return self.retry_policy.run(
+            lambda: self.session.request(method, self.url(path), headers=headers, **kwargs),
+            self.bucket(headers),
+            method,
+            errors=(requests.ConnectionError, requests.Timeout),
+        )
+
+    def _async_client(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout, pool=None),
+                limits=httpx.Limits(max_keepalive_connections=self.pool_maxsize),
+            )
+            with self._lock:
+                client = self._async_clients.setdefault(loop, client)
+        return client
+
+    async def request_async(self, method: str, path: str, headers: dict = None, **kwargs):
+        """Asyncio counterpart of `request`, returning an `httpx.Response`."""
+        import httpx
+
+        client = self._async_client()
+        return await self.retry_policy.run_async(
+            lambda: client.request(method, self.url(path), headers=headers, **kwargs),
+            self.bucket(headers),
+            method,
+            errors=(httpx.TransportError,),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop, if any."""
+        import asyncio
+
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> TinyURLTransport:
+    """Return the process-wide transport, creating it with default settings on first use."""
+    global _transport
+    transport = _transport
+    if transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = TinyURLTransport()
+            transport = _transport
+    return transport
+
+
+def configure_transport(**kwargs) -> TinyURLTransport:
+    """Replace the process-wide transport with one built from `kwargs` (see `TinyURLTransport`)."""
+    global _transport
+    transport = TinyURLTransport(**kwargs)
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    if previous is not None:
+        previous.close()
+    return transport
+
+
+__all__ = [
+    "BASE_URL",
+    "TinyURLError",
+    "TinyURLTransport",
+    "configure_transport",
+    "get_transport",
+    "raise_for_status",
+]
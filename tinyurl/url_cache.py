@@ -0,0 +1,131 @@
+"""
+Persistent cache of the short links created through the TinyURL actions.
+
+Each entry maps `(credential, domain, normalized long URL)` to the short link TinyURL returned for it,
+so shortening the same link again, in the same or a later process, costs no API call. Entries live in a
+SQLite database shared by every worker on the host (write-ahead logging lets readers and the writer work
+concurrently). Links created with an alias or an expiry are not cached: they are specific to the request
+that created them.
+
+    configure_url_cache(path="/var/cache/tinyurl/short-urls.sqlite3")
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_PATH = Path(os.environ.get("TINYURL_CACHE_PATH", Path.home() / ".cache" / "tinyurl" / "short-urls.sqlite3"))
+
+# SQLite limits the number of bound parameters per statement; lookups are split into chunks of this size.
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS short_urls (
+    credential TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    url TEXT NOT NULL,
+    tiny_url TEXT NOT NULL,
+    alias TEXT,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (credential, domain, url)
+) WITHOUT ROWID
+"""
+
+
+class ShortURLCache:
+    """
+    SQLite-backed long URL to short link map, see the module documentation.
+
+    The database is opened on first use. A single connection is shared by the threads of the process
+    under a lock; lookups and inserts of a whole batch each run as one statement per `_CHUNK` URLs.
+
+    Args:
+        path: The database file, `":memory:"` for a cache private to this instance.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if str(self.path) != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def get_many(self, credential: str, domain: str, urls) -> dict:
+        """Return `{url: {"tiny_url": ..., "alias": ...}}` for the `urls` that are cached."""
+        urls = list(urls)
+        found = {}
+        with self._lock:
+            connection = self._connect()
+            for start in range(0, len(urls), _CHUNK):
+                chunk = urls[start : start + _CHUNK]
+                rows = connection.execute(
+                    f"SELECT url, tiny_url, alias FROM short_urls WHERE credential = ? AND domain = ? AND url IN ({','.join('?' * len(chunk))})",
+                    (credential, domain, *chunk),
+                )
+                for url, tiny_url, alias in rows:
+                    found[url] = {"tiny_url": tiny_url, "alias": alias}
+        return found
+
+    def put_many(self, credential: str, domain: str, links: dict) -> None:
+        """Store `{url: {"tiny_url": ..., "alias": ...}}`, replacing existing entries."""
+        if not links:
+            return
+        now = time.time()
+        rows = [(credential, domain, url, link["tiny_url"], link.get("alias"), now) for url, link in links.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany("INSERT OR REPLACE INTO short_urls VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def forget(self, credential: str, domain: str, url: str) -> None:
+        """Drop one entry, e.g. after its short link was deleted."""
+        with self._lock:
+            self._connect().execute("DELETE FROM short_urls WHERE credential = ? AND domain = ? AND url = ?", (credential, domain, url))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM short_urls").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_url_cache() -> ShortURLCache:
+    """Return the process-wide short link cache, stored at `DEFAULT_PATH` unless configured otherwise."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ShortURLCache()
+        return _cache
+
+
+def configure_url_cache(**kwargs) -> ShortURLCache:
+    """Replace the process-wide short link cache with one built from `kwargs` (see `ShortURLCache`)."""
+    global _cache
+    with _cache_lock:
+        previous, _cache = _cache, ShortURLCache(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _cache
+
+
+__all__ = ["DEFAULT_PATH", "ShortURLCache", "configure_url_cache", "get_url_cache"]
@@ -0,0 +1,50 @@
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Percent-escapes of unreserved characters, which RFC 3986 says are equivalent to the characters themselves.
+_ESCAPE = re.compile(r"%[0-9a-fA-F]{2}")
+_UNRESERVED = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+
+
+def _normalize_escapes(part: str) -> str:
+    def replace(match):
+        char = chr(int(match.group(0)[1:], 16))
+        return char if char in _UNRESERVED else match.group(0).upper()
+
+    return _ESCAPE.sub(replace, part) if "%" in part else part
+
+
+def normalize_url(url: str) -> str:
+    """
+    Return the canonical form of an absolute http(s) URL, so that equivalent spellings share one short link.
+
+    Surrounding whitespace is stripped, the scheme and host are lower-cased, internationalised hosts are
+    IDNA-encoded, default ports are dropped, an empty path becomes `/` and percent-escapes are upper-cased
+    (escapes of unreserved characters are decoded). The query and fragment are kept as they are, in their
+    original order, since servers may depend on them.
+
+    Raises `ValueError` for anything but an absolute http or https URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        raise ValueError(f"Not an absolute http(s) URL: {url!r}")
+    host = parts.hostname.rstrip(".")
+    try:
+        host = host.encode("idna").decode("ascii")
+    except UnicodeError:
+        raise ValueError(f"Invalid host in URL: {url!r}") from None
+    if ":" in host:
+        host = f"[{host}]"
+    port = parts.port
+    netloc = host if port is None or port == _DEFAULT_PORTS[scheme] else f"{host}:{port}"
+    if parts.username is not None:
+        credentials = parts.username if parts.password is None else f"{parts.username}:{parts.password}"
+        netloc = f"{credentials}@{netloc}"
+    path = _normalize_escapes(parts.path) or "/"
+    return urlunsplit((scheme, netloc, path, _normalize_escapes(parts.query), parts.fragment))
+
+
+__all__ = ["normalize_url"]
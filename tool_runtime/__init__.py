@@ -0,0 +1,6 @@
+"""
+Runtime support shared by the tool packages: credential fingerprints, client-side rate limiting and retries,
+and the OAuth access token cache.
+
+Kept outside of any one tool so that each tool package can be installed and loaded on its own.
+"""
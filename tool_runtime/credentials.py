@@ -0,0 +1,21 @@
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def _fingerprint(authorization: str) -> str:
+    return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+
+def credential_fingerprint(headers: dict) -> str:
+    """
+    Return a stable key identifying the credential carried by `headers`.
+
+    The key is a truncated SHA-256 of the `Authorization` header, so raw tokens are never used as
+    dictionary keys or written anywhere by the caches and limiters that are scoped per credential.
+    """
+    authorization = headers.get("Authorization") or headers.get("authorization") or ""
+    return _fingerprint(authorization)
+
+
+__all__ = ["credential_fingerprint"]
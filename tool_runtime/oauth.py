@@ -0,0 +1,381 @@
+"""
+Shared cache of the access tokens of OAuth connections.
+
+A connection authorised through OAuth holds a short-lived access token and a refresh token.
+`TokenCache.authorised_headers` returns the headers an action sends: the connection's headers with the
+current access token, renewed through the token endpoint `refresh_margin` seconds before it expires, so a
+burst of calls never goes out with an expired token. Authorisation data without a `refresh_token` (access
+tokens renewed by the platform) is used as is, at the cost of a dictionary lookup:
+
+    {"headers": {"Authorization": "Bearer ..."}, "refresh_token": "...", "expires_at": 1767225599}
+
+`expires_at` is the expiry of the access token in the headers, as epoch seconds or an ISO 8601 timestamp.
+The OAuth client may be given as `client_id` and `client_secret` members; by default it is the one the
+cache is configured with.
+
+Tokens are keyed by a fingerprint of the refresh token the connection was given, and at most one refresh
+per connection is in flight in the process: once the token is due for renewal, the first caller renews
+it while the others keep using the current token, and only callers holding an expired token wait. With
+a `path`, tokens are also kept in a SQLite database shared by every worker on the host. A worker renewing
+a token first takes the connection's lease in a short transaction, calls the token endpoint outside of
+any transaction and stores the new token only if the stored version is still the one it leased, so the
+other workers keep reading tokens meanwhile and wait for, or keep using the current token until, the new
+one instead of asking the token endpoint again. A lease runs out after `timeout` plus `LEASE_GRACE`
+seconds, so a worker dying mid-refresh does not block the connection. The database holds live credentials
+and is created readable by its owner only.
+
+Each tool authorised through OAuth subclasses `TokenCache` for its token endpoint and transport, and keeps
+its own process-wide cache (see `vercel.oauth` and `tinyurl.oauth`).
+"""
+
+import abc
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+# An access token expiring within this many seconds is treated as expired: callers wait for its renewal.
+EXPIRY_SKEW = 10.0
+
+# Seconds a refresh lease outlives the token endpoint timeout of the worker holding it.
+LEASE_GRACE = 5.0
+
+# Seconds between two checks for the token another worker is renewing.
+_LEASE_POLL = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS oauth_tokens (
+    key TEXT PRIMARY KEY,
+    access_token TEXT NOT NULL,
+    refresh_token TEXT,
+    expires_at REAL,
+    updated_at REAL NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS oauth_refresh_leases (
+    key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _fingerprint(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode()).hexdigest()[:32]
+
+
+def _expiry(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _access_token(headers: dict) -> str:
+    authorization = headers.get("Authorization") or headers.get("authorization") or ""
+    return authorization.partition(" ")[2] or authorization
+
+
+@dataclass
+class OAuthToken:
+    access_token: str
+    refresh_token: str = None
+    expires_at: float = None
+
+    @property
+    def authorization(self) -> str:
+        return f"Bearer {self.access_token}"
+
+    def expires_within(self, seconds: float, now: float = None) -> bool:
+        """Whether the token expires within `seconds`; a token of unknown expiry never does."""
+        return self.expires_at is not None and self.expires_at - (time.time() if now is None else now) <= seconds
+
+    @classmethod
+    def from_response(cls, body: dict, refresh_token: str) -> "OAuthToken":
+        """Build the token of a token endpoint response, keeping `refresh_token` unless the response rotates it."""
+        expires_in = body.get("expires_in")
+        return cls(
+            access_token=body["access_token"],
+            refresh_token=body.get("refresh_token") or refresh_token,
+            expires_at=time.time() + float(expires_in) if expires_in else None,
+        )
+
+
+class TokenCache(abc.ABC):
+    """
+    Access tokens of OAuth connections, renewed ahead of their expiry, see the module documentation.
+
+    Each tool subclasses it for its token endpoint: `_client_env` is the prefix of the environment variables
+    holding the default OAuth client, and `_request_token` posts to the endpoint through the tool's transport.
+
+    Args:
+        token_url: The OAuth token endpoint.
+        client_id: The OAuth client refreshing the tokens, unless the authorisation data names one.
+        client_secret: The secret of `client_id`.
+        refresh_margin: Seconds before expiry an access token is renewed.
+        path: The SQLite database tokens are shared through, `None` to keep them in this process only.
+        max_entries: The maximum number of connections kept in memory.
+        timeout: Seconds to wait for the token endpoint.
+    """
+
+    _client_env: str = None
+
+    def __init__(
+        self,
+        token_url: str,
+        client_id: str = None,
+        client_secret: str = None,
+        refresh_margin: float = 300.0,
+        path=None,
+        max_entries: int = 4096,
+        timeout: float = 10.0,
+    ):
+        self.token_url = token_url
+        if self._client_env is not None:
+            client_id = client_id if client_id is not None else os.environ.get(f"{self._client_env}_CLIENT_ID")
+            client_secret = client_secret if client_secret is not None else os.environ.get(f"{self._client_env}_CLIENT_SECRET")
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self.path = path
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self._tokens = OrderedDict()
+        self._refresh_locks = {}
+        self._lock = threading.Lock()
+        self._store_lock = threading.Lock()
+        self._connection = None
+        self._owner = f"{os.getpid()}:{uuid.uuid4().hex}"
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            path = Path(self.path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.close(os.open(path, os.O_CREAT | os.O_RDWR, 0o600))
+            connection = sqlite3.connect(str(path), timeout=30.0, check_same_thread=False, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def _transaction(self):
+        # The store lock only guards the shared connection, and is never held across a token request.
+        with self._store_lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _load(self, key: str):
+        with self._store_lock:
+            row = self._connect().execute("SELECT access_token, refresh_token, expires_at FROM oauth_tokens WHERE key = ?", (key,)).fetchone()
+        return OAuthToken(*row) if row is not None else None
+
+    def _remember(self, key: str, token: OAuthToken) -> None:
+        with self._lock:
+            self._tokens[key] = token
+            self._tokens.move_to_end(key)
+            if len(self._tokens) > self.max_entries:
+                evicted, _ = self._tokens.popitem(last=False)
+                self._refresh_locks.pop(evicted, None)
+
+    def _refresh_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._refresh_locks.get(key)
+            if lock is None:
+                lock = self._refresh_locks[key] = threading.Lock()
+            return lock
+
+    def _current(self, key: str, authorisation_data: dict) -> OAuthToken:
+        # The token known for the connection, or the one it was given when that one is newer, e.g. renewed by the platform.
+        token = self._tokens.get(key)
+        if token is None and self.path is not None:
+            token = self._load(key)
+        given_expiry = _expiry(authorisation_data.get("expires_at"))
+        if token is None or (given_expiry is not None and token.expires_at is not None and given_expiry > token.expires_at):
+            token = OAuthToken(_access_token(authorisation_data["headers"]), authorisation_data["refresh_token"], given_expiry)
+            self._remember(key, token)
+        elif key not in self._tokens:
+            self._remember(key, token)
+        return token
+
+    @abc.abstractmethod
+    def _request_token(self, data: dict) -> dict:
+        """Post `data` to the token endpoint and return the decoded response, raising for error statuses."""
+
+    def _exchange(self, token: OAuthToken, authorisation_data: dict) -> OAuthToken:
+        body = self._request_token(
+            {
+                "grant_type": "refresh_token",
+                "refresh_token": token.refresh_token,
+                "client_id": authorisation_data.get("client_id") or self.client_id,
+                "client_secret": authorisation_data.get("client_secret") or self.client_secret,
+            }
+        )
+        return OAuthToken.from_response(body, token.refresh_token)
+
+    def _claim(self, key: str) -> tuple:
+        """
+        Return `(stored, version, claimed)`: the stored token and its version, and whether this cache now
+        holds the connection's refresh lease. The lease is not taken when the stored token is not due for
+        renewal, or while another worker holds it.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute("SELECT access_token, refresh_token, expires_at, version FROM oauth_tokens WHERE key = ?", (key,)).fetchone()
+            stored, version = (OAuthToken(*row[:3]), row[3]) if row is not None else (None, 0)
+            if stored is not None and not stored.expires_within(self.refresh_margin, now):
+                return stored, version, False
+            lease = connection.execute("SELECT owner, expires_at FROM oauth_refresh_leases WHERE key = ?", (key,)).fetchone()
+            if lease is not None and lease[0] != self._owner and lease[1] > now:
+                return stored, version, False
+            connection.execute(
+                "INSERT OR REPLACE INTO oauth_refresh_leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                (key, self._owner, now + self.timeout + LEASE_GRACE),
+            )
+        return stored, version, True
+
+    def _store(self, key: str, token: OAuthToken, version: int) -> OAuthToken:
+        """Store `token` unless the stored one changed since `version` was claimed, and release the lease. Returns the token kept."""
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM oauth_refresh_leases WHERE key = ? AND owner = ?", (key, self._owner))
+            row = connection.execute("SELECT access_token, refresh_token, expires_at, version FROM oauth_tokens WHERE key = ?", (key,)).fetchone()
+            if row is not None and row[3] != version:
+                # Another worker stored a token after this one's lease ran out; the first one stored wins.
+                return OAuthToken(*row[:3])
+            connection.execute(
+                "INSERT OR REPLACE INTO oauth_tokens (key, access_token, refresh_token, expires_at, updated_at, version) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, token.access_token, token.refresh_token, token.expires_at, time.time(), version + 1),
+            )
+        return token
+
+    def _release(self, key: str) -> None:
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM oauth_refresh_leases WHERE key = ? AND owner = ?", (key, self._owner))
+
+    def _refresh_shared(self, key: str, token: OAuthToken, authorisation_data: dict) -> OAuthToken:
+        while True:
+            stored, version, claimed = self._claim(key)
+            if stored is not None and not stored.expires_within(self.refresh_margin):
+                return stored
+            if claimed:
+                break
+            # Another worker is renewing the token: keep using the current one while it is good, else wait for the new one.
+            if not token.expires_within(EXPIRY_SKEW):
+                return token
+            time.sleep(_LEASE_POLL)
+        try:
+            renewed = self._exchange(stored or token, authorisation_data)
+        except BaseException:
+            self._release(key)
+            raise
+        return self._store(key, renewed, version)
+
+    def _refresh(self, key: str, authorisation_data: dict) -> OAuthToken:
+        token = self._current(key, authorisation_data)
+        if not token.expires_within(self.refresh_margin):
+            return token
+        if self.path is None:
+            token = self._exchange(token, authorisation_data)
+        else:
+            token = self._refresh_shared(key, token, authorisation_data)
+        self._remember(key, token)
+        return token
+
+    def token(self, authorisation_data: dict) -> OAuthToken:
+        """Return the current access token of the connection, renewing it first when it is due."""
+        key = _fingerprint(authorisation_data["refresh_token"])
+        token = self._current(key, authorisation_data)
+        now = time.time()
+        if not token.expires_within(self.refresh_margin, now):
+            return token
+        lock = self._refresh_lock(key)
+        expired = token.expires_within(EXPIRY_SKEW, now)
+        if expired:
+            lock.acquire()
+        elif not lock.acquire(blocking=False):
+            # Another thread is renewing it; the current token is still good meanwhile.
+            return token
+        try:
+            return self._refresh(key, authorisation_data)
+        except Exception:
+            if expired:
+                raise
+            return token
+        finally:
+            lock.release()
+
+    def headers(self, authorisation_data: dict) -> dict:
+        """Return the connection's headers carrying its current access token."""
+        return _with_token(authorisation_data["headers"], self.token(authorisation_data))
+
+    async def headers_async(self, authorisation_data: dict) -> dict:
+        """Like `headers`; a renewal runs in a worker thread so the event loop is not blocked."""
+        token = self._current(_fingerprint(authorisation_data["refresh_token"]), authorisation_data)
+        if not token.expires_within(self.refresh_margin):
+            return _with_token(authorisation_data["headers"], token)
+        import asyncio
+
+        return await asyncio.to_thread(self.headers, authorisation_data)
+
+    def authorised_headers(self, authorisation_data: dict) -> dict:
+        """
+        Return the headers to send for `authorisation_data`, with a current access token for OAuth connections.
+
+        When an expired token cannot be renewed, the connection's headers are returned unchanged and the
+        request fails with the API's authentication error, as it would without the cache.
+        """
+        if not authorisation_data.get("refresh_token"):
+            return authorisation_data["headers"]
+        try:
+            return self.headers(authorisation_data)
+        except Exception:
+            return authorisation_data["headers"]
+
+    async def authorised_headers_async(self, authorisation_data: dict) -> dict:
+        """Asyncio counterpart of `authorised_headers`."""
+        if not authorisation_data.get("refresh_token"):
+            return authorisation_data["headers"]
+        try:
+            return await self.headers_async(authorisation_data)
+        except Exception:
+            return authorisation_data["headers"]
+
+    def forget(self, authorisation_data: dict) -> None:
+        """Drop the connection's token from memory, e.g. once the connection was revoked."""
+        with self._lock:
+            self._tokens.pop(_fingerprint(authorisation_data["refresh_token"]), None)
+
+    def close(self) -> None:
+        with self._store_lock:
+            connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+def _with_token(headers: dict, token: OAuthToken) -> dict:
+    authorization = token.authorization
+    if headers.get("Authorization") == authorization:
+        return headers
+    headers = {name: value for name, value in headers.items() if name.lower() != "authorization"}
+    headers["Authorization"] = authorization
+    return headers
+
+
+__all__ = ["EXPIRY_SKEW", "LEASE_GRACE", "OAuthToken", "TokenCache"]
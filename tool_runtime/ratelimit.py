@@ -0,0 +1,266 @@
+import random
+import threading
+import time
+from collections import OrderedDict
+
+
+class RateLimitError(Exception):
+    """Raised instead of waiting when a request could only be sent after more than the allowed wait."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit exhausted, retry in {retry_after:.0f}s.")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Client-side token bucket for one credential and rate-limit group.
+
+    Tokens refill at `rate` per second up to `capacity`. Each request reserves one token and is told how
+    long to wait before sending, so concurrent callers queue up behind each other instead of all being
+    released at once. The bucket is kept in step with the API through `update`, which reads the
+    `X-RateLimit-*` headers of every response: when the server reports fewer remaining requests than the
+    bucket holds, the bucket shrinks to match and the remaining budget is spread evenly until the reset
+    time, and when the budget is exhausted every reservation waits for the reset. A reservation that
+    would wait longer than its `max_wait` is refused with a `RateLimitError` instead.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paced_rate = None
+        self._paced_until = 0.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> float:
+        rate = self._paced_rate if now < self._paced_until else self.rate
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * rate)
+        self._updated = now
+        return rate
+
+    def reserve(self, max_wait: float = None) -> float:
+        """
+        Take one token and return the number of seconds to wait before using it.
+
+        Raises `RateLimitError`, leaving the bucket untouched, when the wait would exceed `max_wait`.
+        """
+        with self._lock:
+            now = time.monotonic()
+            rate = self._refill(now)
+            wait = max((1 - self.tokens) / rate if self.tokens < 1 else 0.0, self._blocked_until - now)
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitError(wait)
+            self.tokens -= 1
+            return wait
+
+    def acquire(self, max_wait: float = None) -> float:
+        """Wait for a token, returning the number of seconds waited. See `reserve` for `max_wait`."""
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, max_wait: float = None) -> float:
+        import asyncio
+
+        delay = self.reserve(max_wait)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def update(self, headers) -> None:
+        """Synchronise the bucket with the `X-RateLimit-Remaining`/`X-RateLimit-Reset` response headers."""
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens = min(self.tokens, remaining)
+            if reset is None:
+                return
+            window = reset - time.time()
+            if window <= 0:
+                return
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, now + window)
+            else:
+                self._paced_rate = min(self.rate, remaining / window)
+                self._paced_until = now + window
+
+
+class RateLimiter:
+    """
+    Keeps one `TokenBucket` per credential and rate-limit group, evicting the least recently used buckets
+    beyond `max_buckets`.
+
+    APIs such as Vercel's limit each endpoint separately, so the group is then the endpoint (see
+    `VercelTransport.request`): exhausting the budget of one endpoint, e.g. project creation, does not hold
+    back requests to others.
+
+    Args:
+        rate: Requests per second each credential may send to a group while the server has not said otherwise.
+        capacity: The burst size of each bucket.
+        max_buckets: The maximum number of buckets kept at once.
+    """
+
+    def __init__(self, rate: float = 20.0, capacity: int = 40, max_buckets: int = 4096):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_buckets = max_buckets
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bucket(self, credential: str, group: str = None) -> TokenBucket:
+        key = (credential, group)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+                if len(self._buckets) > self.max_buckets:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried and how long to back off in between.
+
+    Only idempotent requests are retried: GET, HEAD, OPTIONS, PUT and DELETE by default, and any other
+    method when the caller marks the request as idempotent (e.g. a PATCH that sets absolute values).
+    Requests are retried on `retry_statuses` and on connection errors, with full-jitter exponential
+    backoff, and every request is retried on `always_retry_statuses`, for APIs that guarantee such a
+    response was not processed. On 429 the server-provided `Retry-After` or `X-RateLimit-Reset` takes precedence.
+
+    `run` and `run_async` drive the whole loop for a transport: pacing each attempt through a `TokenBucket`,
+    feeding it the rate-limit headers of every response and sleeping between retries.
+
+    Args:
+        max_retries: The maximum number of retries per request.
+        backoff_base: The backoff ceiling, in seconds, of the first retry; it doubles on every attempt.
+        backoff_max: The maximum backoff, in seconds.
+        retry_statuses: The HTTP status codes that are retried.
+        always_retry_statuses: The HTTP status codes retried whatever the method.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 20.0,
+        retry_statuses: frozenset = frozenset({429, 500, 502, 503, 504}),
+        always_retry_statuses: frozenset = frozenset(),
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.always_retry_statuses = always_retry_statuses
+
+    def is_retryable(self, method: str, idempotent: bool = None) -> bool:
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def should_retry(self, attempt: int, method: str, idempotent: bool = None, status: int = None) -> bool:
+        """Whether attempt number `attempt` (from 0) is retried, after a response with `status` or a connection error when `None`."""
+        if attempt >= self.max_retries:
+            return False
+        if status in self.always_retry_statuses:
+            return True
+        if status is not None and status not in self.retry_statuses:
+            return False
+        return self.is_retryable(method, idempotent)
+
+    def backoff(self, attempt: int, headers=None) -> float:
+        if headers is not None:
+            retry_after = _header_number(headers, "Retry-After")
+            if retry_after is not None:
+                return min(max(retry_after, 0.0), self.backoff_max)
+            if _header_number(headers, "X-RateLimit-Remaining") == 0:
+                reset = _header_number(headers, "X-RateLimit-Reset")
+                if reset is not None:
+                    return min(max(reset - time.time(), 0.0), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+    def run(self, send, bucket: TokenBucket, method: str, idempotent: bool = None, errors: tuple = (), observer=None):
+        """
+        Call `send()` until it returns a response that is not retried, and return that response.
+
+        Each attempt first takes a token from `bucket`; a wait longer than `backoff_max` raises `RateLimitError`.
+        The exceptions in `errors` (connection errors) are retried like responses. `observer`, when given, is
+        told about each attempt through `waited(seconds)`, `received(response)` and `retried(attempt, delay)`.
+        """
+        attempt = 0
+        while True:
+            waited = bucket.acquire(self.backoff_max)
+            if observer is not None:
+                observer.waited(waited)
+            try:
+                response = send()
+            except errors:
+                if not self.should_retry(attempt, method, idempotent):
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                bucket.update(response.headers)
+                if observer is not None:
+                    observer.received(response)
+                if not self.should_retry(attempt, method, idempotent, response.status_code):
+                    return response
+                delay = self.backoff(attempt, response.headers)
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+            if observer is not None:
+                observer.retried(attempt, delay)
+
+    async def run_async(self, send, bucket: TokenBucket, method: str, idempotent: bool = None, errors: tuple = (), observer=None):
+        """Asyncio counterpart of `run`: `send` is a coroutine function and responses are closed with `aclose`."""
+        import asyncio
+
+        attempt = 0
+        while True:
+            waited = await bucket.acquire_async(self.backoff_max)
+            if observer is not None:
+                observer.waited(waited)
+            try:
+                response = await send()
+            except errors:
+                if not self.should_retry(attempt, method, idempotent):
+                    raise
+                delay = self.backoff(attempt)
+            else:
+                bucket.update(response.headers)
+                if observer is not None:
+                    observer.received(response)
+                if not self.should_retry(attempt, method, idempotent, response.status_code):
+                    return response
+                delay = self.backoff(attempt, response.headers)
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+            if observer is not None:
+                observer.retried(attempt, delay)
+
+
+def _header_number(headers, name: str):
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+__all__ = ["RateLimitError", "RateLimiter", "RetryPolicy", "TokenBucket"]
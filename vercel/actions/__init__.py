@@ -1,10 +1,37 @@
-from .add_domain_to_a_project import AddDomainAction
-from .create_a_project import CreateProjectAction
-from .create_env_vars import CreateEnvVarAction
-from .delete_a_project import DeleteProjectAction
-from .edit_env_vars import EditEnvVarAction
-from .get_env_vars_of_a_project import GetEnvVarsAction
-from .get_project_by_id_or_name import FindProjectAction
-from .pause_a_project import PauseProjectAction
-from .unpause_a_project import UnpauseProjectAction
-from .update_a_project import UpdateProjectAction
+import importlib
+
+# Action classes are imported on first access so that loading the tool only builds the request and
+# response models of the actions that are actually used.
+_ACTION_MODULES = {
+    "AddDomainAction": "add_domain_to_a_project",
+    "BulkDeleteProjectsAction": "bulk_projects",
+    "BulkPauseProjectsAction": "bulk_projects",
+    "BulkUnpauseProjectsAction": "bulk_projects",
+    "CreateProjectAction": "create_a_project",
+    "CreateEnvVarAction": "create_env_vars",
+    "DeleteProjectAction": "delete_a_project",
+    "EditEnvVarAction": "edit_env_vars",
+    "GetEnvVarsAction": "get_env_vars_of_a_project",
+    "FindProjectAction": "get_project_by_id_or_name",
+    "ListProjectsAction": "list_projects",
+    "PauseProjectAction": "pause_a_project",
+    "ReconcileEnvVarsAction": "reconcile_env_vars",
+    "UnpauseProjectAction": "unpause_a_project",
+    "UpdateProjectAction": "update_a_project",
+}
+
+
+def __getattr__(name):
+    module = _ACTION_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    action = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = action
+    return action
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_ACTION_MODULES))
+
+
+__all__ = list(_ACTION_MODULES)
@@ -1,6 +1,6 @@
-import requests
 from pydantic import BaseModel, Field
-from shared.composio_tools.lib import Action
+
+from ..engine import ActionSpec, SpecAction
 
 
 class AddDomainRequest(BaseModel):
@@ -42,7 +42,7 @@ class AddDomainResponse(BaseModel):
     )
 
 
-class AddDomainAction(Action):
+class AddDomainAction(SpecAction):
     """
     This action adds a domain to a specific Vercel project identified by the project ID. The response will include the details of the added domain as returned by the Vercel API.
 
@@ -60,44 +60,9 @@ class AddDomainAction(Action):
     _response_schema = AddDomainResponse
     _tags = ["vercel", "domain"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: AddDomainRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id_or_name
-        domain_name = request.domain_name
-        data = {}
-        if request.gitBranch:
-            data["gitBranch"] = request.gitBranch
-        if request.redirect:
-            data["redirect"] = request.redirect
-        if request.redirectStatusCode:
-            data["redirectStatusCode"] = request.redirectStatusCode
-
-        data["name"] = domain_name
-        url = f"https://api.vercel.com/v10/projects/{project_id}/domains"
-
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="POST",
+        path="/v10/projects/{project_id_or_name}/domains",
+        body={"domain_name": "name", "gitBranch": "gitBranch", "redirect": "redirect", "redirectStatusCode": "redirectStatusCode"},
+        invalidates="project_id_or_name",
+    )
@@ -0,0 +1,324 @@
+from dataclasses import replace
+from functools import partial
+
+from pydantic import BaseModel, Field, model_validator
+
+from shared.composio_tools.lib import Action
+from tool_runtime.credentials import credential_fingerprint
+
+from ..batch import BatchExecutor, BatchItem
+from ..engine import SpecAction, run_action, run_action_async
+from ..project_index import get_project_index
+from .get_project_by_id_or_name import FindProjectAction, FindProjectRequest, FindProjectResponse
+from .list_projects import ListProjectsAction, ListProjectsRequest
+
+
+class BulkProjectsRequest(BaseModel):
+    projects: list[str] = Field(
+        default=None,
+        description="The IDs or names of the Vercel projects to act on. Example: ['prj_123', 'marketing-site'].",
+        examples=[["prj_123", "marketing-site"]],
+    )
+    search: str = Field(
+        default=None,
+        description="Act on the projects whose name contains this text, instead of or in addition to `projects`. Example: 'preview-'.",
+        examples=["preview-"],
+    )
+    repo_url: str = Field(
+        default=None,
+        description="Act on the projects linked to this git repository URL. Example: 'https://github.com/acme/web'.",
+        examples=["https://github.com/acme/web"],
+    )
+    max_projects: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="The maximum number of projects matched by `search`/`repo_url`. Example: 100.",
+        examples=[100],
+    )
+    concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=32,
+        description="The number of projects acted on concurrently. Requests are additionally paced by the Vercel rate limits. Example: 8.",
+        examples=[8],
+    )
+    dry_run: bool = Field(
+        default=False,
+        description="Whether to only resolve and return the matched projects, without acting on them. Example: true.",
+        examples=[True],
+    )
+
+    @model_validator(mode="after")
+    def _check_selection(self):
+        if not self.projects and self.search is None and self.repo_url is None:
+            raise ValueError("Provide `projects`, `search` or `repo_url`.")
+        return self
+
+
+class BulkDeleteProjectsRequest(BulkProjectsRequest):
+    dry_run: bool = Field(
+        default=None,
+        description="Whether to only resolve and return the matched projects, without deleting them. Defaults to true when `search` or `repo_url` is given and `confirm` is not. Example: true.",
+        examples=[True],
+    )
+    confirm: list[str] = Field(
+        default=None,
+        description="The IDs of the projects matched by `search`/`repo_url`, as returned in `confirm` by a dry run. Required to delete projects selected by a filter. Example: ['prj_123', 'prj_456'].",
+        examples=[["prj_123", "prj_456"]],
+    )
+
+
+class BulkProjectsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the operation succeeded for every matched project.",
+    )
+    response: dict = Field(
+        ...,
+        description="The per-project outcomes, in request order followed by the projects matched by the filter.",
+    )
+
+
+class _UncachedFindProjectAction(SpecAction):
+    """`FindProjectAction` reading past the response cache, for names that must resolve to the project they name now."""
+
+    _display_name = "Find Project (uncached)"
+    _request_schema = FindProjectRequest
+    _response_schema = FindProjectResponse
+    _tags = ["vercel", "project"]
+    _tool_name = "vercel"
+    _spec = replace(FindProjectAction._spec, cache=None, cache_aliases=())
+
+
+class _BulkProjectsAction(Action):
+    """
+    Base class of the bulk project actions: resolves the selected projects and runs the single-project
+    action `_single` on each of them through a `BatchExecutor`.
+    """
+
+    _request_schema = BulkProjectsRequest
+    _response_schema = BulkProjectsResponse
+    _tags = ["vercel", "project"]
+    _tool_name = "vercel"
+
+    _single: str = None
+    _id_field: str = "project_id"
+    _trust_index: bool = True
+    _lookup = "FindProjectAction"
+    _done: str = None
+
+    @property
+    def display_name(self) -> str:
+        return self._display_name
+
+    @property
+    def request_schema(self) -> BaseModel:
+        return self._request_schema
+
+    @property
+    def response_schema(self) -> BaseModel:
+        return self._response_schema
+
+    def _dry_run(self, request: BulkProjectsRequest) -> bool:
+        return request.dry_run
+
+    def _check_listed(self, request: BulkProjectsRequest, listed: list) -> None:
+        """Hook run on the projects matched by the filter before acting on them."""
+
+    def _selection(self, request: BulkProjectsRequest, headers: dict) -> tuple:
+        # Returns the targets `[{"project": ..., "id": ...}]` and the names that are not in the project index.
+        index, credential = get_project_index(), credential_fingerprint(headers)
+        targets, names = [], []
+        for project in dict.fromkeys(request.projects or ()):
+            project_id = index.resolve(credential, project)
+            if project_id is not None and (self._trust_index or project_id == project):
+                targets.append({"project": project, "id": project_id})
+            else:
+                targets.append({"project": project, "id": None})
+                names.append(project)
+        return targets, names
+
+    def _listing(self, request: BulkProjectsRequest):
+        if request.search is None and request.repo_url is None:
+            return None
+        filters = {"search": request.search, "repo_url": request.repo_url}
+        return ListProjectsRequest(limit=100, fields=["id", "name"], **{k: v for k, v in filters.items() if v is not None})
+
+    def _lookups(self, names: list) -> list:
+        return [BatchItem(self._lookup, {"project_id_or_name": name, "fields": ["id"]}) for name in names]
+
+    def _apply_lookups(self, targets: list, names: list, results: list) -> None:
+        by_name = {name: result for name, result in zip(names, results)}
+        for target in targets:
+            result = by_name.get(target["project"])
+            if result is None:
+                continue
+            if result.success:
+                target["id"] = result.response["id"]
+            else:
+                target.update(status="failed", error=result.error)
+
+    def _unique(self, targets: list) -> list:
+        # A project given both by name and by ID is only acted on once, under its first mention.
+        seen = set()
+        unique = []
+        for target in targets:
+            if target["id"] is None or target["id"] not in seen:
+                seen.add(target["id"])
+                unique.append(target)
+        return unique
+
+    def _add_listed(self, targets: list, projects: list) -> None:
+        known = {target["id"] for target in targets if target["id"]}
+        for project in projects:
+            if project["id"] not in known:
+                known.add(project["id"])
+                targets.append({"project": project.get("name", project["id"]), "id": project["id"]})
+
+    def _items(self, targets: list) -> list:
+        return [BatchItem(self._single, {self._id_field: target["id"]}) for target in targets if "status" not in target]
+
+    def _report(self, dry_run: bool, targets: list, results: list) -> dict:
+        results = iter(results)
+        for target in targets:
+            if "status" in target:
+                continue
+            if dry_run:
+                target["status"] = "matched"
+                continue
+            result = next(results)
+            if result.success:
+                target["status"] = self._done
+            else:
+                target.update(status="failed", error=result.error)
+        counts = {}
+        for target in targets:
+            counts[target["status"]] = counts.get(target["status"], 0) + 1
+        return {"dry_run": dry_run, "counts": counts, "projects": targets}
+
+    def _outcome(self, report: dict) -> tuple:
+        return all(target["status"] != "failed" for target in report["projects"]), report
+
+    def _run(self, authorisation_data: dict, request: BulkProjectsRequest, headers: dict, span) -> tuple:
+        dry_run = self._dry_run(request)
+        executor = BatchExecutor(max_concurrency=request.concurrency, max_per_credential=request.concurrency)
+        targets, names = self._selection(request, headers)
+        if names:
+            self._apply_lookups(targets, names, executor.run(self._lookups(names), authorisation_data))
+        targets = self._unique(targets)
+        listing = self._listing(request)
+        if listing is not None:
+            pages = ListProjectsAction().iter_pages(listing, authorisation_data, request.max_projects, span)
+            listed = [project for page, _ in pages for project in page]
+            if not dry_run:
+                self._check_listed(request, listed)
+            self._add_listed(targets, listed)
+        results = [] if dry_run else executor.run(self._items(targets), authorisation_data)
+        return self._outcome(self._report(dry_run, targets, results))
+
+    async def _run_async(self, authorisation_data: dict, request: BulkProjectsRequest, headers: dict, span) -> tuple:
+        dry_run = self._dry_run(request)
+        executor = BatchExecutor(max_concurrency=request.concurrency, max_per_credential=request.concurrency)
+        targets, names = self._selection(request, headers)
+        if names:
+            self._apply_lookups(targets, names, await executor.run_async(self._lookups(names), authorisation_data))
+        targets = self._unique(targets)
+        listing = self._listing(request)
+        if listing is not None:
+            listed = []
+            async for page, _ in ListProjectsAction().aiter_pages(listing, authorisation_data, request.max_projects, span):
+                listed.extend(page)
+            if not dry_run:
+                self._check_listed(request, listed)
+            self._add_listed(targets, listed)
+        results = [] if dry_run else await executor.run_async(self._items(targets), authorisation_data)
+        return self._outcome(self._report(dry_run, targets, results))
+
+    def execute(self, request: BulkProjectsRequest, authorisation_data: dict) -> dict:
+        return run_action(type(self).__name__, self._request_schema, request, authorisation_data, partial(self._run, authorisation_data))
+
+    async def execute_async(self, request: BulkProjectsRequest, authorisation_data: dict) -> dict:
+        return await run_action_async(type(self).__name__, self._request_schema, request, authorisation_data, partial(self._run_async, authorisation_data))
+
+
+class BulkPauseProjectsAction(_BulkProjectsAction):
+    """
+    This action pauses several Vercel projects at once, selected by ID or name and/or by a name or repository filter. The projects are paused concurrently, within the Vercel rate limits, and the response will include the outcome for each project.
+
+    Edge Cases:
+    - If none of projects, search or repo_url are provided in the request, the action will raise a validation error.
+    - Projects given by name are resolved through the project index (see `vercel.project_index`) or looked up first; a name that does not match a project is reported as failed and does not stop the others.
+    - `success` is `true` only if every matched project was paused. With `dry_run`, the matched projects are returned without being paused.
+
+    Use Cases:
+    - Pausing all preview projects during an incident or to save costs overnight.
+    - Pausing every project deployed from a given repository.
+    """
+
+    _display_name = "Bulk Pause Projects"
+    _single = "PauseProjectAction"
+    _done = "paused"
+
+
+class BulkUnpauseProjectsAction(_BulkProjectsAction):
+    """
+    This action unpauses several Vercel projects at once, selected by ID or name and/or by a name or repository filter. The projects are unpaused concurrently, within the Vercel rate limits, and the response will include the outcome for each project.
+
+    Edge Cases:
+    - If none of projects, search or repo_url are provided in the request, the action will raise a validation error.
+    - Projects given by name are resolved through the project index (see `vercel.project_index`) or looked up first; a name that does not match a project is reported as failed and does not stop the others.
+    - `success` is `true` only if every matched project was unpaused. With `dry_run`, the matched projects are returned without being unpaused.
+
+    Use Cases:
+    - Resuming the projects paused by a previous bulk pause.
+    - Unpausing every project deployed from a given repository.
+    """
+
+    _display_name = "Bulk Unpause Projects"
+    _single = "UnpauseProjectAction"
+    _done = "unpaused"
+
+
+class BulkDeleteProjectsAction(_BulkProjectsAction):
+    """
+    This action deletes several Vercel projects at once, selected by ID or name and/or by a name or repository filter. The projects are deleted concurrently, within the Vercel rate limits, and the response will include the outcome for each project.
+
+    Edge Cases:
+    - If none of projects, search or repo_url are provided in the request, the action will raise a validation error.
+    - Deleting a project is irreversible. Projects matched by `search` or `repo_url` are only deleted when `confirm` lists their IDs: without it, the action defaults to a dry run whose response contains the `confirm` list to send back. If the filter matches a project that is not in `confirm`, nothing is deleted. At most `max_projects` projects are matched by a filter.
+    - Projects given by name are looked up to resolve their ID first, never read from the project index or the response cache, so a project given both by name and by ID is deleted once.
+    - `success` is `true` only if every matched project was deleted. A project that cannot be found is reported as failed and does not stop the others.
+
+    Use Cases:
+    - Cleaning up stale preview projects.
+    - Removing every project created from a given repository.
+    """
+
+    _display_name = "Bulk Delete Projects"
+    _request_schema = BulkDeleteProjectsRequest
+    _single = "DeleteProjectAction"
+    _id_field = "project_id_or_name"
+    # The project index and the response cache may map a name to a project renamed or recreated since, so
+    # names are looked up again, past the cache, before deleting.
+    _trust_index = False
+    _lookup = _UncachedFindProjectAction
+    _done = "deleted"
+
+    def _dry_run(self, request: BulkDeleteProjectsRequest) -> bool:
+        if request.dry_run is not None:
+            return request.dry_run
+        return self._listing(request) is not None and request.confirm is None
+
+    def _check_listed(self, request: BulkDeleteProjectsRequest, listed: list) -> None:
+        if request.confirm is None:
+            raise ValueError("Deleting the projects matched by `search` or `repo_url` requires `confirm`: run a dry run first and pass the IDs it returns.")
+        unconfirmed = [project["id"] for project in listed if project["id"] not in request.confirm]
+        if unconfirmed:
+            raise ValueError(f"The filter matches projects that are not in `confirm`, nothing was deleted: {', '.join(unconfirmed)}.")
+
+    def _report(self, dry_run: bool, targets: list, results: list) -> dict:
+        report = super()._report(dry_run, targets, results)
+        if dry_run:
+            report["confirm"] = [target["id"] for target in targets if target.get("status") == "matched"]
+        return report
@@ -1,10 +1,10 @@
 import json
 import os
 
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, SpecAction
+from .frameworks import FRAMEWORK_EXAMPLES
 
 
 class CreateProjectRequest(BaseModel):
@@ -36,51 +36,7 @@ class CreateProjectRequest(BaseModel):
     framework: str = Field(
         default=None,
         description="The framework of the project",
-        examples=[
-            "blitzjs",
-            "nextjs",
-            "gatsby",
-            "remix",
-            "astro",
-            "hexo",
-            "eleventy",
-            "docusaurus-2",
-            "docusaurus",
-            "preact",
-            "solidstart-1",
-            "solidstart",
-            "dojo",
-            "ember",
-            "vue",
-            "scully",
-            "ionic-angular",
-            "angular",
-            "polymer",
-            "svelte",
-            "sveltekit",
-            "sveltekit-1",
-            "ionic-react",
-            "create-react-app",
-            "gridsome",
-            "umijs",
-            "sapper",
-            "saber",
-            "stencil",
-            "nuxtjs",
-            "redwoodjs",
-            "hugo",
-            "jekyll",
-            "brunch",
-            "middleman",
-            "zola",
-            "hydrogen",
-            "vite",
-            "vitepress",
-            "vuepress",
-            "parcel",
-            "sanity",
-            "storybook",
-        ],
+        examples=FRAMEWORK_EXAMPLES,
     )
     # gitRepository should be an object with repo name and type
     gitRepositoryName: str = Field(
@@ -127,7 +83,28 @@ class CreateProjectResponse(BaseModel):
     response: str = Field(..., description="The response of the project creation")
 
 
-class CreateProjectAction(Action):
+def _project_body(request: CreateProjectRequest) -> dict:
+    return {
+        "name": request.name,
+        "description": request.description,
+        "buildCommand": request.buildCommand,
+        "commandForIgnoringBuildStep": request.commandForIgnoringBuildStep,
+        "devCommand": request.devCommand,
+        "framework": request.framework,
+        "gitRepository": {
+            "name": request.gitRepositoryName,
+            "type": request.gitRepositoryType,
+        },
+        "installCommand": request.installCommand,
+        "outputDirectory": request.outputDirectory,
+        "publicSource": request.publicSource,
+        "rootDirectory": request.rootDirectory,
+        "serverlessFunctionRegion": request.serverlessFunctionRegion,
+        # "environmentVariables": request.environmentVariables
+    }
+
+
+class CreateProjectAction(SpecAction):
     """
     A class representing an action to create a project.
 
@@ -149,53 +126,9 @@ class CreateProjectAction(Action):
     _response_schema = CreateProjectResponse
     _tags = ["vercel", "project"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, authorisation_data: dict, request: CreateProjectRequest) -> dict:
-        token = authorisation_data["headers"]["Authorization"].split(" ")[1]
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-
-        url = "https://api.vercel.com/v12/projects"
-        data = {
-            "name": request.name,
-            "description": request.description,
-            "buildCommand": request.buildCommand,
-            "commandForIgnoringBuildStep": request.commandForIgnoringBuildStep,
-            "devCommand": request.devCommand,
-            "framework": request.framework,
-            "gitRepository": {
-                "name": request.gitRepositoryName,
-                "type": request.gitRepositoryType,
-            },
-            "installCommand": request.installCommand,
-            "outputDirectory": request.outputDirectory,
-            "publicSource": request.publicSource,
-            "rootDirectory": request.rootDirectory,
-            "serverlessFunctionRegion": request.serverlessFunctionRegion,
-            # "environmentVariables": request.environmentVariables
-        }
-
-        try:
-            response = requests.post(url, headers=headers, data=json.dumps(data))
-            response.raise_for_status()
-            response_data["success"] = True
-            response_data["response"] = response.json()
-            execution_details["executed"] = True
-
-        except Exception as error:
-            response_data["response"] = str(error)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="POST",
+        path="/v12/projects",
+        build_body=_project_body,
+        projects=".",
+    )
@@ -1,10 +1,40 @@
 import json
 import os
 
-import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, CompiledSpec, SpecAction
+
+# The number of environment variables sent in a single bulk request.
+ENV_VARS_PER_REQUEST = 100
+
+
+class EnvVar(BaseModel):
+    key: str = Field(
+        ...,
+        description="The key of the environment variable. Example: 'API_KEY'.",
+        examples=["API_KEY"],
+    )
+    value: str = Field(
+        ...,
+        description="The value of the environment variable. Example: '12345'.",
+        examples=["12345"],
+    )
+    type_of_env: str = Field(
+        ...,
+        description="The type of environment variable. Example: 'plain'.",
+        examples=["plain", "encrypted", "secret", "system", "sensitive"],
+    )
+    target: list[str] = Field(
+        default=None,
+        description="The target(s) for the environment variable. Example: ['production', 'development'].",
+        examples=[["production", "development", "preview"]],
+    )
+    comment: str = Field(
+        default=None,
+        description="A comment for the environment variable.",
+        examples=["Database connection string for production"],
+    )
 
 
 class CreateEnvVarRequest(BaseModel):
@@ -14,18 +44,18 @@ class CreateEnvVarRequest(BaseModel):
         examples=["project_123"],
     )
     key: str = Field(
-        ...,
-        description="The key of the environment variable to add. Example: 'API_KEY'.",
+        default=None,
+        description="The key of the environment variable to add. Required unless `env_vars` is provided. Example: 'API_KEY'.",
         examples=["API_KEY"],
     )
     value: str = Field(
-        ...,
-        description="The value of the environment variable to add. Example: '12345'.",
+        default=None,
+        description="The value of the environment variable to add. Required unless `env_vars` is provided. Example: '12345'.",
         examples=["12345"],
     )
     type_of_env: str = Field(
-        ...,
-        description="The type of environment variable to add. Example: 'plain'.",
+        default=None,
+        description="The type of environment variable to add. Required unless `env_vars` is provided. Example: 'plain'.",
         examples=["plain", "encrypted", "secret", "system", "sensitive"],
     )
     target: list[str] = Field(
@@ -38,6 +68,23 @@ class CreateEnvVarRequest(BaseModel):
         description="A comment for the environment variable.",
         examples=["Database connection string for production"],
     )
+    env_vars: list[EnvVar] = Field(
+        default=None,
+        min_length=1,
+        description="A list of environment variables to add in bulk. When provided, `key`, `value`, `type_of_env`, `target` and `comment` are ignored.",
+        examples=[[{"key": "API_KEY", "value": "12345", "type_of_env": "encrypted", "target": ["production"]}]],
+    )
+    upsert: bool = Field(
+        default=False,
+        description="If true, environment variables whose key already exists for the same target are updated instead of failing.",
+        examples=[True, False],
+    )
+
+    @model_validator(mode="after")
+    def check_env_vars(self):
+        if self.env_vars is None and (self.key is None or self.value is None or self.type_of_env is None):
+            raise ValueError("Either `env_vars` or `key`, `value` and `type_of_env` must be provided.")
+        return self
 
 
 class CreateEnvVarResponse(BaseModel):
@@ -51,12 +98,94 @@ class CreateEnvVarResponse(BaseModel):
     )
 
 
-class CreateEnvVarAction(Action):
+def _bulk_payloads(request: CreateEnvVarRequest) -> list:
+    if request.env_vars is None:
+        env_vars = [request]
+    else:
+        env_vars = request.env_vars
+    payloads = []
+    for env_var in env_vars:
+        data = {"key": env_var.key, "value": env_var.value, "type": env_var.type_of_env}
+        if env_var.target:
+            data["target"] = env_var.target
+        if env_var.comment:
+            data["comment"] = env_var.comment
+        payloads.append(data)
+    return payloads
+
+
+def _bulk_mode(request) -> bool:
+    """Whether `request`, a request model or a plain dict, is sent to the bulk endpoint."""
+    if isinstance(request, dict):
+        return request.get("env_vars") is not None or bool(request.get("upsert"))
+    return request.env_vars is not None or request.upsert
+
+
+def chunk_env_vars(payloads: list) -> list:
+    """Split bulk env var payloads into the batches sent per request, `ENV_VARS_PER_REQUEST` at a time."""
+    return [payloads[i : i + ENV_VARS_PER_REQUEST] for i in range(0, len(payloads), ENV_VARS_PER_REQUEST)]
+
+
+def _created_entries(body: dict) -> list:
+    created = body.get("created") or []
+    return [created] if isinstance(created, dict) else created
+
+
+class BulkOutcome:
+    """Collects the per-variable results of the bulk requests sent for one action call."""
+
+    def __init__(self, upsert: bool):
+        self.upsert = upsert
+        self.results = []
+        self.created = []
+        self.failed = []
+
+    def add_response(self, chunk: list, body: dict) -> None:
+        """Match the `created`/`failed` entries of one bulk response back to the requested variables."""
+        created = _created_entries(body)
+        failed = body.get("failed") or []
+        self.created.extend(created)
+        self.failed.extend(failed)
+
+        created_by_key = {}
+        for env in created:
+            created_by_key.setdefault(env.get("key"), []).append(env)
+        failed_by_key = {}
+        for failure in failed:
+            error = failure.get("error", failure)
+            failed_by_key.setdefault(error.get("envVarKey") or error.get("key"), []).append(error)
+
+        for payload in chunk:
+            key = payload["key"]
+            if created_by_key.get(key):
+                env = created_by_key[key].pop(0)
+                self.results.append({"key": key, "status": "upserted" if self.upsert else "created", "id": env.get("id")})
+            elif failed_by_key.get(key):
+                error = failed_by_key[key].pop(0)
+                self.results.append({"key": key, "status": "failed", "error": error.get("message") or error.get("code")})
+            else:
+                self.results.append({"key": key, "status": "failed", "error": "No result returned for this variable."})
+
+    def add_error(self, chunk: list, error: Exception) -> None:
+        self.results.extend({"key": payload["key"], "status": "failed", "error": str(error)} for payload in chunk)
+
+    @property
+    def success(self) -> bool:
+        return all(result["status"] != "failed" for result in self.results)
+
+    def response(self) -> dict:
+        return {"created": self.created, "failed": self.failed, "results": self.results}
+
+
+class CreateEnvVarAction(SpecAction):
     """
     This action creates one or more environment variables for a specific Vercel project identified by the project ID. The response will include the details of the added environment variable(s) as returned by the Vercel API.
 
+    When `env_vars` is provided, or `upsert` is set, the variables are sent in bulk to the v10 endpoint, `ENV_VARS_PER_REQUEST` at a time, and the response additionally contains a `results` list with the outcome (`created`, `upserted` or `failed`) of each requested variable, in request order.
+
     Edge Cases:
-    - If the project_id or env_vars are not provided in the request, the action will raise a validation error.
+    - If the project_id or env_vars are not provided in the request, or env_vars is empty, the action will raise a validation error.
+    - In bulk mode `success` is `true` only if every variable was created or upserted; the variables that failed are reported individually in `results`.
     - If the API request to create the environment variable(s) fails, the action will return a response with `success` set to `false` and `response` set to `None`.
 
     Use Cases:
@@ -70,41 +199,54 @@ class CreateEnvVarAction(Action):
     _tags = ["vercel", "environment"]
     _tool_name = "vercel"
 
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
+    _spec = ActionSpec(
+        method="POST",
+        path="/v5/projects/{project_id_or_name}/env",
+        body={"key": "key", "value": "value", "type_of_env": "type", "target": "target", "comment": "comment"},
+        invalidates="project_id_or_name",
+    )
+    _bulk = CompiledSpec(
+        ActionSpec(
+            method="POST",
+            path="/v10/projects/{project_id_or_name}/env",
+            invalidates="project_id_or_name",
+        )
+    )
+
+    def _create_bulk(self, request: CreateEnvVarRequest, headers: dict, span) -> tuple:
+        params = {"upsert": "true"} if request.upsert else None
+        outcome, sent = BulkOutcome(request.upsert), False
+        for chunk in chunk_env_vars(_bulk_payloads(request)):
+            try:
+                response = self._bulk.send(request, headers, body=chunk, params=params, span=span)
+                outcome.add_response(chunk, self._bulk.receive(response, span))
+                sent = True
+            except Exception as e:
+                outcome.add_error(chunk, e)
+        if sent:
+            self._bulk.invalidate(request, headers)
+        return outcome.success, outcome.response()
+
+    async def _create_bulk_async(self, request: CreateEnvVarRequest, headers: dict, span) -> tuple:
+        params = {"upsert": "true"} if request.upsert else None
+        outcome, sent = BulkOutcome(request.upsert), False
+        for chunk in chunk_env_vars(_bulk_payloads(request)):
+            try:
+                response = await self._bulk.send_async(request, headers, body=chunk, params=params, span=span)
+                outcome.add_response(chunk, self._bulk.receive(response, span))
+                sent = True
+            except Exception as e:
+                outcome.add_error(chunk, e)
+        if sent:
+            self._bulk.invalidate(request, headers)
+        return outcome.success, outcome.response()
 
     def execute(self, request: CreateEnvVarRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id_or_name
-        url = f"https://api.vercel.com/v5/projects/{project_id}/env"
-        data = {}
-        data["key"] = request.key
-        data["value"] = request.value
-        data["type"] = request.type_of_env
-        if request.target:
-            data["target"] = request.target
-        if request.comment:
-            data["comment"] = request.comment
-
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+        if not _bulk_mode(request):
+            return super().execute(request, authorisation_data)
+        return self._compiled.run(request, authorisation_data, self._create_bulk)
+
+    async def execute_async(self, request: CreateEnvVarRequest, authorisation_data: dict) -> dict:
+        if not _bulk_mode(request):
+            return await super().execute_async(request, authorisation_data)
+        return await self._compiled.run_async(request, authorisation_data, self._create_bulk_async)
@@ -1,10 +1,9 @@
 import json
 import os
 
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, SpecAction
 
 
 class DeleteProjectRequest(BaseModel):
@@ -26,7 +25,7 @@ class DeleteProjectResponse(BaseModel):
     )
 
 
-class DeleteProjectAction(Action):
+class DeleteProjectAction(SpecAction):
     """
     This action deletes a specific Vercel project identified by the project ID. The response will include the result of the delete operation as returned by the Vercel API.
 
@@ -44,34 +43,9 @@ class DeleteProjectAction(Action):
     _response_schema = DeleteProjectResponse
     _tags = ["vercel", "project"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: DeleteProjectRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id_or_name
-        url = f"https://api.vercel.com/v9/projects/{project_id}"
-
-        try:
-            response = requests.delete(url, headers=headers)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="DELETE",
+        path="/v9/projects/{project_id_or_name}",
+        invalidates="project_id_or_name",
+        deletes="project_id_or_name",
+    )
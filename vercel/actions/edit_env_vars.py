@@ -1,10 +1,9 @@
 import json
 import os
 
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, SpecAction
 
 
 class EditEnvVarRequest(BaseModel):
@@ -56,7 +55,7 @@ class EditEnvVarResponse(BaseModel):
     )
 
 
-class EditEnvVarAction(Action):
+class EditEnvVarAction(SpecAction):
     """
     This action edits an existing environment variable for a specific Vercel project identified by the project ID and environment variable ID. The response will include the details of the edited environment variable as returned by the Vercel API.
 
@@ -74,46 +73,10 @@ class EditEnvVarAction(Action):
     _response_schema = EditEnvVarResponse
     _tags = ["vercel", "environment"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: EditEnvVarRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id_or_name
-        env_var_id = request.env_var_id
-        url = f"https://api.vercel.com/v9/projects/{project_id}/env/{env_var_id}"
-        data = {}
-        if request.key:
-            data["key"] = request.key
-        if request.value:
-            data["value"] = request.value
-        if request.type_of_env:
-            data["type"] = request.type_of_env
-        if request.target:
-            data["target"] = request.target
-        if request.comment:
-            data["comment"] = request.comment
-
-        try:
-            response = requests.patch(url, headers=headers, json=data)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="PATCH",
+        path="/v9/projects/{project_id_or_name}/env/{env_var_id}",
+        body={"key": "key", "value": "value", "type_of_env": "type", "target": "target", "comment": "comment"},
+        idempotent=True,
+        invalidates="project_id_or_name",
+    )
@@ -0,0 +1,46 @@
+# The framework presets accepted by the Vercel API, shared by the project request models.
+FRAMEWORK_EXAMPLES = [
+    "blitzjs",
+    "nextjs",
+    "gatsby",
+    "remix",
+    "astro",
+    "hexo",
+    "eleventy",
+    "docusaurus-2",
+    "docusaurus",
+    "preact",
+    "solidstart-1",
+    "solidstart",
+    "dojo",
+    "ember",
+    "vue",
+    "scully",
+    "ionic-angular",
+    "angular",
+    "polymer",
+    "svelte",
+    "sveltekit",
+    "sveltekit-1",
+    "ionic-react",
+    "create-react-app",
+    "gridsome",
+    "umijs",
+    "sapper",
+    "saber",
+    "stencil",
+    "nuxtjs",
+    "redwoodjs",
+    "hugo",
+    "jekyll",
+    "brunch",
+    "middleman",
+    "zola",
+    "hydrogen",
+    "vite",
+    "vitepress",
+    "vuepress",
+    "parcel",
+    "sanity",
+    "storybook",
+]
@@ -1,10 +1,12 @@
 import json
 import os
+from typing import AsyncIterator, Iterator
 
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import STREAM_CHUNK_SIZE, ActionSpec, SpecAction
+from ..jsonstream import compile_paths, iter_items
+from ..oauth import authorised_headers, authorised_headers_async
 
 
 class GetEnvVarsRequest(BaseModel):
@@ -13,6 +15,11 @@ class GetEnvVarsRequest(BaseModel):
         description="The ID or name of the Vercel project to Get environment variables from. Example: 'project_123'.",
         examples=["project_123"],
     )
+    fields: list[str] = Field(
+        default=None,
+        description="Dotted paths of the environment variable fields to return, e.g. ['key', 'target']. When set, only these fields of each environment variable are decoded and returned. Example: ['key', 'value'].",
+        examples=[["key", "value"]],
+    )
 
 
 class GetEnvVarsResponse(BaseModel):
@@ -26,13 +33,18 @@ class GetEnvVarsResponse(BaseModel):
     )
 
 
-class GetEnvVarsAction(Action):
+class GetEnvVarsAction(SpecAction):
     """
     This action retrieves the environment variables of a specific Vercel project identified by the project ID. The response will include the environment variables as returned by the Vercel API.
 
     Edge Cases:
     - If the project_id_or_name is not provided in the request, the action will raise a validation error.
     - If the API request to retrieve the environment variables fails, the action will return a response with `success` set to `false` and `response` set to `None`.
+    - Successful responses are cached per credential for a short TTL (see `vercel.cache`). Writes made through the Vercel actions invalidate the cached entries of the project they touch.
+    - Concurrent identical requests made with the same credential share a single upstream call.
+    - When `fields` is set, the response is decoded incrementally and only the `envs` list, projected to those fields, is returned.
+
+    `iter_env_vars` and `aiter_env_vars` yield the environment variables one at a time, decoding each entry as the consumer advances, so projects with many variables are never fully materialized. They bypass the cache.
 
     Use Cases:
     - Retrieving the environment variables of a Vercel project for configuration purposes.
@@ -44,34 +56,26 @@ class GetEnvVarsAction(Action):
     _response_schema = GetEnvVarsResponse
     _tags = ["vercel", "environment"]
     _tool_name = "vercel"
+    _spec = ActionSpec(
+        method="GET",
+        path="/v9/projects/{project_id_or_name}/env",
+        cache="env",
+        fields="fields",
+        items="envs",
+    )
 
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: GetEnvVarsRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id_or_name
-        url = f"https://api.vercel.com/v9/projects/{project_id}/env"
-
+    def iter_env_vars(self, request: GetEnvVarsRequest, authorisation_data: dict) -> Iterator[dict]:
+        """Lazily yield the project's environment variables, projected to `request.fields` when set."""
+        response = self._compiled.send(request, authorised_headers(authorisation_data), stream=True)
         try:
-            response = requests.get(url, headers=headers)
             response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+            yield from iter_items(response.iter_content(STREAM_CHUNK_SIZE), "envs", compile_paths(request.fields or ()))
+        finally:
+            response.close()
+
+    async def aiter_env_vars(self, request: GetEnvVarsRequest, authorisation_data: dict) -> AsyncIterator[dict]:
+        """Asyncio counterpart of `iter_env_vars`. The raw body is read in full, the entries are still decoded one at a time."""
+        response = await self._compiled.send_async(request, await authorised_headers_async(authorisation_data))
+        response.raise_for_status()
+        for env in iter_items(response.iter_bytes(STREAM_CHUNK_SIZE), "envs", compile_paths(request.fields or ())):
+            yield env
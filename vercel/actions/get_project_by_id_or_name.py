@@ -1,10 +1,9 @@
 import json
 import os
 
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, SpecAction
 
 
 class FindProjectRequest(BaseModel):
@@ -13,6 +12,11 @@ class FindProjectRequest(BaseModel):
         description="The ID or name of the Vercel project to find. Example: 'project_123'.",
         examples=["project_123"],
     )
+    fields: list[str] = Field(
+        default=None,
+        description="Dotted paths of the project fields to return, e.g. ['framework', 'link.repo']. When set, only these fields, plus the project's `id` and `name`, are decoded and returned. Example: ['framework', 'link.repo'].",
+        examples=[["framework", "link.repo"]],
+    )
 
 
 class FindProjectResponse(BaseModel):
@@ -26,13 +30,16 @@ class FindProjectResponse(BaseModel):
     )
 
 
-class FindProjectAction(Action):
+class FindProjectAction(SpecAction):
     """
     This action finds a specific Vercel project by its ID or name. The response will include the details of the found project as returned by the Vercel API.
 
     Edge Cases:
     - If project_id is provided in the request, the action will raise a validation error.
     - If the API request to find the project fails, the action will return a response with `success` set to `false` and `response` set to `None`.
+    - Successful responses are cached per credential for a short TTL (see `vercel.cache`). Writes made through the Vercel actions invalidate the cached entries of the project they touch.
+    - Concurrent identical requests made with the same credential share a single upstream call.
+    - When `fields` is set, the response is decoded incrementally and large members that were not asked for, such as `latestDeployments`, are skipped without being decoded.
 
     Use Cases:
     - Finding a Vercel project by its ID or name for management purposes.
@@ -44,33 +51,11 @@ class FindProjectAction(Action):
     _response_schema = FindProjectResponse
     _tags = ["vercel", "project"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: FindProjectRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        url = f"https://api.vercel.com/v5/projects/{request.project_id_or_name}"
-
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="GET",
+        path="/v5/projects/{project_id_or_name}",
+        cache="project",
+        cache_aliases=("id", "name"),
+        fields="fields",
+        projects=".",
+    )
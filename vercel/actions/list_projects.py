@@ -0,0 +1,173 @@
+from typing import AsyncIterator, Iterator
+
+from pydantic import BaseModel, Field
+
+from ..engine import ActionSpec, SpecAction
+from ..instrumentation import Span
+from ..oauth import authorised_headers, authorised_headers_async
+
+
+class ListProjectsRequest(BaseModel):
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="The number of projects to fetch per page, at most 100. Example: 20.",
+        examples=[20, 100],
+    )
+    max_results: int = Field(
+        default=100,
+        ge=1,
+        description="The maximum number of projects to return in total. Pages stop being fetched once it is reached. Example: 100.",
+        examples=[100],
+    )
+    search: str = Field(
+        default=None,
+        description="Only return projects whose name contains this value. Example: 'web'.",
+        examples=["web"],
+    )
+    repo_url: str = Field(
+        default=None,
+        description="Only return projects linked to this git repository URL. Example: 'https://github.com/vercel/next.js'.",
+        examples=["https://github.com/vercel/next.js"],
+    )
+    fields: list[str] = Field(
+        default=None,
+        description="The project fields to keep in the response. All fields are returned when not set. Example: ['id', 'name'].",
+        examples=[["id", "name", "framework", "updatedAt"]],
+    )
+    cursor: str = Field(
+        default=None,
+        description="The continuation token returned as `next` by a previous call, to resume listing from there.",
+        examples=["1699999999999"],
+    )
+
+
+class ListProjectsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the projects were listed successfully. True if the projects were listed successfully.",
+    )
+    response: dict = Field(
+        ...,
+        description="The listed projects under `projects`, and under `next` the continuation token to pass as `cursor` to fetch the following projects, or null when there are none.",
+    )
+
+
+def _project_params(request: ListProjectsRequest, limit: int, cursor: str) -> dict:
+    params = {"limit": limit}
+    if cursor:
+        params["from"] = cursor
+    if request.search:
+        params["search"] = request.search
+    if request.repo_url:
+        params["repoUrl"] = request.repo_url
+    return params
+
+
+def _project_page(request: ListProjectsRequest, body: dict) -> tuple:
+    projects = body.get("projects") or []
+    if request.fields:
+        projects = [{field: project[field] for field in request.fields if field in project} for project in projects]
+    cursor = (body.get("pagination") or {}).get("next")
+    return projects, None if cursor is None else str(cursor)
+
+
+class ListProjectsAction(SpecAction):
+    """
+    This action lists the Vercel projects of the account, optionally filtered by name or git repository, following the API's cursor pagination. The response will include the projects and a continuation token for the next page.
+
+    `iter_projects` and `aiter_projects` expose the same listing as a lazy generator and async iterator: pages are fetched one at a time as the consumer advances, so scanning accounts with thousands of projects runs in constant memory and stops fetching as soon as the consumer stops iterating.
+
+    Edge Cases:
+    - If `limit` is outside 1 to 100, the action will raise a validation error.
+    - If the API request for a page fails, the action will return a response with `success` set to `false` and `response` set to the error. The iterators raise the error instead.
+
+    Use Cases:
+    - Enumerating the projects of an account or team.
+    - Finding projects by partial name or by linked repository without guessing their names.
+    """
+
+    _display_name = "List Projects"
+    _request_schema = ListProjectsRequest
+    _response_schema = ListProjectsResponse
+    _tags = ["vercel", "project"]
+    _tool_name = "vercel"
+
+    _spec = ActionSpec(
+        method="GET",
+        path="/v9/projects",
+        projects="projects",
+    )
+
+    def iter_pages(self, request: ListProjectsRequest, authorisation_data: dict, max_results: int = None, span: Span = None) -> Iterator[tuple]:
+        """
+        Yield `(projects, next_cursor)` for each page, requesting no more than `max_results` projects in total.
+
+        The timings of every page request are accumulated on `span` when one is given.
+        """
+        return self._pages(request, authorised_headers(authorisation_data), max_results, span)
+
+    def _pages(self, request: ListProjectsRequest, headers: dict, max_results: int, span: Span) -> Iterator[tuple]:
+        cursor = request.cursor
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            limit = request.limit if remaining is None else min(request.limit, remaining)
+            response = self._compiled.send(request, headers, params=_project_params(request, limit, cursor), span=span)
+            body = self._compiled.receive(response, span)
+            self._compiled.index(body, headers)
+            projects, cursor = _project_page(request, body)
+            yield projects, cursor
+            if remaining is not None:
+                remaining -= len(projects)
+            if not cursor or not projects:
+                return
+
+    async def aiter_pages(self, request: ListProjectsRequest, authorisation_data: dict, max_results: int = None, span: Span = None) -> AsyncIterator[tuple]:
+        """Asyncio counterpart of `iter_pages`."""
+        async for page in self._apages(request, await authorised_headers_async(authorisation_data), max_results, span):
+            yield page
+
+    async def _apages(self, request: ListProjectsRequest, headers: dict, max_results: int, span: Span) -> AsyncIterator[tuple]:
+        cursor = request.cursor
+        remaining = max_results
+        while remaining is None or remaining > 0:
+            limit = request.limit if remaining is None else min(request.limit, remaining)
+            response = await self._compiled.send_async(request, headers, params=_project_params(request, limit, cursor), span=span)
+            body = self._compiled.receive(response, span)
+            self._compiled.index(body, headers)
+            projects, cursor = _project_page(request, body)
+            yield projects, cursor
+            if remaining is not None:
+                remaining -= len(projects)
+            if not cursor or not projects:
+                return
+
+    def iter_projects(self, request: ListProjectsRequest, authorisation_data: dict) -> Iterator[dict]:
+        """Lazily yield every matching project, ignoring `max_results`."""
+        for projects, _ in self.iter_pages(request, authorisation_data):
+            yield from projects
+
+    async def aiter_projects(self, request: ListProjectsRequest, authorisation_data: dict) -> AsyncIterator[dict]:
+        """Asyncio counterpart of `iter_projects`."""
+        async for projects, _ in self.aiter_pages(request, authorisation_data):
+            for project in projects:
+                yield project
+
+    def _list(self, request: ListProjectsRequest, headers: dict, span: Span) -> tuple:
+        projects, cursor = [], None
+        for page, cursor in self._pages(request, headers, request.max_results, span):
+            projects.extend(page)
+        return True, {"projects": projects, "next": cursor}
+
+    async def _list_async(self, request: ListProjectsRequest, headers: dict, span: Span) -> tuple:
+        projects, cursor = [], None
+        async for page, cursor in self._apages(request, headers, request.max_results, span):
+            projects.extend(page)
+        return True, {"projects": projects, "next": cursor}
+
+    def execute(self, request: ListProjectsRequest, authorisation_data: dict) -> dict:
+        return self._compiled.run(request, authorisation_data, self._list)
+
+    async def execute_async(self, request: ListProjectsRequest, authorisation_data: dict) -> dict:
+        return await self._compiled.run_async(request, authorisation_data, self._list_async)
@@ -0,0 +1,335 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, Field
+
+from ..engine import ActionSpec, CompiledSpec, SpecAction
+from .create_env_vars import BulkOutcome, CreateEnvVarAction, chunk_env_vars
+from .edit_env_vars import EditEnvVarAction, EditEnvVarRequest
+
+ALL_TARGETS = ["production", "preview", "development"]
+
+# The number of edits and deletes sent concurrently while applying a plan.
+MAX_PARALLEL_WRITES = 8
+
+
+class DesiredEnvVar(BaseModel):
+    value: str = Field(
+        ...,
+        description="The desired value of the environment variable. Example: '12345'.",
+        examples=["12345"],
+    )
+    type_of_env: str = Field(
+        default="encrypted",
+        description="The desired type of the environment variable. Example: 'encrypted'.",
+        examples=["plain", "encrypted", "sensitive"],
+    )
+    target: list[str] = Field(
+        default=ALL_TARGETS,
+        description="The target(s) the value applies to. Example: ['production', 'preview'].",
+        examples=[["production", "preview"]],
+    )
+
+
+class ReconcileEnvVarsRequest(BaseModel):
+    project_id_or_name: str = Field(
+        ...,
+        description="The ID or name of the Vercel project whose environment variables are reconciled. Example: 'project_123'.",
+        examples=["project_123"],
+    )
+    env_vars: dict[str, DesiredEnvVar] = Field(
+        ...,
+        description="The desired environment variables, keyed by environment variable key.",
+        examples=[{"API_URL": {"value": "https://api.example.com", "type_of_env": "plain", "target": ["production"]}}],
+    )
+    delete_missing: bool = Field(
+        default=False,
+        description="Whether to delete the environment variables whose key is not in `env_vars`. Example: false.",
+        examples=[False],
+    )
+    plan_only: bool = Field(
+        default=False,
+        description="Whether to only compute and return the operations, without applying them. Example: true.",
+        examples=[True],
+    )
+
+
+class ReconcileEnvVarsResponse(BaseModel):
+    success: bool = Field(
+        ...,
+        description="Indicates if the environment variables were reconciled successfully. True if every operation was applied, or if `plan_only` is set and the plan was computed.",
+    )
+    response: dict = Field(
+        ...,
+        description="The operations of the plan and, unless `plan_only` is set, the outcome of each of them.",
+    )
+
+
+class EnvVarRef(BaseModel):
+    """Identifies one environment variable of a project, the request of the delete calls."""
+
+    project_id_or_name: str
+    env_var_id: str
+
+
+class _Operation:
+    """One write of a reconciliation plan. `describe` leaves the values out so plans can be logged."""
+
+    __slots__ = ("kind", "key", "env_id", "target", "changes", "value", "type")
+
+    def __init__(self, kind: str, key: str, target: list, env_id: str = None, changes: tuple = (), value: str = None, type: str = None):
+        self.kind = kind
+        self.key = key
+        self.target = target
+        self.env_id = env_id
+        self.changes = changes
+        self.value = value
+        self.type = type
+
+    def describe(self) -> dict:
+        described = {"op": self.kind, "key": self.key, "target": self.target}
+        if self.env_id is not None:
+            described["id"] = self.env_id
+        if self.changes:
+            described["changes"] = list(self.changes)
+        return described
+
+
+def _targets(env: dict) -> frozenset:
+    target = env.get("target") or ALL_TARGETS
+    return frozenset([target] if isinstance(target, str) else target)
+
+
+def plan_env_vars(current: list, desired: dict, delete_missing: bool = False) -> tuple:
+    """
+    Compute the writes turning `current` (the project's env entries) into `desired`.
+
+    Entries are matched by key and target: for each desired key, the existing entries sharing a target
+    with it are deleted when fully covered by the desired targets, or shrunk to their other targets
+    otherwise; the largest covered entry is kept and edited in place when it differs, else the variable
+    is created. Entries scoped to a git branch, and entries of other targets, are left alone.
+
+    Returns `(first, second, unchanged)`: the deletes and shrinks that must land first, the creates and
+    edits that follow, and the number of desired keys that needed no write.
+    """
+    by_key = {}
+    for env in current:
+        if not env.get("gitBranch"):
+            by_key.setdefault(env["key"], []).append(env)
+
+    first, second, unchanged = [], [], 0
+    for key, wanted in desired.items():
+        targets = frozenset(wanted.target or ALL_TARGETS)
+        overlapping = [env for env in by_key.get(key, ()) if _targets(env) & targets]
+        covered = [env for env in overlapping if _targets(env) <= targets]
+        primary = max(covered, key=lambda env: len(_targets(env)), default=None)
+        sorted_targets = sorted(targets)
+
+        for env in overlapping:
+            if env is primary:
+                continue
+            if _targets(env) <= targets:
+                first.append(_Operation("delete", key, sorted(_targets(env)), env_id=env["id"]))
+            else:
+                first.append(_Operation("edit", key, sorted(_targets(env) - targets), env_id=env["id"], changes=("target",)))
+
+        if primary is None:
+            second.append(_Operation("create", key, sorted_targets, value=wanted.value, type=wanted.type_of_env))
+            continue
+        changes = []
+        # Sensitive values are never returned by the API, so they cannot be compared and are always written.
+        if primary.get("value") != wanted.value or primary.get("type") == "sensitive":
+            changes.append("value")
+        if primary.get("type") != wanted.type_of_env:
+            changes.append("type")
+        if _targets(primary) != targets:
+            changes.append("target")
+        if changes:
+            second.append(_Operation("edit", key, sorted_targets, env_id=primary["id"], changes=tuple(changes), value=wanted.value, type=wanted.type_of_env))
+        elif len(overlapping) == 1:
+            unchanged += 1
+
+    if delete_missing:
+        for key, envs in by_key.items():
+            if key not in desired:
+                first.extend(_Operation("delete", key, sorted(_targets(env)), env_id=env["id"]) for env in envs if env.get("type") != "system")
+
+    return first, second, unchanged
+
+
+def _edit_request(project: str, operation: _Operation) -> EditEnvVarRequest:
+    if operation.changes == ("target",):
+        return EditEnvVarRequest(project_id_or_name=project, env_var_id=operation.env_id, target=operation.target)
+    return EditEnvVarRequest(
+        project_id_or_name=project,
+        env_var_id=operation.env_id,
+        value=operation.value,
+        type_of_env=operation.type,
+        target=operation.target,
+    )
+
+
+def _create_payload(operation: _Operation) -> dict:
+    return {"key": operation.key, "value": operation.value, "type": operation.type, "target": operation.target}
+
+
+class _Outcomes:
+    """Collects the result of every operation of the plan, in plan order."""
+
+    def __init__(self, operations: list):
+        self.results = {id(operation): {**operation.describe(), "status": "planned"} for operation in operations}
+        self.order = [id(operation) for operation in operations]
+
+    def applied(self, operation: _Operation) -> None:
+        self.results[id(operation)]["status"] = "applied"
+
+    def failed(self, operation: _Operation, error) -> None:
+        self.results[id(operation)].update(status="failed", error=str(error))
+
+    def created(self, chunk: list, body: dict) -> None:
+        outcome = BulkOutcome(upsert=False)
+        outcome.add_response([_create_payload(operation) for operation in chunk], body)
+        for operation, result in zip(chunk, outcome.results):
+            if result["status"] == "failed":
+                self.failed(operation, result["error"])
+            else:
+                self.results[id(operation)].update(status="applied", id=result.get("id"))
+
+    def as_list(self) -> list:
+        return [self.results[key] for key in self.order]
+
+    def report(self, plan_only: bool, summary: dict) -> tuple:
+        """Return `(success, response)` for the action, `success` being `False` if any operation failed."""
+        operations = self.as_list()
+        success = all(operation["status"] != "failed" for operation in operations)
+        return success, {"plan_only": plan_only, "summary": summary, "operations": operations}
+
+
+class ReconcileEnvVarsAction(SpecAction):
+    """
+    This action reconciles the environment variables of a specific Vercel project with a desired state, given as a map of key to value, type and targets. It fetches the current environment variables once, computes the minimal set of create, edit and delete operations, matching variables by key and target, and applies them in parallel. The response will include the planned operations and the outcome of each of them.
+
+    Edge Cases:
+    - If the project_id_or_name or env_vars are not provided in the request, the action will raise a validation error.
+    - Variables that already hold the desired value, type and targets are not written at all. Values of `sensitive` variables cannot be read back and are always rewritten.
+    - Existing variables scoped to a git branch are never modified. Variables whose key is not desired are only deleted when `delete_missing` is set.
+    - Operations never include values in the response, so plans can be shown or logged safely.
+    - Deletes and target shrinks are applied before creates and edits, so the targets they free can be reused. If any operation fails, `success` is `false` and the failed operations carry their error.
+    - With `plan_only`, nothing is written and the response only contains the plan.
+
+    Use Cases:
+    - Keeping the environment variables of a Vercel project in sync with a configuration file.
+    - Previewing the changes a configuration update would make before applying it.
+    """
+
+    _display_name = "Reconcile Environment Variables"
+    _request_schema = ReconcileEnvVarsRequest
+    _response_schema = ReconcileEnvVarsResponse
+    _tags = ["vercel", "environment"]
+    _tool_name = "vercel"
+
+    _spec = ActionSpec(
+        method="GET",
+        path="/v9/projects/{project_id_or_name}/env",
+    )
+    _delete = CompiledSpec(
+        ActionSpec(
+            method="DELETE",
+            path="/v9/projects/{project_id_or_name}/env/{env_var_id}",
+        ),
+        name="ReconcileEnvVarsAction.delete",
+    )
+
+    def _plan(self, request: ReconcileEnvVarsRequest, current: dict) -> tuple:
+        first, second, unchanged = plan_env_vars(current.get("envs") or [], request.env_vars, request.delete_missing)
+        summary = {"create": 0, "edit": 0, "delete": 0, "unchanged": unchanged}
+        for operation in first + second:
+            summary[operation.kind] += 1
+        return first, second, summary
+
+    def _write(self, request: ReconcileEnvVarsRequest, headers: dict, operation: _Operation, outcomes: _Outcomes, span) -> None:
+        project = request.project_id_or_name
+        try:
+            if operation.kind == "delete":
+                ref = EnvVarRef(project_id_or_name=project, env_var_id=operation.env_id)
+                self._delete.receive(self._delete.send(ref, headers, span=span), span)
+            else:
+                edit = EditEnvVarAction._compiled
+                edit.receive(edit.send(_edit_request(project, operation), headers, span=span), span)
+            outcomes.applied(operation)
+        except Exception as e:
+            outcomes.failed(operation, e)
+
+    def _create(self, request: ReconcileEnvVarsRequest, headers: dict, chunk: list, outcomes: _Outcomes, span) -> None:
+        bulk = CreateEnvVarAction._bulk
+        try:
+            response = bulk.send(request, headers, body=[_create_payload(operation) for operation in chunk], span=span)
+            outcomes.created(chunk, bulk.receive(response, span))
+        except Exception as e:
+            for operation in chunk:
+                outcomes.failed(operation, e)
+
+    async def _write_async(self, request: ReconcileEnvVarsRequest, headers: dict, operation: _Operation, outcomes: _Outcomes, span) -> None:
+        project = request.project_id_or_name
+        try:
+            if operation.kind == "delete":
+                ref = EnvVarRef(project_id_or_name=project, env_var_id=operation.env_id)
+                self._delete.receive(await self._delete.send_async(ref, headers, span=span), span)
+            else:
+                edit = EditEnvVarAction._compiled
+                edit.receive(await edit.send_async(_edit_request(project, operation), headers, span=span), span)
+            outcomes.applied(operation)
+        except Exception as e:
+            outcomes.failed(operation, e)
+
+    async def _create_async(self, request: ReconcileEnvVarsRequest, headers: dict, chunk: list, outcomes: _Outcomes, span) -> None:
+        bulk = CreateEnvVarAction._bulk
+        try:
+            response = await bulk.send_async(request, headers, body=[_create_payload(operation) for operation in chunk], span=span)
+            outcomes.created(chunk, bulk.receive(response, span))
+        except Exception as e:
+            for operation in chunk:
+                outcomes.failed(operation, e)
+
+    def _reconcile(self, request: ReconcileEnvVarsRequest, headers: dict, span) -> tuple:
+        current = self._compiled.receive(self._compiled.send(request, headers, params={"decrypt": "true"}, span=span), span)
+        first, second, summary = self._plan(request, current)
+        outcomes = _Outcomes(first + second)
+        if not request.plan_only and (first or second):
+            creates = [operation for operation in second if operation.kind == "create"]
+            edits = [operation for operation in second if operation.kind != "create"]
+            with ThreadPoolExecutor(max_workers=MAX_PARALLEL_WRITES) as executor:
+                list(executor.map(lambda operation: self._write(request, headers, operation, outcomes, span), first))
+                writes = [executor.submit(self._write, request, headers, operation, outcomes, span) for operation in edits]
+                writes += [executor.submit(self._create, request, headers, chunk, outcomes, span) for chunk in chunk_env_vars(creates)]
+                for write in writes:
+                    write.result()
+            CreateEnvVarAction._bulk.invalidate(request, headers)
+        return outcomes.report(request.plan_only, summary)
+
+    async def _reconcile_async(self, request: ReconcileEnvVarsRequest, headers: dict, span) -> tuple:
+        current = self._compiled.receive(await self._compiled.send_async(request, headers, params={"decrypt": "true"}, span=span), span)
+        first, second, summary = self._plan(request, current)
+        outcomes = _Outcomes(first + second)
+        if not request.plan_only and (first or second):
+            slots = asyncio.Semaphore(MAX_PARALLEL_WRITES)
+
+            async def bounded(write):
+                async with slots:
+                    await write
+
+            creates = [operation for operation in second if operation.kind == "create"]
+            edits = [operation for operation in second if operation.kind != "create"]
+            await asyncio.gather(*(bounded(self._write_async(request, headers, operation, outcomes, span)) for operation in first))
+            await asyncio.gather(
+                *(bounded(self._write_async(request, headers, operation, outcomes, span)) for operation in edits),
+                *(bounded(self._create_async(request, headers, chunk, outcomes, span)) for chunk in chunk_env_vars(creates)),
+            )
+            CreateEnvVarAction._bulk.invalidate(request, headers)
+        return outcomes.report(request.plan_only, summary)
+
+    def execute(self, request: ReconcileEnvVarsRequest, authorisation_data: dict) -> dict:
+        return self._compiled.run(request, authorisation_data, self._reconcile)
+
+    async def execute_async(self, request: ReconcileEnvVarsRequest, authorisation_data: dict) -> dict:
+        return await self._compiled.run_async(request, authorisation_data, self._reconcile_async)
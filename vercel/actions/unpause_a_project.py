@@ -1,13 +1,12 @@
-import requests
 from pydantic import BaseModel, Field
 
-from shared.composio_tools.lib import Action
+from ..engine import ActionSpec, SpecAction
 
 
 class UnpauseProjectRequest(BaseModel):
     project_id: str = Field(
         ...,
-        description="The ID of the Vercel project to unpause. Example: 'project_123'.",
+        description="The ID or name of the Vercel project to unpause. Example: 'project_123'.",
         examples=["project_123"],
     )
 
@@ -23,12 +22,13 @@ class UnpauseProjectResponse(BaseModel):
     )
 
 
-class UnpauseProjectAction(Action):
+class UnpauseProjectAction(SpecAction):
     """
     This action unpauses a specific Vercel project identified by the project ID. The response will include the result of the unpause operation as returned by the Vercel API.
 
     Edge Cases:
     - If the project_id is not provided in the request, the action will raise a validation error.
+    - A project name may be given instead of its ID. It is resolved to the ID through the project index, filled from every project the Vercel actions have seen, and only looked up when the name is not indexed yet (see `vercel.project_index`).
     - If the API request to unpause the project fails, the action will return a response with `success` set to `false` and `response` set to `None`.
 
     Use Cases:
@@ -41,34 +41,9 @@ class UnpauseProjectAction(Action):
     _response_schema = UnpauseProjectResponse
     _tags = ["vercel", "project"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-    
-    @property   
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-    
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: UnpauseProjectRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id
-        url = f"https://api.vercel.com/v5/projects/{project_id}/unpause"
-
-        try:
-            response = requests.post(url, headers=headers)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="POST",
+        path="/v5/projects/{project_id}/unpause",
+        invalidates="project_id",
+        resolves="project_id",
+    )
@@ -1,12 +1,13 @@
-import requests
 from pydantic import BaseModel, Field
-from shared.composio_tools.lib import Action
+
+from ..engine import ActionSpec, SpecAction
+from .frameworks import FRAMEWORK_EXAMPLES
 
 
 class UpdateProjectRequest(BaseModel):
     project_id: str = Field(
         ...,
-        description="The ID of the Vercel project to update. Example: 'project_123'.",
+        description="The ID or name of the Vercel project to update. Example: 'project_123'.",
         examples=["project_123"],
     )
     name: str = Field(
@@ -17,7 +18,7 @@ class UpdateProjectRequest(BaseModel):
     framework: str = Field(
         default=None,
         description="The framework of the project",
-        examples=["blitzjs", "nextjs", "gatsby", "remix", "astro", "hexo", "eleventy", "docusaurus-2", "docusaurus", "preact", "solidstart-1", "solidstart", "dojo", "ember", "vue", "scully", "ionic-angular", "angular", "polymer", "svelte", "sveltekit", "sveltekit-1", "ionic-react", "create-react-app", "gridsome", "umijs", "sapper", "saber", "stencil", "nuxtjs", "redwoodjs", "hugo", "jekyll", "brunch", "middleman", "zola", "hydrogen", "vite", "vitepress", "vuepress", "parcel", "sanity", "storybook"],
+        examples=FRAMEWORK_EXAMPLES,
     )
 
 
@@ -32,12 +33,13 @@ class UpdateProjectResponse(BaseModel):
     )
 
 
-class UpdateProjectAction(Action):
+class UpdateProjectAction(SpecAction):
     """
     This action updates an existing Vercel project identified by the project ID. The response will include the details of the updated project as returned by the Vercel API.
 
     Edge Cases:
     - If the project_id is not provided in the request, the action will raise a validation error.
+    - A project name may be given instead of its ID. It is resolved to the ID through the project index, filled from every project the Vercel actions have seen, and only looked up when the name is not indexed yet (see `vercel.project_index`).
     - If the API request to update the project fails, the action will return a response with `success` set to `false` and `response` set to `None`.
 
     Use Cases:
@@ -50,39 +52,12 @@ class UpdateProjectAction(Action):
     _response_schema = UpdateProjectResponse
     _tags = ["vercel", "project"]
     _tool_name = "vercel"
-
-    @property
-    def display_name(self) -> str:
-        return self._display_name
-
-    @property
-    def request_schema(self) -> BaseModel:
-        return self._request_schema
-
-    @property
-    def response_schema(self) -> BaseModel:
-        return self._response_schema
-
-    def execute(self, request: UpdateProjectRequest, authorisation_data: dict) -> dict:
-        headers = authorisation_data["headers"]
-        execution_details = {"executed": False}
-        response_data = {"success": False, "response": None}
-        project_id = request.project_id
-        url = f"https://api.vercel.com/v5/projects/{project_id}"
-        data = {}
-        if request.name:
-            data["name"] = request.name
-        if request.framework:
-            data["framework"] = request.framework
-
-        try:
-            response = requests.patch(url, headers=headers, json=data)
-            response.raise_for_status()
-            execution_details["executed"] = True
-            response_data["success"] = True
-            response_data["response"] = response.json()
-
-        except Exception as e:
-            response_data["response"] = str(e)
-
-        return {"execution_details": execution_details, "response_data": response_data}
+    _spec = ActionSpec(
+        method="PATCH",
+        path="/v5/projects/{project_id}",
+        body={"name": "name", "framework": "framework"},
+        idempotent=True,
+        invalidates="project_id",
+        resolves="project_id",
+        projects=".",
+    )
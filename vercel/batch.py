@@ -0,0 +1,278 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from tool_runtime.credentials import credential_fingerprint
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """
+    One action call of a batch.
+
+    Attributes:
+        action: The action, as a name such as `"PauseProjectAction"`, an action class or an action instance.
+        request: The request, as a request model or a dict validated against the action's request schema.
+        depends_on: Indices of the items of the batch that must succeed before this one starts. If one of them
+            fails, this item is skipped.
+        authorisation_data: Overrides the batch's authorisation data for this item.
+    """
+
+    action: Any
+    request: Any
+    depends_on: tuple = ()
+    authorisation_data: dict = None
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of one item of a batch.
+
+    Attributes:
+        index: The position of the item in the batch.
+        action: The name of the action.
+        success: Whether the action succeeded.
+        response: The `response_data["response"]` returned by the action, `None` if it did not run.
+        error: The error message when the item failed or was skipped.
+        skipped: Whether the item was skipped because a dependency failed or it could not be prepared.
+        started: Seconds from the start of the batch to the start of the item.
+        duration: Seconds the item took to execute.
+    """
+
+    index: int
+    action: str
+    success: bool = False
+    response: Any = None
+    error: str = None
+    skipped: bool = False
+    started: float = 0.0
+    duration: float = 0.0
+
+    def as_dict(self) -> dict:
+        return dict(self.__dict__)
+
+
+@dataclass
+class _Prepared:
+    action: Any = None
+    request: Any = None
+    authorisation_data: dict = None
+    credential: str = None
+    dependents: list = field(default_factory=list)
+    waiting_on: int = 0
+
+
+def _action_instance(action):
+    from .vercel_tool import Vercel
+
+    if isinstance(action, str):
+        action = Vercel().action(action)
+    return action() if isinstance(action, type) else action
+
+
+def _action_name(action) -> str:
+    if isinstance(action, str):
+        return action
+    return action.__name__ if isinstance(action, type) else type(action).__name__
+
+
+class _Schedule:
+    """Tracks which items of a batch may start, honouring their dependencies and the concurrency limits."""
+
+    def __init__(self, items: list, authorisation_data: dict, max_concurrency: int, max_per_credential: int):
+        self.max_concurrency = max_concurrency
+        self.max_per_credential = max_per_credential
+        self.results = [BatchResult(index=i, action=_action_name(item.action)) for i, item in enumerate(items)]
+        self.prepared = [_Prepared() for _ in items]
+        self.running = 0
+        self.running_per_credential = {}
+        self.ready = []
+        self._order_and_prepare(items, authorisation_data)
+
+    def _order_and_prepare(self, items: list, authorisation_data: dict) -> None:
+        for i, item in enumerate(items):
+            prepared = self.prepared[i]
+            for dependency in item.depends_on:
+                if not 0 <= dependency < len(items) or dependency == i:
+                    raise ValueError(f"Batch item {i} depends on an invalid item: {dependency}")
+                self.prepared[dependency].dependents.append(i)
+            prepared.waiting_on = len(set(item.depends_on))
+        self._check_acyclic()
+
+        for i, item in enumerate(items):
+            prepared = self.prepared[i]
+            try:
+                prepared.action = _action_instance(item.action)
+                request = item.request
+                if isinstance(request, dict):
+                    request = prepared.action.request_schema.model_validate(request)
+                prepared.request = request
+                prepared.authorisation_data = item.authorisation_data or authorisation_data
+                prepared.credential = credential_fingerprint(prepared.authorisation_data["headers"])
+            except Exception as e:
+                prepared.action = None
+                self.results[i].error = str(e)
+
+        for i, prepared in enumerate(self.prepared):
+            if prepared.waiting_on == 0:
+                self._make_ready(i)
+
+    def _check_acyclic(self) -> None:
+        remaining = [prepared.waiting_on for prepared in self.prepared]
+        stack = [i for i, count in enumerate(remaining) if count == 0]
+        visited = 0
+        while stack:
+            visited += 1
+            for dependent in set(self.prepared[stack.pop()].dependents):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    stack.append(dependent)
+        if visited != len(self.prepared):
+            raise ValueError("Batch items have circular dependencies")
+
+    def _make_ready(self, i: int) -> None:
+        if self.prepared[i].action is None:
+            self._skip(i, self.results[i].error)
+        else:
+            self.ready.append(i)
+
+    def _skip(self, i: int, error: str) -> None:
+        result = self.results[i]
+        result.skipped = True
+        result.error = error
+        for dependent in set(self.prepared[i].dependents):
+            self._skip(dependent, f"Skipped because batch item {i} did not succeed.")
+
+    def launchable(self) -> list:
+        """Pop the ready items that fit within the global and per-credential limits, in batch order."""
+        launched = []
+        self.ready.sort()
+        for i in list(self.ready):
+            if self.running >= self.max_concurrency:
+                break
+            credential = self.prepared[i].credential
+            if self.running_per_credential.get(credential, 0) >= self.max_per_credential:
+                continue
+            self.ready.remove(i)
+            self.running += 1
+            self.running_per_credential[credential] = self.running_per_credential.get(credential, 0) + 1
+            launched.append(i)
+        return launched
+
+    def record(self, i: int, outcome: dict, started: float, duration: float) -> None:
+        """Store the outcome of item `i` and release the items waiting on it."""
+        prepared = self.prepared[i]
+        self.running -= 1
+        self.running_per_credential[prepared.credential] -= 1
+
+        result = self.results[i]
+        result.started = started
+        result.duration = duration
+        response_data = outcome.get("response_data", {})
+        result.success = bool(response_data.get("success"))
+        result.response = response_data.get("response")
+        if not result.success:
+            result.error = result.response if isinstance(result.response, str) else "The action did not succeed."
+            for dependent in set(prepared.dependents):
+                self._skip(dependent, f"Skipped because batch item {i} did not succeed.")
+            return
+
+        for dependent in set(prepared.dependents):
+            dependent_prepared = self.prepared[dependent]
+            dependent_prepared.waiting_on -= 1
+            if dependent_prepared.waiting_on == 0 and not self.results[dependent].skipped:
+                self._make_ready(dependent)
+
+    @property
+    def busy(self) -> bool:
+        return self.running > 0 or bool(self.ready)
+
+
+def _failure(error: Exception) -> dict:
+    return {"execution_details": {"executed": False}, "response_data": {"success": False, "response": str(error)}}
+
+
+class BatchExecutor:
+    """
+    Runs a batch of heterogeneous action calls concurrently.
+
+    At most `max_concurrency` items run at once overall, and at most `max_per_credential` at once per
+    credential, on top of the per-credential rate limiting of the transport. Items start in batch order as
+    soon as their dependencies have succeeded and a slot is free; results are returned in batch order.
+
+    `run` executes the items on a thread pool with their `execute`; `run_async` runs them as tasks on the
+    running event loop with their `execute_async`.
+    """
+
+    def __init__(self, max_concurrency: int = 16, max_per_credential: int = 8):
+        self.max_concurrency = max_concurrency
+        self.max_per_credential = max_per_credential
+
+    def _schedule(self, items: list, authorisation_data: dict) -> _Schedule:
+        return _Schedule(list(items), authorisation_data, self.max_concurrency, self.max_per_credential)
+
+    def run(self, items: list, authorisation_data: dict) -> list:
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        schedule = self._schedule(items, authorisation_data)
+        origin = time.perf_counter()
+
+        def execute(i):
+            prepared = schedule.prepared[i]
+            start = time.perf_counter()
+            try:
+                outcome = prepared.action.execute(prepared.request, prepared.authorisation_data)
+            except Exception as e:
+                outcome = _failure(e)
+            return i, outcome, start - origin, time.perf_counter() - start
+
+        running = set()
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vercel-batch") as executor:
+            while schedule.busy:
+                running.update(executor.submit(execute, i) for i in schedule.launchable())
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    schedule.record(*future.result())
+        return schedule.results
+
+    async def run_async(self, items: list, authorisation_data: dict) -> list:
+        import asyncio
+
+        schedule = self._schedule(items, authorisation_data)
+        origin = time.perf_counter()
+
+        async def execute(i):
+            prepared = schedule.prepared[i]
+            start = time.perf_counter()
+            try:
+                outcome = await prepared.action.execute_async(prepared.request, prepared.authorisation_data)
+            except Exception as e:
+                outcome = _failure(e)
+            return i, outcome, start - origin, time.perf_counter() - start
+
+        running = set()
+        while schedule.busy:
+            running.update(asyncio.ensure_future(execute(i)) for i in schedule.launchable())
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                schedule.record(*task.result())
+        return schedule.results
+
+
+_executor = BatchExecutor()
+
+
+def get_batch_executor() -> BatchExecutor:
+    """Return the process-wide batch executor."""
+    return _executor
+
+
+def configure_batch_executor(**kwargs) -> BatchExecutor:
+    """Replace the process-wide batch executor with one built from `kwargs` (see `BatchExecutor`)."""
+    global _executor
+    _executor = BatchExecutor(**kwargs)
+    return _executor
+
+
+__all__ = ["BatchExecutor", "BatchItem", "BatchResult", "configure_batch_executor", "get_batch_executor"]
@@ -0,0 +1,184 @@
+"""
+Throughput and latency benchmark for every action of the Vercel tool, run against `MockVercelAPI`.
+
+For each action and each concurrency level the benchmark issues `--ops` calls from that many
+concurrent callers (threads for `execute`, tasks on one event loop for `execute_async`) and reports
+operations per second, p50/p99 latency and the number of failed calls. A separate sequential pass
+under `tracemalloc` reports the peak memory allocated per call.
+
+The response cache, including the revalidation of expired entries with conditional requests, is
+disabled and the client-side rate limiter is opened up unless `--cache` or `--rate-limit` ask
+otherwise, so that the numbers measure the request path itself.
+
+Run from the directory containing the `vercel` package, with `shared.composio_tools` importable:
+
+    python -m vercel.benchmarks.action_throughput --ops 500 --concurrency 1,8,32 --latency 0.005
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from tool_runtime.ratelimit import RateLimiter
+
+from ..cache import configure_cache
+from ..transport import configure_transport, get_transport
+from ..vercel_tool import Vercel
+from .mock_api import MockVercelAPI
+
+AUTHORISATION_DATA = {"headers": {"Authorization": "Bearer benchmark", "Content-Type": "application/json"}}
+
+_unique = itertools.count()
+
+
+def seed(mock: MockVercelAPI, projects: int = 50, envs_per_project: int = 20) -> list:
+    seeded = []
+    for i in range(projects):
+        project = mock.state.add_project(f"seed-{i}", framework="nextjs")
+        for j in range(envs_per_project):
+            mock.state.add_env(project["id"], f"SEED_{j}", f"value-{j}", "plain", ["production"])
+        seeded.append(project)
+    return seeded
+
+
+def request_factories(mock: MockVercelAPI, projects: list) -> dict:
+    """Return, per action name, a function building the keyword arguments of the i-th request."""
+
+    def project(i):
+        return projects[i % len(projects)]["id"]
+
+    def disposable_project(i):
+        return mock.state.add_project(f"disposable-{next(_unique)}")["id"]
+
+    def env(i):
+        project_id = project(i)
+        return project_id, mock.state.envs[project_id][i % len(mock.state.envs[project_id])]["id"]
+
+    def edit_env(i):
+        project_id, env_id = env(i)
+        return {"project_id_or_name": project_id, "env_var_id": env_id, "value": f"edited-{i}"}
+
+    return {
+        "GetEnvVarsAction": lambda i: {"project_id_or_name": project(i)},
+        "FindProjectAction": lambda i: {"project_id_or_name": project(i)},
+        "ListProjectsAction": lambda i: {"limit": 20, "max_results": 20},
+        "AddDomainAction": lambda i: {"project_id_or_name": project(i), "domain_name": f"d{next(_unique)}.example.com"},
+        "CreateProjectAction": lambda i: {"name": f"bench-{next(_unique)}", "gitRepositoryName": "acme/web", "gitRepositoryType": "github"},
+        "CreateEnvVarAction": lambda i: {"project_id_or_name": project(i), "key": f"BENCH_{next(_unique)}", "value": "v", "type_of_env": "plain"},
+        "DeleteProjectAction": lambda i: {"project_id_or_name": disposable_project(i)},
+        "EditEnvVarAction": edit_env,
+        "PauseProjectAction": lambda i: {"project_id": project(i)},
+        "UnpauseProjectAction": lambda i: {"project_id": project(i)},
+        "UpdateProjectAction": lambda i: {"project_id": project(i), "framework": "nextjs"},
+    }
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_sync(action, requests: list, concurrency: int) -> tuple:
+    def call(request):
+        start = time.perf_counter()
+        result = action.execute(request, AUTHORISATION_DATA)
+        return time.perf_counter() - start, result["response_data"]["success"]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, requests))
+    return time.perf_counter() - start, results
+
+
+async def run_async(action, requests: list, concurrency: int) -> tuple:
+    pending = iter(requests)
+    results = []
+
+    async def worker():
+        for request in pending:
+            start = time.perf_counter()
+            result = await action.execute_async(request, AUTHORISATION_DATA)
+            results.append((time.perf_counter() - start, result["response_data"]["success"]))
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await get_transport().aclose()
+    return elapsed, results
+
+
+def allocations_per_call(action, requests: list) -> float:
+    """Return the mean peak memory, in KiB, allocated while executing one call."""
+    # One untraced call first, so lazy imports and connection setup are not counted.
+    action.execute(requests[0], AUTHORISATION_DATA)
+    peaks = []
+    tracemalloc.start()
+    try:
+        for request in requests[1:]:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            action.execute(request, AUTHORISATION_DATA)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=200, help="Calls per action and concurrency level.")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated numbers of concurrent callers.")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+    parser.add_argument("--actions", default=None, help="Comma-separated action names to run, all by default.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds of latency the mock adds to every response.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of the mock answering 503.")
+    parser.add_argument("--rate-limit", type=int, default=None, help="Requests per minute the mock allows per credential.")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled.")
+    parser.add_argument("--alloc-ops", type=int, default=50, help="Sequential calls measured under tracemalloc.")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+
+    with MockVercelAPI(latency=args.latency, error_rate=args.error_rate, rate_limit=args.rate_limit, seed=0, etags=args.cache) as mock:
+        configure_transport(
+            base_url=mock.url,
+            pool_maxsize=max(levels),
+            rate_limiter=None if args.rate_limit else RateLimiter(rate=1e9, capacity=10**9),
+        )
+        if not args.cache:
+            # No entry is kept at all: with `ttl=0` alone, expired entries would still be revalidated with 304s.
+            configure_cache(ttl=0, max_entries=0)
+        factories = request_factories(mock, seed(mock))
+        tool = Vercel()
+        names = args.actions.split(",") if args.actions else [action.__name__ for action in tool.actions()]
+
+        print(f"{'action':<22}{'mode':<7}{'callers':>8}{'ops/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}{'KiB/op':>9}")
+        for name in names:
+            action = tool.action(name)()
+            build = factories[name]
+
+            def requests(count):
+                return [action.request_schema(**build(i)) for i in range(count)]
+
+            allocated = allocations_per_call(action, requests(args.alloc_ops))
+            for mode in modes:
+                for concurrency in levels:
+                    batch = requests(args.ops)
+                    if mode == "sync":
+                        elapsed, results = run_sync(action, batch, concurrency)
+                    else:
+                        elapsed, results = asyncio.run(run_async(action, batch, concurrency))
+                    latencies = [latency * 1000 for latency, _ in results]
+                    errors = sum(1 for _, success in results if not success)
+                    print(
+                        f"{name:<22}{mode:<7}{concurrency:>8}{len(results) / elapsed:>10.0f}"
+                        f"{_percentile(latencies, 0.5):>9.2f}{_percentile(latencies, 0.99):>9.2f}{errors:>8}{allocated:>9.1f}"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Cold-start benchmark for the Vercel tool.
+
+Each scenario runs in a fresh interpreter so that nothing is cached in `sys.modules`:
+
+- `pydantic`: import pydantic only, the floor every action pays for its models.
+- `tool`: import the tool module only.
+- `one action`: import the tool and resolve a single action, the common case for a worker.
+- `all actions`: import the tool and resolve every action, which is what importing the tool used to cost
+  when the actions package imported all action modules eagerly.
+
+Run from the directory containing the `vercel` package, with `shared.composio_tools` importable:
+
+    python -m vercel.benchmarks.import_time --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "pydantic": "import pydantic",
+    "tool": "import vercel.vercel_tool",
+    "one action": "from vercel.vercel_tool import Vercel; Vercel().action('FindProjectAction')",
+    "all actions": "from vercel.vercel_tool import Vercel; Vercel().actions()",
+}
+
+_TIMER = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, repeat: int) -> list:
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="0")
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _TIMER.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters started per scenario.")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so the first scenario does not pay for compilation.
+    measure(SCENARIOS["all actions"], 1)
+
+    results = {name: measure(code, args.repeat) for name, code in SCENARIOS.items()}
+    print(f"{'scenario':<14}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for name, samples in results.items():
+        print(f"{name:<14}{statistics.median(samples):>12.2f}{min(samples):>10.2f}{max(samples):>10.2f}")
+
+    eager = statistics.median(results["all actions"])
+    lazy = statistics.median(results["one action"])
+    print(f"\nresolving one action costs {lazy / eager:.0%} of loading every action")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Micro-benchmark of the JSON codecs of `vercel.codec` on realistic Vercel payloads.
+
+For every available codec it reports the cost of encoding and decoding:
+
+- `create body`: a `CreateProjectAction` body as built from a request, `None` fields included and dropped.
+- `project`: a project as returned by `FindProjectAction`, with its latest deployments, link and targets.
+- `env list`: a `GetEnvVarsAction` response with `--envs` environment variables.
+
+Run from the directory containing the `vercel` package:
+
+    python -m vercel.benchmarks.json_codec --number 2000
+"""
+
+import argparse
+import timeit
+
+from ..codec import JSONCodec, OrjsonCodec, drop_none
+
+
+def _deployment(i: int) -> dict:
+    return {
+        "uid": f"dpl_{i:024d}",
+        "name": "web",
+        "url": f"web-{i:08x}-acme.vercel.app",
+        "createdAt": 1700000000000 + i,
+        "readyState": "READY",
+        "target": "production" if i % 3 == 0 else None,
+        "creator": {"uid": "usr_000000000000000000000001", "username": "acme-bot", "githubLogin": "acme-bot"},
+        "meta": {
+            "githubCommitSha": f"{i:040x}",
+            "githubCommitMessage": f"Merge pull request #{1000 + i} from acme/feature-{i}",
+            "githubCommitRef": "main",
+            "githubRepo": "web",
+            "githubOrg": "acme",
+        },
+        "aliasAssigned": True,
+        "aliasError": None,
+    }
+
+
+def project_payload(deployments: int = 10) -> dict:
+    return {
+        "id": "prj_0123456789abcdef01234567",
+        "name": "web",
+        "accountId": "team_0123456789abcdef01234567",
+        "framework": "nextjs",
+        "nodeVersion": "20.x",
+        "buildCommand": None,
+        "devCommand": None,
+        "installCommand": "pnpm install --frozen-lockfile",
+        "outputDirectory": None,
+        "rootDirectory": "apps/web",
+        "publicSource": False,
+        "serverlessFunctionRegion": "iad1",
+        "createdAt": 1690000000000,
+        "updatedAt": 1700000000000,
+        "paused": False,
+        "link": {
+            "type": "github",
+            "repo": "web",
+            "repoId": 123456789,
+            "org": "acme",
+            "gitCredentialId": "cred_0123456789abcdef",
+            "productionBranch": "main",
+            "deployHooks": [{"id": f"hook{i}", "name": f"hook-{i}", "ref": "main", "url": f"https://api.vercel.com/v1/integrations/deploy/prj/{i}"} for i in range(3)],
+        },
+        "latestDeployments": [_deployment(i) for i in range(deployments)],
+        "targets": {"production": _deployment(0)},
+    }
+
+
+def env_list_payload(envs: int = 100) -> dict:
+    return {
+        "envs": [
+            {
+                "id": f"{i:016x}",
+                "key": f"SERVICE_{i}_URL",
+                "value": f"https://service-{i}.internal.acme.dev/api/v1?token={'x' * 24}",
+                "type": "encrypted",
+                "target": ["production", "preview"],
+                "gitBranch": None,
+                "createdAt": 1690000000000 + i,
+                "updatedAt": 1700000000000 + i,
+                "comment": "",
+            }
+            for i in range(envs)
+        ]
+    }
+
+
+def create_body() -> dict:
+    return {
+        "name": "web",
+        "description": None,
+        "buildCommand": None,
+        "commandForIgnoringBuildStep": None,
+        "devCommand": None,
+        "framework": "nextjs",
+        "gitRepository": {"name": "acme/web", "type": "github"},
+        "installCommand": None,
+        "outputDirectory": None,
+        "publicSource": None,
+        "rootDirectory": "apps/web",
+        "serverlessFunctionRegion": None,
+    }
+
+
+def codecs() -> list:
+    available = [JSONCodec()]
+    try:
+        available.append(OrjsonCodec())
+    except ImportError:
+        print("orjson is not installed, only the stdlib codec is measured.")
+    return available
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=1000, help="Calls per measurement.")
+    parser.add_argument("--repeat", type=int, default=5, help="Measurements per case, the best one is reported.")
+    parser.add_argument("--envs", type=int, default=100, help="Environment variables in the env list payload.")
+    args = parser.parse_args()
+
+    payloads = {
+        "create body": lambda: drop_none(create_body()),
+        "project": project_payload,
+        "env list": lambda: env_list_payload(args.envs),
+    }
+
+    print(f"{'payload':<13}{'codec':<8}{'bytes':>8}{'encode µs':>11}{'decode µs':>11}")
+    for name, build in payloads.items():
+        payload = build()
+        for codec in codecs():
+            encoded = codec.dumps(payload)
+            assert codec.loads(encoded) == payload
+            encode = min(timeit.repeat(lambda: codec.dumps(payload), number=args.number, repeat=args.repeat))
+            decode = min(timeit.repeat(lambda: codec.loads(encoded), number=args.number, repeat=args.repeat))
+            print(f"{name:<13}{codec.name:<8}{len(encoded):>8}{encode / args.number * 1e6:>11.2f}{decode / args.number * 1e6:>11.2f}")
+
+    build_cost = min(timeit.repeat(lambda: drop_none(create_body()), number=args.number, repeat=args.repeat))
+    print(f"\ndrop_none on the create body: {build_cost / args.number * 1e6:.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""
+In-process stand-in for the parts of the Vercel REST API used by the Vercel actions.
+
+The server keeps projects, environment variables and domains in memory and answers on the same paths
+as api.vercel.com, so the actions can be pointed at it with
+`configure_transport(base_url=mock.url)`. Latency, server errors and rate limiting can be injected to
+exercise the transport's pacing and retries, and tokens added to `revoked` are answered `401`.
+
+    with MockVercelAPI(latency=0.02, error_rate=0.01, rate_limit=100) as mock:
+        configure_transport(base_url=mock.url)
+        ...
+"""
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class MockState:
+    """The in-memory projects, environment variables and domains served by `MockVercelAPI`."""
+
+    def __init__(self):
+        self.projects = {}
+        self.envs = {}
+        self.domains = {}
+        self._lock = threading.Lock()
+
+    def add_project(self, name: str, **fields) -> dict:
+        with self._lock:
+            project_id = f"prj_{uuid.uuid4().hex[:24]}"
+            now = int(time.time() * 1000)
+            project = {"id": project_id, "name": name, "framework": None, "paused": False, "createdAt": now, "updatedAt": now}
+            project.update(fields)
+            self.projects[project_id] = project
+            self.envs[project_id] = []
+            self.domains[project_id] = []
+            return project
+
+    def add_env(self, project_id: str, key: str, value: str, type: str = "encrypted", target: list = None, comment: str = None) -> dict:
+        with self._lock:
+            env = {
+                "id": uuid.uuid4().hex[:16],
+                "key": key,
+                "value": value,
+                "type": type,
+                "target": target or ["production", "preview", "development"],
+                "updatedAt": int(time.time() * 1000),
+            }
+            if comment:
+                env["comment"] = comment
+            self.envs[project_id].append(env)
+            return env
+
+    def find(self, id_or_name: str) -> dict:
+        project = self.projects.get(id_or_name)
+        if project is not None:
+            return project
+        for project in self.projects.values():
+            if project["name"] == id_or_name:
+                return project
+        return None
+
+
+class _Reply(Exception):
+    def __init__(self, status: int, body=None, headers: dict = None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+
+def _not_found(what: str):
+    return _Reply(404, {"error": {"code": "not_found", "message": f"{what} not found"}})
+
+
+class MockVercelAPI:
+    """
+    Local HTTP server emulating the Vercel endpoints the actions call.
+
+    Args:
+        latency: Seconds added to every response, or a `(min, max)` range to draw from uniformly.
+        error_rate: The probability of answering a request with a 503.
+        rate_limit: Requests allowed per credential per `rate_limit_window`; exceeding it answers 429. `None` disables it.
+        rate_limit_window: The rate-limit window, in seconds.
+        seed: Seeds the random generator used for latency and error injection.
+        etags: Whether successful GETs carry an ETag and honour `If-None-Match` with a 304.
+    """
+
+    _ROUTES = [
+        ("GET", r"/v1/account", "_get_account"),
+        ("GET", r"/v9/projects", "_list_projects"),
+        ("POST", r"/v12/projects", "_create_project"),
+        ("GET", r"/v5/projects/(?P<project>[^/]+)", "_get_project"),
+        ("PATCH", r"/v5/projects/(?P<project>[^/]+)", "_update_project"),
+        ("DELETE", r"/v9/projects/(?P<project>[^/]+)", "_delete_project"),
+        ("POST", r"/v1/projects/(?P<project>[^/]+)/pause", "_pause_project"),
+        ("POST", r"/v5/projects/(?P<project>[^/]+)/unpause", "_unpause_project"),
+        ("GET", r"/v9/projects/(?P<project>[^/]+)/env", "_list_envs"),
+        ("POST", r"/v5/projects/(?P<project>[^/]+)/env", "_create_env"),
+        ("POST", r"/v10/projects/(?P<project>[^/]+)/env", "_create_envs"),
+        ("PATCH", r"/v9/projects/(?P<project>[^/]+)/env/(?P<env>[^/]+)", "_edit_env"),
+        ("DELETE", r"/v9/projects/(?P<project>[^/]+)/env/(?P<env>[^/]+)", "_delete_env"),
+        ("POST", r"/v10/projects/(?P<project>[^/]+)/domains", "_add_domain"),
+    ]
+
+    def __init__(self, latency=0.0, error_rate: float = 0.0, rate_limit: int = None, rate_limit_window: float = 60.0, seed: int = None, etags: bool = True):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.etags = etags
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.state = MockState()
+        self.requests = 0
+        self.revoked = set()
+        self._random = random.Random(seed)
+        self._windows = {}
+        self._lock = threading.Lock()
+        self._routes = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in self._ROUTES]
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockVercelAPI":
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Send headers and body in one segment, otherwise Nagle and delayed ACKs add ~40ms per response.
+            wbufsize = 64 * 1024
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self):
+                api._serve(self)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = do_HEAD = _handle
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+            request_queue_size = 1024
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="mock-vercel-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "MockVercelAPI":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _serve(self, handler: BaseHTTPRequestHandler) -> None:
+        length = int(handler.headers.get("Content-Length") or 0)
+        raw = handler.rfile.read(length) if length else b""
+        with self._lock:
+            self.requests += 1
+            delay = self._random.uniform(*self.latency) if isinstance(self.latency, tuple) else self.latency
+            fail = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        headers, limited = self._rate_limit_headers(handler.headers.get("Authorization", ""))
+        try:
+            if handler.headers.get("Authorization", "").removeprefix("Bearer ") in self.revoked:
+                raise _Reply(401, {"error": {"code": "forbidden", "message": "The token is not valid"}})
+            if limited:
+                headers["Retry-After"] = str(max(0, int(float(headers["X-RateLimit-Reset"]) - time.time())))
+                raise _Reply(429, {"error": {"code": "rate_limited", "message": "Rate limit exceeded"}})
+            if fail:
+                raise _Reply(503, {"error": {"code": "internal_server_error", "message": "Injected failure"}})
+            status, body = self._dispatch(handler.command, handler.path, raw)
+        except _Reply as reply:
+            status, body = reply.status, reply.body
+            headers.update(reply.headers)
+
+        payload = b"" if body is None or handler.command == "HEAD" else json.dumps(body).encode()
+        if self.etags and handler.command == "GET" and status == 200:
+            headers["ETag"] = f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+            if handler.headers.get("If-None-Match") == headers["ETag"]:
+                status, payload = 304, b""
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        if payload:
+            handler.send_header("Content-Type", "application/json; charset=utf-8")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _rate_limit_headers(self, credential: str) -> tuple:
+        if self.rate_limit is None:
+            return {}, False
+        now = time.time()
+        with self._lock:
+            start, count = self._windows.get(credential, (now, 0))
+            if now - start >= self.rate_limit_window:
+                start, count = now, 0
+            count += 1
+            self._windows[credential] = (start, count)
+        headers = {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(0, self.rate_limit - count)),
+            "X-RateLimit-Reset": str(int(start + self.rate_limit_window)),
+        }
+        return headers, count > self.rate_limit
+
+    def _dispatch(self, method: str, target: str, raw: bytes) -> tuple:
+        parts = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        body = json.loads(raw) if raw else None
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(parts.path)
+            if match and route_method == method:
+                return getattr(self, handler)(body=body, query=query, **match.groupdict())
+        if method == "HEAD":
+            return 200, None
+        raise _Reply(404, {"error": {"code": "not_found", "message": f"No route for {method} {parts.path}"}})
+
+    def _project(self, project: str) -> dict:
+        found = self.state.find(project)
+        if found is None:
+            raise _not_found("Project")
+        return found
+
+    def _get_account(self, body, query):
+        return 200, {"user": {"id": "user_mock", "username": "mock", "email": "mock@example.com", "defaultTeamId": None}}
+
+    def _list_projects(self, body, query):
+        limit = int(query.get("limit", 20))
+        projects = sorted(self.state.projects.values(), key=lambda project: project["updatedAt"], reverse=True)
+        if "search" in query:
+            projects = [project for project in projects if query["search"] in project["name"]]
+        if "from" in query:
+            projects = [project for project in projects if project["updatedAt"] < int(query["from"])]
+        page = projects[:limit]
+        next_cursor = page[-1]["updatedAt"] if len(projects) > limit else None
+        return 200, {"projects": page, "pagination": {"count": len(page), "next": next_cursor, "prev": None}}
+
+    def _create_project(self, body, query):
+        if self.state.find(body["name"]) is not None:
+            raise _Reply(409, {"error": {"code": "conflict", "message": "Project already exists"}})
+        fields = {key: value for key, value in body.items() if key not in ("name", "gitRepository") and value is not None}
+        return 200, self.state.add_project(body["name"], **fields)
+
+    def _get_project(self, body, query, project):
+        return 200, self._project(project)
+
+    def _update_project(self, body, query, project):
+        found = self._project(project)
+        found.update(body or {})
+        found["updatedAt"] = int(time.time() * 1000)
+        return 200, found
+
+    def _delete_project(self, body, query, project):
+        found = self._project(project)
+        with self.state._lock:
+            self.state.projects.pop(found["id"], None)
+            self.state.envs.pop(found["id"], None)
+            self.state.domains.pop(found["id"], None)
+        return 204, None
+
+    def _pause_project(self, body, query, project):
+        self._project(project)["paused"] = True
+        return 200, {}
+
+    def _unpause_project(self, body, query, project):
+        self._project(project)["paused"] = False
+        return 200, {}
+
+    def _list_envs(self, body, query, project):
+        return 200, {"envs": self.state.envs[self._project(project)["id"]]}
+
+    def _create_env(self, body, query, project):
+        return 200, self._upsert_envs(project, [body], upsert=False)["created"][0]
+
+    def _create_envs(self, body, query, project):
+        items = body if isinstance(body, list) else [body]
+        return 201, self._upsert_envs(project, items, upsert=query.get("upsert") == "true")
+
+    def _upsert_envs(self, project: str, items: list, upsert: bool) -> dict:
+        project_id = self._project(project)["id"]
+        created, failed = [], []
+        for item in items:
+            target = set(item.get("target") or ["production", "preview", "development"])
+            existing = next(
+                (env for env in self.state.envs[project_id] if env["key"] == item["key"] and target & set(env["target"])),
+                None,
+            )
+            if existing is None:
+                created.append(self.state.add_env(project_id, item["key"], item["value"], item.get("type", "encrypted"), sorted(target), item.get("comment")))
+            elif upsert:
+                existing.update(value=item["value"], type=item.get("type", existing["type"]), updatedAt=int(time.time() * 1000))
+                created.append(existing)
+            else:
+                failed.append({"error": {"code": "ENV_ALREADY_EXISTS", "message": f"The variable {item['key']} already exists", "envVarKey": item["key"]}})
+        if not created and failed and len(items) == 1 and not upsert:
+            raise _Reply(400, failed[0])
+        return {"created": created, "failed": failed}
+
+    def _find_env(self, project: str, env: str) -> tuple:
+        envs = self.state.envs[self._project(project)["id"]]
+        for found in envs:
+            if found["id"] == env:
+                return envs, found
+        raise _not_found("Environment variable")
+
+    def _edit_env(self, body, query, project, env):
+        _, found = self._find_env(project, env)
+        found.update(body or {})
+        found["updatedAt"] = int(time.time() * 1000)
+        return 200, found
+
+    def _delete_env(self, body, query, project, env):
+        envs, found = self._find_env(project, env)
+        envs.remove(found)
+        return 200, found
+
+    def _add_domain(self, body, query, project):
+        project_id = self._project(project)["id"]
+        domain = {"name": body["name"], "projectId": project_id, "verified": True}
+        domain.update({key: value for key, value in body.items() if key != "name"})
+        self.state.domains[project_id].append(domain)
+        return 200, domain
+
+
+__all__ = ["MockState", "MockVercelAPI"]
@@ -0,0 +1,201 @@
+import threading
+import time
+from collections import OrderedDict
+
+from .project_index import get_project_index
+
+
+class ResponseCache:
+    """
+    In-process read-through cache for Vercel project and environment-variable reads.
+
+    Entries are keyed by `(credential, kind, project)` where `credential` is a credential fingerprint,
+    `kind` names the resource (e.g. `"project"`, `"env"`) and `project` is the ID or name used in the
+    request. Each entry also records the other identifiers it is known by (the project ID and name
+    from the response, or from the project index, see `vercel.project_index`) so that a write addressed
+    by ID invalidates a read cached by name and vice versa. An entry known by its request identifier
+    only, such as an env var list of a project the index has not seen, is dropped by a write to any
+    project that the index cannot tell apart from it.
+
+    Entries expire after `ttl` seconds and the least recently used entries are evicted once either
+    `max_entries` or `max_bytes` (measured as the size of the raw response bodies) is exceeded.
+    Cached values are shared between callers and must be treated as read-only.
+
+    Entries stored with a `validator` (the response's ETag/Last-Modified and a digest of its body) are
+    kept after they expire, until evicted or invalidated, so that the next read can revalidate them
+    with a conditional request (see `stale` and `refresh`) instead of downloading and decoding the
+    body again.
+
+    Invalidation generations are kept for at most `max_entries` recently invalidated credentials. A
+    generation dropped from that set raises a floor shared by every credential instead, so reads in flight
+    when it was dropped are still not cached.
+
+    Args:
+        ttl: Seconds an entry stays fresh.
+        max_entries: The maximum number of entries kept.
+        max_bytes: The maximum total size, in bytes, of the response bodies kept.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 1024, max_bytes: int = 16 * 1024 * 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._aliases = {}
+        self._unresolved = {}
+        self._generations = OrderedDict()
+        self._floor = 0
+        self._counter = 0
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._bytes
+
+    def generation(self, credential: str) -> int:
+        """
+        Return the invalidation generation of `credential`.
+
+        Read it before issuing a request and pass it to `set`: if a write invalidated the credential's
+        entries while the read was in flight, the (possibly stale) response is not cached.
+        """
+        return max(self._generations.get(credential, 0), self._floor)
+
+    def get(self, credential: str, kind: str, project: str):
+        key = (credential, kind, project)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, _, expires_at, _, validator = entry
+            if expires_at <= time.monotonic():
+                if validator is None:
+                    self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def stale(self, credential: str, kind: str, project: str) -> tuple:
+        """Return `(value, validator)` of the entry, fresh or expired, when it can be revalidated, else `(None, None)`."""
+        with self._lock:
+            entry = self._entries.get((credential, kind, project))
+        if entry is None or entry[4] is None:
+            return None, None
+        return entry[0], entry[4]
+
+    def refresh(self, credential: str, kind: str, project: str, generation: int = None) -> bool:
+        """Mark a revalidated entry fresh for another `ttl`. Returns `False` if it was invalidated meanwhile."""
+        key = (credential, kind, project)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (generation is not None and generation != self.generation(credential)):
+                return False
+            self._entries[key] = (entry[0], entry[1], time.monotonic() + self.ttl, entry[3], entry[4])
+            self._entries.move_to_end(key)
+            return True
+
+    def set(self, credential: str, kind: str, project: str, value, size: int, aliases: tuple = (), generation: int = None, validator: dict = None) -> None:
+        if size > self.max_bytes:
+            return
+        key = (credential, kind, project)
+        identifiers = {project, *(alias for alias in aliases if alias)} | get_project_index().identifiers(credential, project)
+        with self._lock:
+            if generation is not None and generation != self.generation(credential):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.monotonic() + self.ttl, identifiers, validator)
+            self._bytes += size
+            for identifier in identifiers:
+                self._aliases.setdefault((credential, identifier), set()).add(key)
+            if len(identifiers) == 1:
+                self._unresolved.setdefault(credential, set()).add(key)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_project(self, credential: str, project: str) -> None:
+        """
+        Drop every entry of `credential` that refers to `project`, by ID or by name.
+
+        With `credential` set to `None` the project's entries are dropped under every credential that may have
+        it cached, for changes that are not tied to one, such as those reported by webhooks (see
+        `vercel.triggers`): the credentials with an entry known by `project`, and the ones with entries known
+        by a single identifier that may be it. The generations of the other credentials are left alone.
+        """
+        with self._lock:
+            if credential is not None:
+                self._invalidate(credential, project)
+                return
+            credentials = {credential for credential, identifier in self._aliases if identifier == project}
+            for credential in credentials | set(self._unresolved):
+                self._invalidate(credential, project)
+
+    def _invalidate(self, credential: str, project: str) -> None:
+        self._counter += 1
+        self._generations[credential] = self._counter
+        self._generations.move_to_end(credential)
+        while len(self._generations) > self.max_entries:
+            _, dropped = self._generations.popitem(last=False)
+            self._floor = max(self._floor, dropped)
+        index = get_project_index()
+        identifiers = index.identifiers(credential, project)
+        for key in self._aliases.get((credential, project), ()):
+            identifiers.update(self._entries[key][3])
+        for identifier in identifiers:
+            for key in list(self._aliases.get((credential, identifier), ())):
+                self._remove(key)
+        # Entries known by a single identifier, e.g. env var lists cached under a name the index does not know,
+        # may be the same project under its other identifier: they are kept only when they are known not to be.
+        project_id = index.resolve(credential, project)
+        for key in list(self._unresolved.get(credential, ())):
+            other_id = index.resolve(credential, key[2])
+            if project_id is None or other_id is None or other_id == project_id:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._unresolved.clear()
+            self._generations.clear()
+            self._counter += 1
+            self._floor = self._counter
+            self._bytes = 0
+
+    def _remove(self, key: tuple) -> None:
+        _, size, _, identifiers, _ = self._entries.pop(key)
+        self._bytes -= size
+        credential = key[0]
+        for identifier in identifiers:
+            keys = self._aliases.get((credential, identifier))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._aliases[(credential, identifier)]
+        unresolved = self._unresolved.get(credential)
+        if unresolved is not None:
+            unresolved.discard(key)
+            if not unresolved:
+                del self._unresolved[credential]
+
+
+_cache = ResponseCache()
+
+
+def get_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    return _cache
+
+
+def configure_cache(**kwargs) -> ResponseCache:
+    """Replace the process-wide response cache with one built from `kwargs` (see `ResponseCache`)."""
+    global _cache
+    _cache = ResponseCache(**kwargs)
+    return _cache
+
+
+__all__ = ["ResponseCache", "configure_cache", "get_cache"]
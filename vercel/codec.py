@@ -0,0 +1,93 @@
+import json
+import threading
+
+
+class JSONCodec:
+    """
+    Encodes request bodies straight to UTF-8 bytes and decodes response bodies, using the stdlib `json`.
+
+    Every Vercel action goes through the process-wide codec returned by `get_codec`; subclass this to
+    plug in another JSON backend.
+    """
+
+    name = "json"
+
+    def dumps(self, value) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """`JSONCodec` backed by `orjson`. Raises `ImportError` when orjson is not installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, value) -> bytes:
+        return self._dumps(value)
+
+    def loads(self, data):
+        return self._loads(data)
+
+
+def drop_none(value):
+    """
+    Return `value` without the `None` members of its objects, recursively.
+
+    Objects that only held `None` members are dropped as well, so `{"gitRepository": {"name": None}}`
+    becomes `{}`. List elements are cleaned but never removed.
+    """
+    if isinstance(value, dict):
+        cleaned = {}
+        for key, member in value.items():
+            if member is None:
+                continue
+            if isinstance(member, (dict, list)):
+                pruned = drop_none(member)
+                if isinstance(member, dict) and member and not pruned:
+                    continue
+                member = pruned
+            cleaned[key] = member
+        return cleaned
+    if isinstance(value, list):
+        return [drop_none(item) if isinstance(item, (dict, list)) else item for item in value]
+    return value
+
+
+def _default_codec() -> JSONCodec:
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JSONCodec()
+
+
+_codec = None
+_codec_lock = threading.Lock()
+
+
+def get_codec() -> JSONCodec:
+    """Return the process-wide codec, `OrjsonCodec` when orjson is installed and `JSONCodec` otherwise."""
+    global _codec
+    if _codec is None:
+        with _codec_lock:
+            if _codec is None:
+                _codec = _default_codec()
+    return _codec
+
+
+def configure_codec(codec: JSONCodec = None) -> JSONCodec:
+    """Replace the process-wide codec. `None` restores the default choice."""
+    global _codec
+    with _codec_lock:
+        _codec = codec if codec is not None else _default_codec()
+    return _codec
+
+
+__all__ = ["JSONCodec", "OrjsonCodec", "configure_codec", "drop_none", "get_codec"]
@@ -0,0 +1,184 @@
+"""
+Cached validation of Vercel connections.
+
+Validating a connection asks the account endpoint the manifest declares (`get_current_user_endpoint`)
+who the token belongs to. The identity and team scope it returns are cached per credential fingerprint
+for `ttl` seconds, so validating before every agent session costs a round trip only once per token and
+TTL. Any action receiving a 401 or 403 for a credential drops its entry (see `VercelTransport.request`),
+so a revoked or narrowed token is validated against the API again on the next call.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from tool_runtime.credentials import credential_fingerprint
+
+from .oauth import authorised_headers, authorised_headers_async
+from .singleflight import get_singleflight
+from .transport import AUTH_FAILURE_STATUSES, get_transport
+
+ACCOUNT_PATH = "/v1/account"
+
+
+class ConnectionCache:
+    """
+    Per-credential results of successful connection validations, see the module documentation.
+
+    Like `ResponseCache`, each credential has an invalidation generation: a validation started before an
+    invalidation of its credential is not cached when it completes. Generations are kept for at most
+    `max_entries` recently invalidated credentials, a dropped one raising the floor every credential's
+    generation starts from.
+
+    Args:
+        ttl: Seconds a validation stays valid.
+        max_entries: The maximum number of credentials kept.
+    """
+
+    def __init__(self, ttl: float = 900.0, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._generations = OrderedDict()
+        self._floor = 0
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generation(self, credential: str) -> int:
+        return max(self._generations.get(credential, 0), self._floor)
+
+    def get(self, credential: str):
+        with self._lock:
+            entry = self._entries.get(credential)
+            if entry is None:
+                return None
+            expires_at, connection = entry
+            if expires_at <= time.monotonic():
+                del self._entries[credential]
+                return None
+            self._entries.move_to_end(credential)
+            return connection
+
+    def set(self, credential: str, connection: dict, generation: int) -> None:
+        with self._lock:
+            if self.generation(credential) != generation:
+                return
+            self._entries[credential] = (time.monotonic() + self.ttl, connection)
+            self._entries.move_to_end(credential)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, credential: str) -> None:
+        with self._lock:
+            self._entries.pop(credential, None)
+            self._counter += 1
+            self._generations[credential] = self._counter
+            self._generations.move_to_end(credential)
+            while len(self._generations) > self.max_entries:
+                _, dropped = self._generations.popitem(last=False)
+                self._floor = max(self._floor, dropped)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._counter += 1
+            self._floor = self._counter
+
+
+def _refusal(response) -> dict:
+    try:
+        body = response.json() if response.content else {}
+    except ValueError:
+        body = None
+    error = body.get("error") if isinstance(body, dict) else None
+    message = error.get("message") if isinstance(error, dict) else None
+    return {"valid": False, "status": response.status_code, "error": message}
+
+
+def _connection(response) -> dict:
+    if response.status_code in AUTH_FAILURE_STATUSES:
+        return _refusal(response)
+    response.raise_for_status()
+    body = response.json() if response.content else {}
+    user = body.get("user", body)
+    return {
+        "valid": True,
+        "user": {key: user.get(key) for key in ("id", "username", "email", "name")},
+        "team_id": body.get("teamId") or user.get("defaultTeamId"),
+        "validated_at": time.time(),
+    }
+
+
+def validate_connection(authorisation_data: dict, force: bool = False) -> dict:
+    """
+    Return the identity behind `authorisation_data`: `{"valid", "user", "team_id", "validated_at", "cached"}`.
+
+    A credential the API refuses gives `{"valid": False, "status", "error", "cached": False}` and is not
+    cached; other errors are raised. `force` skips the cache. Concurrent validations of the same
+    credential share one request.
+    """
+    headers = authorised_headers(authorisation_data)
+    credential = credential_fingerprint(headers)
+    cache = get_connection_cache()
+    connection = None if force else cache.get(credential)
+    if connection is not None:
+        return {**connection, "cached": True}
+    generation = cache.generation(credential)
+
+    def fetch():
+        transport = get_transport()
+        connection = _connection(transport.request("GET", f"{transport.base_url}{ACCOUNT_PATH}", headers=headers))
+        if connection["valid"]:
+            cache.set(credential, connection, generation)
+        return connection
+
+    return {**get_singleflight().do(("connection", credential), fetch), "cached": False}
+
+
+async def validate_connection_async(authorisation_data: dict, force: bool = False) -> dict:
+    """Asyncio counterpart of `validate_connection`."""
+    headers = await authorised_headers_async(authorisation_data)
+    credential = credential_fingerprint(headers)
+    cache = get_connection_cache()
+    connection = None if force else cache.get(credential)
+    if connection is not None:
+        return {**connection, "cached": True}
+    generation = cache.generation(credential)
+
+    async def fetch():
+        transport = get_transport()
+        connection = _connection(await transport.request_async("GET", f"{transport.base_url}{ACCOUNT_PATH}", headers=headers))
+        if connection["valid"]:
+            cache.set(credential, connection, generation)
+        return connection
+
+    return {**await get_singleflight().do_async(("connection", credential), fetch), "cached": False}
+
+
+_cache = ConnectionCache()
+
+
+def get_connection_cache() -> ConnectionCache:
+    """Return the process-wide connection cache."""
+    return _cache
+
+
+def configure_connection_cache(**kwargs) -> ConnectionCache:
+    """Replace the process-wide connection cache with one built from `kwargs` (see `ConnectionCache`)."""
+    global _cache
+    _cache = ConnectionCache(**kwargs)
+    return _cache
+
+
+__all__ = [
+    "ACCOUNT_PATH",
+    "ConnectionCache",
+    "configure_connection_cache",
+    "get_connection_cache",
+    "validate_connection",
+    "validate_connection_async",
+]
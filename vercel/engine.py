@@ -0,0 +1,541 @@
+import hashlib
+import string
+import time
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import quote
+
+from pydantic import BaseModel
+
+from shared.composio_tools.lib import Action
+from tool_runtime.credentials import credential_fingerprint
+
+from .cache import get_cache
+from .codec import drop_none, get_codec
+from .instrumentation import Span, begin_call, end_call, histogram
+from .jsonstream import compile_paths
+from .jsonstream import loads as stream_loads
+from .oauth import authorised_headers, authorised_headers_async
+from .project_index import get_project_index, resolve_project_id, resolve_project_id_async
+from .singleflight import get_singleflight
+from .transport import get_transport
+
+
+@dataclass(frozen=True)
+class ActionSpec:
+    """
+    Declarative description of the Vercel endpoint behind an action.
+
+    Attributes:
+        method: The HTTP method.
+        path: The versioned path template, e.g. `"/v9/projects/{project_id_or_name}/env"`. Placeholders name request fields.
+        body: Maps request fields to JSON body keys. Fields that are unset or empty are left out.
+        query: Maps request fields to query parameters. Fields that are unset are left out.
+        build_body: Builds the JSON body from the request, for payloads that are not a flat field mapping. Takes precedence over
+            `body`. `None` members of the built body are dropped (see `vercel.codec.drop_none`).
+        idempotent: Overrides whether the request may be retried, see `RetryPolicy.is_retryable`.
+        cache: The resource kind successful responses are cached under (see `vercel.cache`), for reads of a single project.
+        cache_aliases: The response keys holding other identifiers of the cached project, e.g. its ID and name.
+        invalidates: The request field naming the project whose cached reads are dropped once the request completes.
+        fields: The request field holding dotted JSON paths to keep from the response, e.g. `["id", "link.repo"]`. When the
+            request sets it, the response is decoded incrementally and everything else is skipped without being decoded.
+        items: The top-level response key holding the list the `fields` paths apply to, e.g. `"envs"`. Other top-level keys are dropped.
+        projects: Where successful responses hold projects to record in the project index (see `vercel.project_index`):
+            `"."` for a project returned at the top level, otherwise the key of a list of projects, e.g. `"projects"`.
+        resolves: The request field the endpoint requires a project ID in. A project name given there is turned into its ID
+            through the project index, looking the project up only when the name is not indexed yet.
+        deletes: The request field naming the project the request deletes, dropped from the project index.
+    """
+
+    method: str
+    path: str
+    body: dict = None
+    query: dict = None
+    build_body: Callable = None
+    idempotent: bool = None
+    cache: str = None
+    cache_aliases: tuple = ()
+    invalidates: str = None
+    fields: str = None
+    items: str = None
+    projects: str = None
+    resolves: str = None
+    deletes: str = None
+
+
+def validate_request(schema: type, request, span: Span = None) -> BaseModel:
+    """Build a `schema` request model from `request` when it is a plain dict, timing it into `span`."""
+    if not isinstance(request, dict) or schema is None:
+        return request
+    start = time.perf_counter()
+    request = schema.model_validate(request)
+    if span is not None:
+        span.add("validate", time.perf_counter() - start)
+    return request
+
+
+def run_action(name: str, schema: type, request, authorisation_data: dict, work: Callable, method: str = None, endpoint: str = None) -> dict:
+    """
+    Run one call of the action `name` and return its `execution_details`/`response_data` result.
+
+    Resolves the connection's headers, validates `request` against `schema`, then calls
+    `work(request, headers, span)`, which returns `(success, response)`. The call is timed into the
+    action's histogram and handed to the instrumentation hooks; any exception is reported as a failed
+    response instead of being raised.
+    """
+    start, span = time.perf_counter(), None
+    execution_details = {"executed": False}
+    response_data = {"success": False, "response": None}
+
+    try:
+        start, span = begin_call(name, method, endpoint)
+        headers = authorised_headers(authorisation_data)
+        request = validate_request(schema, request, span)
+        response_data["success"], response_data["response"] = work(request, headers, span)
+        execution_details["executed"] = True
+
+    except Exception as e:
+        response_data["response"] = str(e)
+
+    end_call(histogram(name), start, span, response_data)
+    return {"execution_details": execution_details, "response_data": response_data}
+
+
+async def run_action_async(name: str, schema: type, request, authorisation_data: dict, work: Callable, method: str = None, endpoint: str = None) -> dict:
+    """Asyncio counterpart of `run_action`, `work` being a coroutine function."""
+    start, span = time.perf_counter(), None
+    execution_details = {"executed": False}
+    response_data = {"success": False, "response": None}
+
+    try:
+        start, span = begin_call(name, method, endpoint)
+        headers = await authorised_headers_async(authorisation_data)
+        request = validate_request(schema, request, span)
+        response_data["success"], response_data["response"] = await work(request, headers, span)
+        execution_details["executed"] = True
+
+    except Exception as e:
+        response_data["response"] = str(e)
+
+    end_call(histogram(name), start, span, response_data)
+    return {"execution_details": execution_details, "response_data": response_data}
+
+
+# Size of the chunks projected responses are read and decoded in.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _is_empty(value) -> bool:
+    return value is None or (isinstance(value, (str, list, dict)) and not value)
+
+
+def _decode(response):
+    content = response.content
+    return get_codec().loads(content) if content else {}
+
+
+class _Counted:
+    """Iterates over the body chunks of a response, counting the bytes read."""
+
+    __slots__ = ("_chunks", "size")
+
+    def __init__(self, response, chunks: list = None):
+        if chunks is None:
+            iter_content = getattr(response, "iter_content", None)
+            chunks = iter_content(STREAM_CHUNK_SIZE) if iter_content is not None else response.iter_bytes()
+        self._chunks = chunks
+        self.size = 0
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            self.size += len(chunk)
+            yield chunk
+
+
+async def _read_async(response, span: Span) -> list:
+    """Read the body of a response sent with `stream=True` in `STREAM_CHUNK_SIZE` chunks and close it."""
+    start = time.perf_counter() if span is not None else 0.0
+    try:
+        return [chunk async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE)]
+    finally:
+        await response.aclose()
+        if span is not None:
+            span.add("decode", time.perf_counter() - start)
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def _validator(response, digest: str):
+    """Return what a cached response can later be revalidated with, or `None` if nothing."""
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag is None and last_modified is None and digest is None:
+        return None
+    return {"etag": etag, "last_modified": last_modified, "digest": digest}
+
+
+def _conditional(headers: dict, validator: dict) -> dict:
+    if not validator or (validator["etag"] is None and validator["last_modified"] is None):
+        return headers
+    headers = dict(headers)
+    if validator["etag"] is not None:
+        headers["If-None-Match"] = validator["etag"]
+    if validator["last_modified"] is not None:
+        headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
+
+
+def _encode(body) -> bytes:
+    return get_codec().dumps(body)
+
+
+def _json_headers(headers: dict) -> dict:
+    if headers.get("Content-Type") == "application/json":
+        return headers
+    return {**headers, "Content-Type": "application/json"}
+
+
+class CompiledSpec:
+    """
+    Executor for one `ActionSpec`.
+
+    Everything that does not depend on the request (the path split into literals and fields, the body
+    and query field mappings, the cache settings) is worked out once here, so a call only reads the
+    request fields and formats the URL.
+
+    Every call is timed into the latency histogram of `name` (see `vercel.instrumentation`). While hooks
+    are registered, a `Span` with per-phase timings is also built and handed to them; with no hooks the
+    only overhead is the histogram update.
+    """
+
+    __slots__ = ("spec", "name", "method", "schema", "_segments", "_body", "_query", "_build_body", "_cache_field", "_aliases", "_limit_group")
+
+    def __init__(self, spec: ActionSpec, name: str = None, schema: type = None):
+        self.spec = spec
+        self.name = name or f"{spec.method} {spec.path}"
+        self.method = spec.method
+        self.schema = schema
+        self._segments = tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(spec.path))
+        self._body = tuple((spec.body or {}).items())
+        self._query = tuple((spec.query or {}).items())
+        self._build_body = spec.build_body
+        path_fields = [field for _, field in self._segments if field]
+        self._cache_field = path_fields[0] if spec.cache else None
+        self._aliases = list(spec.cache_aliases)
+        self._limit_group = f"{self.method} {spec.path}"
+
+    def url(self, request: BaseModel) -> str:
+        parts = [get_transport().base_url]
+        for literal, field in self._segments:
+            parts.append(literal)
+            if field:
+                parts.append(quote(str(getattr(request, field)), safe=""))
+        return "".join(parts)
+
+    def body(self, request: BaseModel):
+        if self._build_body is not None:
+            return drop_none(self._build_body(request))
+        if not self._body:
+            return None
+        data = {}
+        for field, key in self._body:
+            value = getattr(request, field)
+            if not _is_empty(value):
+                data[key] = value
+        return data
+
+    def params(self, request: BaseModel):
+        if not self._query:
+            return None
+        params = {}
+        for field, key in self._query:
+            value = getattr(request, field)
+            if value is not None:
+                params[key] = value
+        return params
+
+    def _prepare(self, request: BaseModel, headers: dict, body, params, span: Span) -> tuple:
+        start = time.perf_counter() if span is not None else 0.0
+        url = self.url(request)
+        body = self.body(request) if body is None else body
+        params = self.params(request) if params is None else params
+        if span is not None:
+            built = time.perf_counter()
+            span.add("build", built - start)
+        if body is not None:
+            body = _encode(body)
+            headers = _json_headers(headers)
+            if span is not None:
+                span.add("serialize", time.perf_counter() - built)
+        return url, headers, body, params
+
+    def send(self, request: BaseModel, headers: dict, body=None, params=None, span: Span = None, stream: bool = False):
+        """
+        Send the request described by the spec, with `body`/`params` overriding the ones built from `request`.
+
+        With `stream`, the response body is left unread for `receive` to decode incrementally.
+        """
+        url, headers, content, params = self._prepare(request, headers, body, params, span)
+        return get_transport().request(
+            self.method,
+            url,
+            headers=headers,
+            data=content,
+            params=params,
+            idempotent=self.spec.idempotent,
+            span=span,
+            limit_group=self._limit_group,
+            stream=stream,
+        )
+
+    async def send_async(self, request: BaseModel, headers: dict, body=None, params=None, span: Span = None, stream: bool = False):
+        """Asyncio counterpart of `send`. A response sent with `stream` is read with `_read_async`."""
+        url, headers, content, params = self._prepare(request, headers, body, params, span)
+        return await get_transport().request_async(
+            self.method,
+            url,
+            headers=headers,
+            content=content,
+            params=params,
+            idempotent=self.spec.idempotent,
+            span=span,
+            limit_group=self._limit_group,
+            stream=stream,
+        )
+
+    def projection(self, request: BaseModel):
+        """Return the projection tree selected by the request's `fields`, or `None` to decode the whole response."""
+        paths = getattr(request, self.spec.fields) if self.spec.fields else None
+        if not paths:
+            return None
+        tree = compile_paths(paths if self.spec.items else [*paths, *self._aliases])
+        return {self.spec.items: tree} if self.spec.items else tree
+
+    def _receive(self, response, span: Span, tree: dict, streamed: bool = False, reuse: tuple = None, chunks: list = None) -> tuple:
+        # `reuse` is the `(digest, value)` of a cached copy: when the body hashes to the same digest, the
+        # cached value is returned instead of decoding the body again. `chunks` is the body of an async
+        # streamed response, already read by `_read_async`. Returns `(result, size, digest)`.
+        digest = None
+        try:
+            response.raise_for_status()
+            start = time.perf_counter() if span is not None else 0.0
+            if tree is None:
+                content = response.content
+                size = len(content)
+                if reuse is not None and content:
+                    digest = _digest(content)
+                result = reuse[1] if digest is not None and digest == reuse[0] else _decode(response)
+            else:
+                counted = _Counted(response, chunks)
+                result, size = stream_loads(counted, tree), counted.size
+        finally:
+            if streamed:
+                response.close()
+        if span is not None:
+            span.add("decode", time.perf_counter() - start)
+            span.bytes_received += size
+        return result, size, digest
+
+    def receive(self, response, span: Span = None, tree: dict = None, streamed: bool = False):
+        """
+        Raise for error statuses and decode the response body, recording the decode on `span`.
+
+        With a projection `tree` (see `projection`), the body is decoded incrementally keeping only the selected members.
+        Pass `streamed` for responses sent with `stream=True`, they are closed once decoded.
+        """
+        return self._receive(response, span, tree, streamed)[0]
+
+    async def receive_async(self, response, span: Span = None, tree: dict = None, streamed: bool = False):
+        """Asyncio counterpart of `receive`, reading the body of `streamed` responses without blocking the event loop."""
+        chunks = await _read_async(response, span) if streamed else None
+        return self._receive(response, span, tree, chunks=chunks)[0]
+
+    def invalidate(self, request: BaseModel, headers: dict) -> None:
+        if self.spec.invalidates:
+            get_cache().invalidate_project(credential_fingerprint(headers), getattr(request, self.spec.invalidates))
+        if self.spec.deletes:
+            get_project_index().forget(credential_fingerprint(headers), getattr(request, self.spec.deletes))
+
+    def index(self, result, headers: dict) -> None:
+        """Record the projects of a successful response in the project index."""
+        if self.spec.projects is None or not isinstance(result, dict):
+            return
+        if self.spec.projects == ".":
+            get_project_index().record(credential_fingerprint(headers), result)
+        else:
+            get_project_index().record_all(credential_fingerprint(headers), result.get(self.spec.projects))
+
+    def resolve(self, request: BaseModel, headers: dict, span: Span = None) -> BaseModel:
+        """Return `request` with the project name in the `resolves` field replaced by the project's ID."""
+        if self.spec.resolves is None:
+            return request
+        project = getattr(request, self.spec.resolves)
+        project_id = resolve_project_id(headers, project, span)
+        return request if project_id == project else request.model_copy(update={self.spec.resolves: project_id})
+
+    async def resolve_async(self, request: BaseModel, headers: dict, span: Span = None) -> BaseModel:
+        """Asyncio counterpart of `resolve`."""
+        if self.spec.resolves is None:
+            return request
+        project = getattr(request, self.spec.resolves)
+        project_id = await resolve_project_id_async(headers, project, span)
+        return request if project_id == project else request.model_copy(update={self.spec.resolves: project_id})
+
+    def _cache_kind(self, request: BaseModel) -> str:
+        paths = getattr(request, self.spec.fields) if self.spec.fields else None
+        return f"{self.spec.cache}:{','.join(paths)}" if paths else self.spec.cache
+
+    def _cache_entry(self, result, size: int, validator: dict) -> dict:
+        aliases = result.get(self.spec.items) if self.spec.items else result
+        return {
+            "value": result,
+            "size": size,
+            "aliases": tuple(aliases.get(key) for key in self.spec.cache_aliases) if isinstance(aliases, dict) else (),
+            "validator": validator,
+        }
+
+    def _complete(self, response, span: Span, tree: dict, streamed: bool, key: tuple, generation: int, stale, chunks: list = None) -> object:
+        """Turn the response of a cached read into its result, revalidating or replacing the cached entry."""
+        cache = get_cache()
+        value, validator = stale
+        if response.status_code == 304 and value is not None:
+            if streamed:
+                response.close()
+            cache.refresh(*key, generation=generation)
+            if span is not None:
+                span.revalidated = True
+            return value
+        reuse = (validator["digest"] if validator else None, value)
+        result, size, digest = self._receive(response, span, tree, streamed, reuse, chunks)
+        cache.set(*key, generation=generation, **self._cache_entry(result, size, _validator(response, digest)))
+        return result
+
+    def call(self, request: BaseModel, headers: dict, span: Span = None):
+        """Send the request and return the decoded response, reading through the cache for cached specs."""
+        request = self.resolve(request, headers, span)
+        tree = self.projection(request)
+        if self._cache_field is None:
+            return self.receive(self.send(request, headers, span=span, stream=tree is not None), span, tree, tree is not None)
+
+        cache = get_cache()
+        credential = credential_fingerprint(headers)
+        project = getattr(request, self._cache_field)
+        kind = self._cache_kind(request)
+        cached = cache.get(credential, kind, project)
+        if cached is not None:
+            if span is not None:
+                span.cached = True
+            return cached
+        generation = cache.generation(credential)
+        fetched = []
+
+        def fetch():
+            stale = cache.stale(credential, kind, project)
+            response = self.send(request, _conditional(headers, stale[1]), span=span, stream=tree is not None)
+            fetched.append(True)
+            return self._complete(response, span, tree, tree is not None, (credential, kind, project), generation, stale)
+
+        result = get_singleflight().do((credential, kind, project), fetch)
+        if span is not None and not fetched:
+            span.coalesced = True
+        return result
+
+    async def call_async(self, request: BaseModel, headers: dict, span: Span = None):
+        """Asyncio counterpart of `call`."""
+        request = await self.resolve_async(request, headers, span)
+        tree = self.projection(request)
+        if self._cache_field is None:
+            return await self.receive_async(await self.send_async(request, headers, span=span, stream=tree is not None), span, tree, tree is not None)
+
+        cache = get_cache()
+        credential = credential_fingerprint(headers)
+        project = getattr(request, self._cache_field)
+        kind = self._cache_kind(request)
+        cached = cache.get(credential, kind, project)
+        if cached is not None:
+            if span is not None:
+                span.cached = True
+            return cached
+        generation = cache.generation(credential)
+        fetched = []
+
+        async def fetch():
+            stale = cache.stale(credential, kind, project)
+            response = await self.send_async(request, _conditional(headers, stale[1]), span=span, stream=tree is not None)
+            chunks = await _read_async(response, span) if tree is not None else None
+            fetched.append(True)
+            return self._complete(response, span, tree, False, (credential, kind, project), generation, stale, chunks)
+
+        result = await get_singleflight().do_async((credential, kind, project), fetch)
+        if span is not None and not fetched:
+            span.coalesced = True
+        return result
+
+    def run(self, request, authorisation_data: dict, work: Callable) -> dict:
+        """Run `work(request, headers, span)` as a call of this action, see `run_action`."""
+        return run_action(self.name, self.schema, request, authorisation_data, work, self.method, self.spec.path)
+
+    async def run_async(self, request, authorisation_data: dict, work: Callable) -> dict:
+        """Asyncio counterpart of `run`."""
+        return await run_action_async(self.name, self.schema, request, authorisation_data, work, self.method, self.spec.path)
+
+    def _execute(self, request: BaseModel, headers: dict, span: Span) -> tuple:
+        response = self.call(request, headers, span)
+        self.index(response, headers)
+        self.invalidate(request, headers)
+        return True, response
+
+    async def _execute_async(self, request: BaseModel, headers: dict, span: Span) -> tuple:
+        response = await self.call_async(request, headers, span)
+        self.index(response, headers)
+        self.invalidate(request, headers)
+        return True, response
+
+    def execute(self, request: BaseModel, authorisation_data: dict) -> dict:
+        return self.run(request, authorisation_data, self._execute)
+
+    async def execute_async(self, request: BaseModel, authorisation_data: dict) -> dict:
+        return await self.run_async(request, authorisation_data, self._execute_async)
+
+
+class SpecAction(Action):
+    """
+    Base class for actions backed by an `ActionSpec`.
+
+    Subclasses declare the usual `_display_name`, `_request_schema`, `_response_schema`, `_tags` and
+    `_tool_name` attributes plus a `_spec`; the spec is compiled once when the class is created and
+    `execute`/`execute_async` run it. Connection pooling, rate limiting, retries, caching, request
+    coalescing and instrumentation come with the spec. The request may also be passed as a plain dict,
+    it is then validated against `_request_schema`.
+    """
+
+    _spec: ActionSpec = None
+    _compiled: CompiledSpec = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("_spec") is not None:
+            cls._compiled = CompiledSpec(cls._spec, name=cls.__name__, schema=getattr(cls, "_request_schema", None))
+
+    @property
+    def display_name(self) -> str:
+        return self._display_name
+
+    @property
+    def request_schema(self) -> BaseModel:
+        return self._request_schema
+
+    @property
+    def response_schema(self) -> BaseModel:
+        return self._response_schema
+
+    def execute(self, request: BaseModel, authorisation_data: dict) -> dict:
+        return self._compiled.execute(request, authorisation_data)
+
+    async def execute_async(self, request: BaseModel, authorisation_data: dict) -> dict:
+        return await self._compiled.execute_async(request, authorisation_data)
+
+
+__all__ = ["ActionSpec", "CompiledSpec", "SpecAction", "run_action", "run_action_async", "validate_request"]
@@ -0,0 +1,215 @@
+import bisect
+import threading
+import time
+from array import array
+
+
+class Span:
+    """
+    Timings and counters of one action call, handed to the registered hooks.
+
+    `phases` maps phase names to seconds. The engine and transport record:
+
+    - `validate`: building the request model from a dict, when the action is called with one.
+    - `build`: building the URL, query parameters and body from the request.
+    - `serialize`: encoding the body.
+    - `rate_limit`: waiting for the credential's token bucket.
+    - `pool_wait`: waiting for a connection from the pool.
+    - `connect`: opening new connections (async path only).
+    - `server`: from sending the request to receiving the response headers.
+    - `backoff`: sleeping between retries.
+    - `decode`: decoding the response body.
+
+    Phases that did not happen are absent. Cache hits only record `validate`/`build` and set `cached`;
+    calls that were coalesced with an identical in-flight call set `coalesced`; reads answered with
+    `304 Not Modified` from a revalidated cache entry set `revalidated`.
+    """
+
+    __slots__ = (
+        "action",
+        "method",
+        "endpoint",
+        "phases",
+        "bytes_sent",
+        "bytes_received",
+        "retries",
+        "status",
+        "cached",
+        "coalesced",
+        "revalidated",
+        "success",
+        "error",
+        "duration",
+    )
+
+    def __init__(self, action: str, method: str, endpoint: str):
+        self.action = action
+        self.method = method
+        self.endpoint = endpoint
+        self.phases = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.status = None
+        self.cached = False
+        self.coalesced = False
+        self.revalidated = False
+        self.success = False
+        self.error = None
+        self.duration = 0.0
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def as_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Hook:
+    """Base class for instrumentation hooks. Override `before` and/or `after`."""
+
+    def before(self, span: Span) -> None:
+        pass
+
+    def after(self, span: Span) -> None:
+        pass
+
+
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Hook) -> None:
+    """Register `hook` to be called before and after every action call."""
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: Hook) -> None:
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(registered for registered in _hooks if registered is not hook)
+
+
+def hooks() -> tuple:
+    """Return the registered hooks. Spans are only built while this is non-empty."""
+    return _hooks
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Bucket upper bounds grow by a factor of sqrt(2) from 50µs to about 100s, so any recorded value is
+    reported within ~41% of its true value. Counts are kept in a flat `array`, recording is a bisect and
+    an increment.
+    """
+
+    BOUNDS = tuple(0.00005 * 2 ** (i / 2) for i in range(42))
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * (len(self.BOUNDS) + 1)))
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        index = bisect.bisect_left(self.BOUNDS, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket holding the `fraction` quantile, in seconds."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.BOUNDS[index] if index < len(self.BOUNDS) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = self.counts.tolist()
+            count, total = self.count, self.total
+        return {"bounds": list(self.BOUNDS), "counts": counts, "count": count, "sum": total}
+
+    def reset(self) -> None:
+        with self._lock:
+            for index in range(len(self.counts)):
+                self.counts[index] = 0
+            self.count = 0
+            self.total = 0.0
+
+
+_histograms = {}
+_histograms_lock = threading.Lock()
+
+
+def histogram(action: str) -> LatencyHistogram:
+    """Return the latency histogram of `action`, creating it on first use."""
+    found = _histograms.get(action)
+    if found is None:
+        with _histograms_lock:
+            found = _histograms.setdefault(action, LatencyHistogram())
+    return found
+
+
+def begin_call(action: str, method: str = None, endpoint: str = None) -> tuple:
+    """
+    Start measuring a call of `action`. Returns `(start, span)`, `span` being `None` when no hooks are registered.
+
+    Actions that are not bound to one endpoint, such as the bulk actions, leave `method` and `endpoint` unset.
+    """
+    registered = hooks()
+    if not registered:
+        return time.perf_counter(), None
+    span = Span(action, method, endpoint)
+    for hook in registered:
+        hook.before(span)
+    return time.perf_counter(), span
+
+
+def end_call(found: LatencyHistogram, start: float, span: Span, response_data: dict) -> None:
+    """Record the call started by `begin_call` into `found` and hand its span to the hooks."""
+    elapsed = time.perf_counter() - start
+    found.record(elapsed)
+    if span is None:
+        return
+    span.duration = elapsed
+    span.success = response_data["success"]
+    if not span.success and isinstance(response_data["response"], str):
+        span.error = response_data["response"]
+    for registered in hooks():
+        registered.after(span)
+
+
+def export_histograms(reset: bool = False) -> dict:
+    """Return a snapshot of every action's latency histogram, optionally resetting them."""
+    with _histograms_lock:
+        histograms = dict(_histograms)
+    exported = {}
+    for action, found in histograms.items():
+        exported[action] = found.snapshot()
+        if reset:
+            found.reset()
+    return exported
+
+
+__all__ = [
+    "Hook",
+    "LatencyHistogram",
+    "Span",
+    "add_hook",
+    "begin_call",
+    "end_call",
+    "export_histograms",
+    "histogram",
+    "hooks",
+    "remove_hook",
+]
@@ -0,0 +1,245 @@
+import codecs
+import json
+import re
+from typing import Iterable, Iterator
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+_decoder = json.JSONDecoder()
+
+
+def compile_paths(paths: Iterable[str]) -> dict:
+    """
+    Turn dotted JSON paths into a projection tree.
+
+    `["id", "link.repo"]` becomes `{"id": {}, "link": {"repo": {}}}`; an empty subtree keeps the whole
+    value. A path that is a prefix of another one wins, `["link", "link.repo"]` keeps all of `link`.
+    """
+    tree = {}
+    for path in paths:
+        node = tree
+        keys = path.split(".")
+        for i, key in enumerate(keys):
+            if key in node and not node[key]:
+                break
+            if i == len(keys) - 1:
+                node[key] = {}
+            else:
+                node = node.setdefault(key, {})
+    return tree
+
+
+def project(value, tree: dict):
+    """Apply a projection tree to an already decoded value. Lists are projected element by element."""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], subtree) for key, subtree in tree.items() if key in value}
+    return value
+
+
+class _Reader:
+    """Pulls text out of an iterator of UTF-8 byte chunks, keeping only the unconsumed part in memory."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping consumed text. Returns `False` at the end of the input."""
+        if self.eof:
+            return False
+        text = ""
+        while not text:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                text = self._utf8.decode(b"", final=True)
+                self.eof = True
+                break
+            text = self._utf8.decode(chunk)
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return bool(text)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def at_end(self) -> bool:
+        """Return whether only whitespace is left."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return False
+            if not self.fill():
+                return True
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at JSON input position {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._grow():
+                    raise
+                continue
+            # A number cut by the end of the buffer decodes as its prefix, e.g. `1.` as `1`; read on to complete it.
+            cut = end == len(self.buffer) or self.buffer[end] in _NUMBER_CHARS
+            if isinstance(value, (str, list, dict)) or not cut or not self._grow():
+                self.pos = end
+                return value
+
+    def _grow(self) -> bool:
+        # Read until the unconsumed text has doubled, so retried decodes of a large value stay linear overall.
+        target = 2 * (len(self.buffer) - self.pos) + 1
+        grown = False
+        while len(self.buffer) - self.pos < target and self.fill():
+            grown = True
+        return grown
+
+    def skip(self) -> None:
+        """Consume the next value without decoding it, holding at most one chunk of it in memory."""
+        if self.peek() not in '"[{':
+            self.value()
+            return
+        depth = 0
+        in_string = False
+        while True:
+            buffer, i = self.buffer, self.pos
+            while i < len(buffer):
+                if in_string:
+                    match = _STRING_SPECIAL.search(buffer, i)
+                    if match is None:
+                        i = len(buffer)
+                        break
+                    i = match.start()
+                    if buffer[i] == "\\":
+                        if i + 1 >= len(buffer):
+                            break
+                        i += 2
+                        continue
+                    in_string = False
+                    i += 1
+                    if depth == 0:
+                        self.pos = i
+                        return
+                else:
+                    match = _STRUCTURAL.search(buffer, i)
+                    if match is None:
+                        i = len(buffer)
+                        break
+                    i = match.end()
+                    char = match.group()
+                    if char == '"':
+                        in_string = True
+                    elif char in "[{":
+                        depth += 1
+                    else:
+                        depth -= 1
+                        if depth == 0:
+                            self.pos = i
+                            return
+            self.pos = i
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def members(self) -> Iterator[str]:
+        """Yield the keys of the next object. The caller consumes each member's value before resuming."""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' at JSON input position {self.pos - 1}, found {separator!r}")
+
+    def elements(self) -> Iterator[None]:
+        """Yield once per element of the next array. The caller consumes each element before resuming."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' at JSON input position {self.pos - 1}, found {separator!r}")
+
+    def projected(self, tree: dict):
+        """Decode the next value keeping only the members selected by `tree`."""
+        if not tree:
+            return self.value()
+        char = self.peek()
+        if char == "{":
+            result = {}
+            for key in self.members():
+                subtree = tree.get(key)
+                if subtree is None:
+                    self.skip()
+                else:
+                    result[key] = self.projected(subtree)
+            return result
+        if char == "[":
+            return [self.projected(tree) for _ in self.elements()]
+        return self.value()
+
+
+def loads(chunks: Iterable[bytes], tree: dict = None):
+    """
+    Incrementally decode a JSON document from `chunks`, keeping only the members selected by `tree`.
+
+    Members that are not selected are scanned past without being decoded, so peak memory is bounded by
+    the projected result and the chunk size rather than by the size of the document.
+    """
+    reader = _Reader(chunks)
+    result = reader.projected(tree or {})
+    if reader.at_end():
+        return result
+    raise ValueError(f"Extra data after JSON value at position {reader.pos}")
+
+
+def iter_items(chunks: Iterable[bytes], key: str, tree: dict = None) -> Iterator:
+    """
+    Yield, one at a time, the elements of the array held by the top-level member `key`, each projected to `tree`.
+
+    Only one element is decoded at a time; the other top-level members are skipped.
+    """
+    reader = _Reader(chunks)
+    for member in reader.members():
+        if member != key or reader.peek() != "[":
+            reader.skip()
+            continue
+        for _ in reader.elements():
+            yield reader.projected(tree or {})
+
+
+__all__ = ["compile_paths", "iter_items", "loads", "project"]
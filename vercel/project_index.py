@@ -0,0 +1,190 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from tool_runtime.credentials import credential_fingerprint
+
+# Vercel project IDs carry this prefix followed by a long alphanumeric suffix. Names may also start with the
+# prefix (e.g. `prj_billing`), so only identifiers of the full ID shape are taken for IDs.
+PROJECT_ID_PREFIX = "prj_"
+PROJECT_ID_PATTERN = re.compile(rf"{PROJECT_ID_PREFIX}[A-Za-z0-9]{{20,}}")
+
+
+def is_project_id(project: str) -> bool:
+    """Whether `project` has the shape of a Vercel project ID rather than of a project name."""
+    return PROJECT_ID_PATTERN.fullmatch(project) is not None
+
+
+class ProjectIndex:
+    """
+    Per-credential map from project names to project IDs.
+
+    Several endpoints, such as pause, unpause and update, only accept a project ID. The index is filled
+    from every project that passes through the actions (found, listed, created or updated), so a name can
+    be turned into an ID without another round trip. The credential fingerprint scopes the entries: a
+    token only sees the projects of its own account or team, so the same name may map to different IDs
+    under different credentials.
+
+    A project has a single name: recording it under a new name (e.g. from the response of a rename) drops
+    the old one, and `forget` drops a deleted project. A rename or deletion made outside the actions is
+    not seen, so names expire `ttl` seconds after they were last recorded and are then looked up again.
+    The least recently used names are evicted once more than `max_entries` are held.
+
+    Args:
+        ttl: Seconds a name stays indexed after it was last recorded.
+        max_entries: The maximum number of names kept.
+    """
+
+    def __init__(self, ttl: float = 300.0, max_entries: int = 4096):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._ids = OrderedDict()
+        self._names = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _id(self, credential: str, name: str):
+        # Called with the lock held. Drops the name once expired.
+        entry = self._ids.get((credential, name))
+        if entry is None:
+            return None
+        project_id, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._ids[(credential, name)]
+            if self._names.get((credential, project_id)) == name:
+                del self._names[(credential, project_id)]
+            return None
+        return project_id
+
+    def resolve(self, credential: str, project: str):
+        """
+        Return the ID of `project`, an ID or a name, or `None` if the name is not indexed.
+
+        An indexed name resolves to its ID even when it has the shape of an ID, and an indexed ID resolves to
+        itself whatever its shape.
+        """
+        with self._lock:
+            project_id = self._id(credential, project)
+            if project_id is not None:
+                self._ids.move_to_end((credential, project))
+                return project_id
+            if (credential, project) in self._names:
+                return project
+        return project if is_project_id(project) else None
+
+    def identifiers(self, credential: str, project: str) -> set:
+        """Return `project` and the other identifier it is indexed under: its name for an ID, its ID for a name."""
+        with self._lock:
+            other = self._id(credential, project)
+            if other is None:
+                other = self._names.get((credential, project))
+                if other is not None and self._id(credential, other) is None:
+                    other = None
+        return {project} if other is None else {project, other}
+
+    def record(self, credential: str, project) -> None:
+        """Index a project as returned by the API. Projects without both an `id` and a `name` are ignored."""
+        if not isinstance(project, dict):
+            return
+        project_id, name = project.get("id"), project.get("name")
+        if not isinstance(project_id, str) or not isinstance(name, str):
+            return
+        key = (credential, name)
+        with self._lock:
+            previous = self._names.get((credential, project_id))
+            if previous is not None and previous != name:
+                self._ids.pop((credential, previous), None)
+            replaced = self._ids.get(key, (None,))[0]
+            if replaced is not None and replaced != project_id:
+                self._names.pop((credential, replaced), None)
+            self._names[(credential, project_id)] = name
+            self._ids[key] = (project_id, time.monotonic() + self.ttl)
+            self._ids.move_to_end(key)
+            while len(self._ids) > self.max_entries:
+                (evicted_credential, evicted), (evicted_id, _) = self._ids.popitem(last=False)
+                if self._names.get((evicted_credential, evicted_id)) == evicted:
+                    del self._names[(evicted_credential, evicted_id)]
+
+    def record_all(self, credential: str, projects) -> None:
+        for project in projects or ():
+            self.record(credential, project)
+
+    def forget(self, credential: str, project: str) -> None:
+        """Drop `project`, given by ID or by name, e.g. once it has been deleted. `None` drops it under every credential."""
+        with self._lock:
+            credentials = (credential,) if credential is not None else {credential for credential, _ in self._ids}
+            for credential in credentials:
+                project_id = self._ids.pop((credential, project), (project,))[0]
+                name = self._names.pop((credential, project_id), None)
+                if name is not None:
+                    self._ids.pop((credential, name), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+
+
+def _lookup_request(project: str):
+    from .actions.get_project_by_id_or_name import FindProjectAction, FindProjectRequest
+
+    return FindProjectAction._compiled, FindProjectRequest(project_id_or_name=project, fields=["id", "name"])
+
+
+def resolve_project_id(headers: dict, project: str, span=None) -> str:
+    """
+    Return the ID of `project`, an ID or a name, looking the project up when the name is not indexed yet.
+
+    The lookup goes through `FindProjectAction`'s cached read, so concurrent resolutions of the same name
+    share one request, and its response is indexed for the next calls.
+    """
+    credential = credential_fingerprint(headers)
+    project_id = _index.resolve(credential, project)
+    if project_id is not None:
+        return project_id
+    compiled, request = _lookup_request(project)
+    found = compiled.call(request, headers, span)
+    _index.record(credential, found)
+    return found["id"]
+
+
+async def resolve_project_id_async(headers: dict, project: str, span=None) -> str:
+    """Asyncio counterpart of `resolve_project_id`."""
+    credential = credential_fingerprint(headers)
+    project_id = _index.resolve(credential, project)
+    if project_id is not None:
+        return project_id
+    compiled, request = _lookup_request(project)
+    found = await compiled.call_async(request, headers, span)
+    _index.record(credential, found)
+    return found["id"]
+
+
+_index = ProjectIndex()
+
+
+def get_project_index() -> ProjectIndex:
+    """Return the process-wide project index."""
+    return _index
+
+
+def configure_project_index(**kwargs) -> ProjectIndex:
+    """Replace the process-wide project index with one built from `kwargs` (see `ProjectIndex`)."""
+    global _index
+    _index = ProjectIndex(**kwargs)
+    return _index
+
+
+__all__ = [
+    "PROJECT_ID_PATTERN",
+    "PROJECT_ID_PREFIX",
+    "ProjectIndex",
+    "configure_project_index",
+    "get_project_index",
+    "is_project_id",
+    "resolve_project_id",
+    "resolve_project_id_async",
+]
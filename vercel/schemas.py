@@ -0,0 +1,139 @@
+"""
+Precomputed JSON schemas of the Vercel actions.
+
+Pydantic regenerates a model's JSON schema on every `model_json_schema()` call. The registry builds the
+schemas of every action once per process, or loads them from an on-disk artifact, so exporting them is a
+dictionary lookup. The artifact is keyed by a hash of the action sources and the pydantic version and is
+rebuilt whenever either changes; loading a valid artifact does not import the action modules at all.
+
+Build the artifact ahead of time, e.g. while building an image:
+
+    python -m vercel.schemas /path/to/vercel-schemas.json
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+ACTIONS_DIR = Path(__file__).parent / "actions"
+
+ARTIFACT_VERSION = 1
+
+
+def source_hash() -> str:
+    """Return the hash the artifact is keyed by: the action sources and the installed pydantic version."""
+    from importlib.util import find_spec
+
+    # Hashing pydantic's version module avoids importing pydantic or `importlib.metadata`.
+    digest = hashlib.sha256(str(ARTIFACT_VERSION).encode())
+    digest.update((Path(find_spec("pydantic").origin).parent / "version.py").read_bytes())
+    for path in sorted(ACTIONS_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class SchemaRegistry:
+    """
+    JSON schemas of the requests and responses of every Vercel action, built once.
+
+    Args:
+        artifact: Path of the on-disk artifact. When it exists and matches `source_hash()`, the schemas are
+            loaded from it; otherwise they are built from the action classes and the artifact is (re)written.
+    """
+
+    def __init__(self, artifact: str = None):
+        self.artifact = Path(artifact) if artifact else None
+        self._schemas = None
+        self._lock = threading.Lock()
+
+    def _build(self) -> dict:
+        from .vercel_tool import ACTION_NAMES, Vercel
+
+        tool = Vercel()
+        schemas = {}
+        for name in ACTION_NAMES:
+            action = tool.action(name)
+            schemas[name] = {
+                "request": action._request_schema.model_json_schema(),
+                "response": action._response_schema.model_json_schema(),
+            }
+        return schemas
+
+    def _load(self, key: str):
+        try:
+            artifact = json.loads(self.artifact.read_text())
+        except (OSError, ValueError):
+            return None
+        return artifact["schemas"] if artifact.get("source_hash") == key else None
+
+    def _save(self, key: str, schemas: dict) -> None:
+        self.artifact.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.artifact.with_name(f".{self.artifact.name}.{os.getpid()}")
+        temporary.write_text(json.dumps({"source_hash": key, "schemas": schemas}))
+        os.replace(temporary, self.artifact)
+
+    def schemas(self) -> dict:
+        """Return `{action name: {"request": schema, "response": schema}}` for every action."""
+        if self._schemas is None:
+            with self._lock:
+                if self._schemas is None:
+                    self._schemas = self._load_or_build()
+        return self._schemas
+
+    def _load_or_build(self) -> dict:
+        if self.artifact is None:
+            return self._build()
+        key = source_hash()
+        schemas = self._load(key)
+        if schemas is None:
+            schemas = self._build()
+            try:
+                self._save(key, schemas)
+            except OSError:
+                pass
+        return schemas
+
+    def request_schema(self, name: str) -> dict:
+        return self._schemas_of(name)["request"]
+
+    def response_schema(self, name: str) -> dict:
+        return self._schemas_of(name)["response"]
+
+    def _schemas_of(self, name: str) -> dict:
+        found = self.schemas().get(name)
+        if found is None:
+            raise ValueError(f"Unknown Vercel action: {name}")
+        return found
+
+
+_registry = SchemaRegistry()
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Return the process-wide schema registry."""
+    return _registry
+
+
+def configure_schema_registry(**kwargs) -> SchemaRegistry:
+    """Replace the process-wide schema registry, e.g. to point it at an on-disk artifact."""
+    global _registry
+    _registry = SchemaRegistry(**kwargs)
+    return _registry
+
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        raise SystemExit("usage: python -m vercel.schemas ARTIFACT_PATH")
+    registry = SchemaRegistry(artifact=sys.argv[1])
+    print(f"{len(registry.schemas())} action schemas up to date in {registry.artifact}")
+
+
+__all__ = ["SchemaRegistry", "configure_schema_registry", "get_schema_registry", "source_hash"]
+
+
+if __name__ == "__main__":
+    main()
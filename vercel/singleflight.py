@@ -0,0 +1,87 @@
+import threading
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls so that only one of them does the work.
+
+    The first caller for a key runs the function, every caller that arrives with the same key while it
+    is in flight waits for it and receives the same result, or the same exception. Nothing is kept once
+    the call completes; pair it with a cache to also serve later callers.
+
+    Sync callers (`do`) are coalesced across threads. Async callers (`do_async`) are coalesced within
+    their event loop.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._async_calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+    async def do_async(self, key, fn):
+        """
+        Like `do`, for a coroutine function `fn`.
+
+        The call runs in a task of its own that every caller, the first one included, awaits through
+        `asyncio.shield`: cancelling one caller does not cancel the call, which keeps running for the others.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), key)
+        task = self._async_calls.get(loop_key)
+        if task is None:
+            task = self._async_calls[loop_key] = loop.create_task(fn())
+            task.add_done_callback(lambda done: self._async_done(loop_key, done))
+        return await asyncio.shield(task)
+
+    def _async_done(self, loop_key, task) -> None:
+        if self._async_calls.get(loop_key) is task:
+            del self._async_calls[loop_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, in case every caller was cancelled before the call completed.
+            task.exception()
+
+
+_singleflight = SingleFlight()
+
+
+def get_singleflight() -> SingleFlight:
+    """Return the process-wide request coalescer."""
+    return _singleflight
+
+
+__all__ = ["SingleFlight", "get_singleflight"]
@@ -0,0 +1,72 @@
+import pytest
+
+from tool_runtime.credentials import credential_fingerprint
+from vercel.actions.bulk_projects import BulkDeleteProjectsAction
+from vercel.actions.get_project_by_id_or_name import FindProjectAction
+from vercel.benchmarks.mock_api import MockVercelAPI
+from vercel.cache import configure_cache
+from vercel.project_index import configure_project_index, get_project_index
+from vercel.transport import configure_transport
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+@pytest.fixture
+def mock():
+    configure_project_index()
+    configure_cache()
+    with MockVercelAPI(seed=1) as mock:
+        configure_transport(base_url=mock.url)
+        yield mock
+    configure_transport()
+
+
+def test_filter_delete_defaults_to_a_dry_run(mock):
+    projects = [mock.state.add_project(f"preview-{i}") for i in range(3)]
+    response = BulkDeleteProjectsAction().execute({"search": "preview-"}, AUTH)["response_data"]
+    assert response["response"]["dry_run"] is True
+    assert sorted(response["response"]["confirm"]) == sorted(project["id"] for project in projects)
+    assert len(mock.state.projects) == 3
+
+
+def test_filter_delete_requires_every_match_confirmed(mock):
+    projects = [mock.state.add_project(f"preview-{i}") for i in range(3)]
+    action = BulkDeleteProjectsAction()
+    assert action.execute({"search": "preview-", "dry_run": False}, AUTH)["response_data"]["success"] is False
+    partial = action.execute({"search": "preview-", "confirm": [projects[0]["id"]]}, AUTH)["response_data"]
+    assert partial["success"] is False
+    assert len(mock.state.projects) == 3
+
+    confirmed = action.execute({"search": "preview-", "confirm": [project["id"] for project in projects]}, AUTH)["response_data"]
+    assert confirmed["success"] is True
+    assert confirmed["response"]["counts"] == {"deleted": 3}
+    assert mock.state.projects == {}
+
+
+def test_project_given_by_name_and_id_is_deleted_once(mock):
+    project = mock.state.add_project("marketing-site")
+    response = BulkDeleteProjectsAction().execute({"projects": ["marketing-site", project["id"]]}, AUTH)["response_data"]
+    assert response["success"] is True
+    assert response["response"]["counts"] == {"deleted": 1}
+    assert mock.state.projects == {}
+
+
+def test_delete_by_name_ignores_a_stale_index_entry(mock):
+    renamed = mock.state.add_project("renamed")
+    mock.state.add_project("marketing-site")
+    get_project_index().record(credential_fingerprint(AUTH["headers"]), {"id": renamed["id"], "name": "marketing-site"})
+    response = BulkDeleteProjectsAction().execute({"projects": ["marketing-site"]}, AUTH)["response_data"]
+    assert response["success"] is True
+    assert list(mock.state.projects) == [renamed["id"]]
+
+
+def test_delete_by_name_ignores_a_cached_lookup(mock):
+    recreated = mock.state.add_project("marketing-site")
+    assert FindProjectAction().execute({"project_id_or_name": "marketing-site"}, AUTH)["response_data"]["success"] is True
+    del mock.state.projects[recreated["id"]]
+    current = mock.state.add_project("marketing-site")
+    configure_project_index()
+    response = BulkDeleteProjectsAction().execute({"projects": ["marketing-site"]}, AUTH)["response_data"]
+    assert response["success"] is True
+    assert response["response"]["projects"][0]["id"] == current["id"]
+    assert mock.state.projects == {}
@@ -0,0 +1,70 @@
+from vercel.cache import ResponseCache
+from vercel.project_index import configure_project_index
+
+
+def setup_function():
+    configure_project_index()
+
+
+def test_env_list_cached_by_name_is_dropped_by_a_write_by_id():
+    cache = ResponseCache()
+    cache.set("cred", "env", "my-proj", {"envs": []}, 10)
+    cache.invalidate_project("cred", "prj_123")
+    assert cache.get("cred", "env", "my-proj") is None
+
+
+def test_env_list_cached_by_id_is_dropped_by_a_write_by_name():
+    cache = ResponseCache()
+    cache.set("cred", "env", "prj_123", {"envs": []}, 10)
+    cache.invalidate_project("cred", "my-proj")
+    assert cache.get("cred", "env", "prj_123") is None
+
+
+def test_indexed_project_is_matched_by_its_other_identifier():
+    index = configure_project_index()
+    index.record("cred", {"id": "prj_123", "name": "my-proj"})
+    index.record("cred", {"id": "prj_456", "name": "other"})
+    cache = ResponseCache()
+    cache.set("cred", "env", "my-proj", {"envs": []}, 10)
+    cache.set("cred", "env", "other", {"envs": []}, 10)
+    cache.invalidate_project("cred", "prj_123")
+    assert cache.get("cred", "env", "my-proj") is None
+    assert cache.get("cred", "env", "other") == {"envs": []}
+
+
+def test_write_under_another_credential_keeps_entries():
+    cache = ResponseCache()
+    cache.set("cred", "env", "my-proj", {"envs": []}, 10)
+    cache.invalidate_project("other-cred", "prj_123")
+    assert cache.get("cred", "env", "my-proj") == {"envs": []}
+
+
+def test_project_entry_aliases_come_from_the_response():
+    cache = ResponseCache()
+    cache.set("cred", "project", "my-proj", {"id": "prj_123"}, 10, aliases=("prj_123", "my-proj"))
+    cache.set("cred", "project", "prj_456", {"id": "prj_456"}, 10, aliases=("prj_456", "other"))
+    cache.invalidate_project("cred", "prj_123")
+    assert cache.get("cred", "project", "my-proj") is None
+    assert cache.get("cred", "project", "prj_456") == {"id": "prj_456"}
+
+
+def test_invalidation_generations_stay_bounded():
+    cache = ResponseCache(max_entries=2)
+    generation = cache.generation("cred")
+    for credential in ("cred", "a", "b", "c"):
+        cache.invalidate_project(credential, "prj_123")
+    assert len(cache._generations) == 2
+    cache.set("cred", "env", "my-proj", {"envs": []}, 10, generation=generation)
+    assert cache.get("cred", "env", "my-proj") is None
+
+
+def test_invalidation_without_credential_only_touches_credentials_caching_the_project():
+    cache = ResponseCache()
+    cache.set("cred", "project", "prj_123", {"id": "prj_123"}, 10, aliases=("prj_123", "my-proj"))
+    cache.set("other", "project", "prj_456", {"id": "prj_456"}, 10, aliases=("prj_456", "other"))
+    cached, untouched = cache.generation("cred"), cache.generation("other")
+    cache.invalidate_project(None, "prj_123")
+    assert cache.get("cred", "project", "prj_123") is None
+    assert cache.get("other", "project", "prj_456") == {"id": "prj_456"}
+    assert cache.generation("cred") != cached
+    assert cache.generation("other") == untouched
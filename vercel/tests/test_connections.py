@@ -0,0 +1,66 @@
+import pytest
+import requests
+
+from vercel.actions.get_project_by_id_or_name import FindProjectAction
+from vercel.benchmarks.mock_api import MockVercelAPI
+from vercel.cache import configure_cache
+from vercel.connections import ConnectionCache, _connection, configure_connection_cache, validate_connection
+from vercel.project_index import configure_project_index
+from vercel.transport import configure_transport
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+@pytest.fixture
+def mock():
+    configure_project_index()
+    configure_cache()
+    configure_connection_cache()
+    with MockVercelAPI(seed=1) as mock:
+        configure_transport(base_url=mock.url)
+        yield mock
+    configure_transport()
+
+
+def _response(status: int, content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.url = "https://api.vercel.com/v1/account"
+    return response
+
+
+def test_invalidation_generations_stay_bounded():
+    cache = ConnectionCache(max_entries=2)
+    generation = cache.generation("cred")
+    for credential in ("cred", "a", "b", "c"):
+        cache.invalidate(credential)
+    assert len(cache._generations) == 2
+    cache.set("cred", {"valid": True}, generation)
+    assert cache.get("cred") is None
+    cache.set("cred", {"valid": True}, cache.generation("cred"))
+    assert cache.get("cred") == {"valid": True}
+
+
+def test_second_validation_is_answered_from_the_cache(mock):
+    first = validate_connection(AUTH)
+    requests_made = mock.requests
+    second = validate_connection(AUTH)
+    assert first["valid"] is True and first["cached"] is False
+    assert second["cached"] is True
+    assert second["user"] == first["user"]
+    assert mock.requests == requests_made
+
+
+def test_refusal_from_any_action_drops_the_cached_validation(mock):
+    assert validate_connection(AUTH)["valid"] is True
+    mock.revoked.add("test")
+    assert FindProjectAction().execute({"project_id_or_name": "web"}, AUTH)["response_data"]["success"] is False
+    refused = validate_connection(AUTH)
+    assert refused == {"valid": False, "status": 401, "error": "The token is not valid", "cached": False}
+
+
+def test_error_status_is_raised_before_the_body_is_decoded():
+    with pytest.raises(requests.HTTPError):
+        _connection(_response(502, b"<html>Bad Gateway</html>"))
+    assert _connection(_response(403, b"Forbidden"))["valid"] is False
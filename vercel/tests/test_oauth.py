@@ -0,0 +1,87 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tool_runtime.oauth import OAuthToken, TokenCache, _fingerprint
+
+
+class CountingTokenCache(TokenCache):
+    """Token cache answering token requests locally, optionally holding them until `release` is set."""
+
+    def __init__(self, path, release: threading.Event = None, **kwargs):
+        super().__init__("https://example.invalid/token", client_id="cid", client_secret="secret", path=path, **kwargs)
+        self.requests = []
+        self.started = threading.Event()
+        self.release = release
+
+    def _request_token(self, data: dict) -> dict:
+        self.requests.append(data["refresh_token"])
+        self.started.set()
+        if self.release is not None:
+            self.release.wait(5)
+        else:
+            time.sleep(0.1)
+        return {"access_token": f"renewed-{data['refresh_token']}-{len(self.requests)}", "expires_in": 3600}
+
+
+def expired(refresh_token: str) -> dict:
+    return {"headers": {"Authorization": "Bearer old"}, "refresh_token": refresh_token, "expires_at": time.time() - 60}
+
+
+def test_workers_sharing_a_database_renew_a_token_once(tmp_path):
+    path = tmp_path / "tokens.sqlite3"
+    caches = [CountingTokenCache(path) for _ in range(4)]
+    with ThreadPoolExecutor(16) as executor:
+        headers = list(executor.map(lambda i: caches[i % 4].headers(expired("rt"))["Authorization"], range(16)))
+    assert sum(len(cache.requests) for cache in caches) == 1
+    assert len(set(headers)) == 1
+
+
+def test_token_request_does_not_block_other_connections(tmp_path):
+    path = tmp_path / "tokens.sqlite3"
+    release = threading.Event()
+    slow = CountingTokenCache(path, release=release)
+    other = CountingTokenCache(path)
+    thread = threading.Thread(target=slow.headers, args=(expired("slow"),))
+    thread.start()
+    try:
+        assert slow.started.wait(5)
+        assert other.headers(expired("fast"))["Authorization"] == "Bearer renewed-fast-1"
+        assert thread.is_alive()
+    finally:
+        release.set()
+        thread.join()
+
+
+def test_lease_of_a_dead_worker_is_taken_over_once_expired(tmp_path):
+    cache = CountingTokenCache(tmp_path / "tokens.sqlite3")
+    with cache._transaction() as connection:
+        connection.execute("INSERT INTO oauth_refresh_leases VALUES (?, ?, ?)", (_fingerprint("rt"), "dead-worker", time.time() - 1))
+    assert cache.headers(expired("rt"))["Authorization"] == "Bearer renewed-rt-1"
+
+
+def test_token_stored_by_another_worker_wins_over_a_late_one(tmp_path):
+    path = tmp_path / "tokens.sqlite3"
+    late, first = CountingTokenCache(path), CountingTokenCache(path)
+    key = _fingerprint("rt")
+    _, version, claimed = late._claim(key)
+    assert claimed
+    kept = first._store(key, OAuthToken("first", "rt", time.time() + 3600), version)
+    assert late._store(key, OAuthToken("late", "rt", time.time() + 3600), version) == kept
+    assert late._load(key).access_token == "first"
+
+
+
+def test_action_reports_unusable_authorisation_data_instead_of_raising():
+    from vercel.actions.get_project_by_id_or_name import FindProjectAction
+
+    result = FindProjectAction().execute({"project_id_or_name": "web"}, {})
+    assert result["execution_details"]["executed"] is False
+    assert result["response_data"]["success"] is False
+
+
+def test_token_cache_needs_a_token_endpoint():
+    with pytest.raises(TypeError):
+        TokenCache("https://example.invalid/token")
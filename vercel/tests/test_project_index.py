@@ -0,0 +1,40 @@
+import time
+
+from vercel.project_index import ProjectIndex
+
+
+def test_names_resolve_until_their_ttl_runs_out():
+    index = ProjectIndex(ttl=0.05)
+    index.record("cred", {"id": "prj_123", "name": "my-proj"})
+    assert index.resolve("cred", "my-proj") == "prj_123"
+    assert index.identifiers("cred", "prj_123") == {"prj_123", "my-proj"}
+    time.sleep(0.06)
+    assert index.resolve("cred", "my-proj") is None
+    assert index.identifiers("cred", "prj_123") == {"prj_123"}
+    assert len(index) == 0
+
+
+def test_recording_again_extends_the_ttl():
+    index = ProjectIndex(ttl=0.05)
+    index.record("cred", {"id": "prj_123", "name": "my-proj"})
+    time.sleep(0.03)
+    index.record("cred", {"id": "prj_123", "name": "my-proj"})
+    time.sleep(0.03)
+    assert index.resolve("cred", "my-proj") == "prj_123"
+
+
+def test_rename_replaces_the_old_name():
+    index = ProjectIndex()
+    index.record("cred", {"id": "prj_123", "name": "old"})
+    index.record("cred", {"id": "prj_123", "name": "new"})
+    assert index.resolve("cred", "old") is None
+    assert index.resolve("cred", "new") == "prj_123"
+
+
+def test_names_with_the_id_prefix_are_looked_up():
+    index = ProjectIndex()
+    assert index.resolve("cred", "prj_billing") is None
+    assert index.resolve("cred", "prj_2WjyKQmM8ZnGcJsPWMrHRHrE") == "prj_2WjyKQmM8ZnGcJsPWMrHRHrE"
+    index.record("cred", {"id": "prj_2WjyKQmM8ZnGcJsPWMrHRHrE", "name": "prj_billing"})
+    assert index.resolve("cred", "prj_billing") == "prj_2WjyKQmM8ZnGcJsPWMrHRHrE"
+    assert index.identifiers("cred", "prj_billing") == {"prj_billing", "prj_2WjyKQmM8ZnGcJsPWMrHRHrE"}
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from vercel.actions.bulk_projects import _UncachedFindProjectAction
+from vercel.actions.get_project_by_id_or_name import FindProjectAction
+from vercel.benchmarks.mock_api import MockVercelAPI
+from vercel.cache import configure_cache
+from vercel.project_index import configure_project_index
+from vercel.transport import configure_transport, get_transport
+
+AUTH = {"headers": {"Authorization": "Bearer test"}}
+
+
+@pytest.fixture
+def mock():
+    configure_project_index()
+    configure_cache()
+    with MockVercelAPI(seed=1) as mock:
+        configure_transport(base_url=mock.url)
+        yield mock
+    configure_transport()
+
+
+@pytest.mark.parametrize("action", [FindProjectAction, _UncachedFindProjectAction])
+def test_async_projected_read_keeps_only_the_selected_fields(mock, monkeypatch, action):
+    mock.state.add_project("web", framework="nextjs", link={"repo": "web", "type": "github"})
+    transport, streamed = get_transport(), []
+    request_async = transport.request_async
+
+    async def recording(*args, **kwargs):
+        streamed.append(kwargs.get("stream"))
+        return await request_async(*args, **kwargs)
+
+    monkeypatch.setattr(transport, "request_async", recording)
+    request = {"project_id_or_name": "web", "fields": ["framework", "link.repo"]}
+    response = asyncio.run(action().execute_async(request, AUTH))["response_data"]
+    assert response["success"] is True
+    assert response["response"]["framework"] == "nextjs"
+    assert response["response"]["link"] == {"repo": "web"}
+    assert "latestDeployments" not in response["response"]
+    assert streamed[-1] is True
+
+
+def test_async_projected_read_reports_error_statuses(mock):
+    response = asyncio.run(FindProjectAction().execute_async({"project_id_or_name": "missing", "fields": ["framework"]}, AUTH))["response_data"]
+    assert response["success"] is False
+    assert "404" in response["response"]
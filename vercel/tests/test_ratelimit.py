@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+from tool_runtime.ratelimit import RateLimiter, RateLimitError, RetryPolicy, TokenBucket
+
+
+def _headers(remaining: int, window: float) -> dict:
+    return {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(int(time.time() + window))}
+
+
+class _Response:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.headers = {"Retry-After": "0"}
+
+    def close(self) -> None:
+        pass
+
+
+def _statuses(*statuses):
+    responses = iter(statuses)
+    sent = []
+
+    def send():
+        sent.append(True)
+        return _Response(next(responses))
+
+    return send, sent
+
+
+def test_exhausted_endpoint_does_not_block_other_endpoints():
+    limiter = RateLimiter(rate=10.0, capacity=10)
+    limiter.bucket("cred", "POST /v10/projects").update(_headers(0, 3600))
+    assert limiter.bucket("cred", "GET /v9/projects").reserve(max_wait=20.0) == 0.0
+    with pytest.raises(RateLimitError) as error:
+        limiter.bucket("cred", "POST /v10/projects").reserve(max_wait=20.0)
+    assert error.value.retry_after > 3000
+
+
+def test_buckets_are_kept_per_credential():
+    limiter = RateLimiter()
+    assert limiter.bucket("a", "GET /v9/projects") is limiter.bucket("a", "GET /v9/projects")
+    assert limiter.bucket("a", "GET /v9/projects") is not limiter.bucket("b", "GET /v9/projects")
+
+
+def test_slow_pacing_raises_instead_of_sleeping():
+    bucket = TokenBucket(rate=10.0, capacity=10)
+    bucket.update(_headers(5, 3600))
+    for _ in range(5):
+        assert bucket.reserve(max_wait=20.0) == 0.0
+    with pytest.raises(RateLimitError):
+        bucket.reserve(max_wait=20.0)
+
+
+def test_refused_reservation_leaves_the_bucket_untouched():
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    bucket.reserve()
+    with pytest.raises(RateLimitError):
+        bucket.reserve(max_wait=0.1)
+    assert bucket.reserve(max_wait=2.0) <= 1.0
+
+
+def test_reservation_within_max_wait_is_paced():
+    bucket = TokenBucket(rate=100.0, capacity=1)
+    assert bucket.reserve(max_wait=1.0) == 0.0
+    assert 0.0 < bucket.reserve(max_wait=1.0) <= 0.011
+
+
+def test_only_idempotent_requests_are_retried():
+    policy = RetryPolicy(max_retries=2)
+    send, sent = _statuses(503, 503, 200)
+    assert policy.run(send, TokenBucket(100.0, 10), "GET").status_code == 200
+    assert len(sent) == 3
+    send, sent = _statuses(503, 200)
+    assert policy.run(send, TokenBucket(100.0, 10), "POST").status_code == 503
+    assert len(sent) == 1
+
+
+def test_always_retried_statuses_are_retried_for_every_method():
+    policy = RetryPolicy(max_retries=2, always_retry_statuses=frozenset({429}))
+    send, sent = _statuses(429, 201)
+    assert policy.run(send, TokenBucket(100.0, 10), "POST").status_code == 201
+    assert len(sent) == 2
@@ -0,0 +1,66 @@
+from vercel.actions.reconcile_env_vars import DesiredEnvVar, plan_env_vars
+
+
+def env(env_id, key, value, target, type="encrypted", **extra):
+    return {"id": env_id, "key": key, "value": value, "type": type, "target": target, **extra}
+
+
+def described(operations):
+    return [operation.describe() for operation in operations]
+
+
+def test_matching_state_plans_no_writes():
+    current = [env("e1", "API_URL", "https://api", ["production", "preview"]), env("e2", "DEBUG", "0", ["development"], type="plain")]
+    desired = {
+        "API_URL": DesiredEnvVar(value="https://api", target=["preview", "production"]),
+        "DEBUG": DesiredEnvVar(value="0", type_of_env="plain", target=["development"]),
+    }
+    assert plan_env_vars(current, desired, delete_missing=True) == ([], [], 2)
+
+
+def test_overlapping_entries_are_merged_into_the_largest():
+    current = [env("e1", "API_URL", "https://api", ["production", "preview"]), env("e2", "API_URL", "https://dev", ["development"])]
+    first, second, unchanged = plan_env_vars(current, {"API_URL": DesiredEnvVar(value="https://api")})
+    assert described(first) == [{"op": "delete", "key": "API_URL", "target": ["development"], "id": "e2"}]
+    assert described(second) == [
+        {"op": "edit", "key": "API_URL", "target": ["development", "preview", "production"], "id": "e1", "changes": ["target"]}
+    ]
+    assert unchanged == 0
+
+
+def test_entry_wider_than_desired_targets_is_shrunk():
+    current = [env("e1", "API_URL", "https://api", ["production", "preview", "development"])]
+    first, second, unchanged = plan_env_vars(current, {"API_URL": DesiredEnvVar(value="https://prod", target=["production"])})
+    assert described(first) == [{"op": "edit", "key": "API_URL", "target": ["development", "preview"], "id": "e1", "changes": ["target"]}]
+    assert described(second) == [{"op": "create", "key": "API_URL", "target": ["production"]}]
+    assert second[0].value == "https://prod"
+    assert unchanged == 0
+
+
+def test_unchanged_entry_next_to_an_overlap_is_not_counted_unchanged():
+    current = [env("e1", "API_URL", "https://api", ["production"]), env("e2", "API_URL", "https://api", ["production"])]
+    first, second, unchanged = plan_env_vars(current, {"API_URL": DesiredEnvVar(value="https://api", target=["production"])})
+    assert [operation.env_id for operation in first] == ["e2"]
+    assert second == []
+    assert unchanged == 0
+
+
+def test_delete_missing_leaves_git_branch_and_system_entries():
+    current = [
+        env("e1", "OLD", "1", ["preview"]),
+        env("e2", "OLD", "2", ["preview"], gitBranch="feature"),
+        env("e3", "API_URL", "https://api", ["production"], gitBranch="feature"),
+        env("e4", "VERCEL_URL", "", ["production"], type="system"),
+    ]
+    first, second, unchanged = plan_env_vars(current, {"API_URL": DesiredEnvVar(value="https://api", target=["production"])}, delete_missing=True)
+    assert described(first) == [{"op": "delete", "key": "OLD", "target": ["preview"], "id": "e1"}]
+    assert described(second) == [{"op": "create", "key": "API_URL", "target": ["production"]}]
+    assert unchanged == 0
+
+
+def test_sensitive_values_are_always_rewritten():
+    current = [env("e1", "TOKEN", None, ["production"], type="sensitive")]
+    first, second, unchanged = plan_env_vars(current, {"TOKEN": DesiredEnvVar(value="s3cret", type_of_env="sensitive", target=["production"])})
+    assert first == []
+    assert described(second) == [{"op": "edit", "key": "TOKEN", "target": ["production"], "id": "e1", "changes": ["value"]}]
+    assert unchanged == 0
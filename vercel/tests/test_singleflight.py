@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from vercel.singleflight import SingleFlight
+
+
+def test_concurrent_sync_calls_share_one_call():
+    flight = SingleFlight()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait(1.0)
+        return "value"
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("key", fetch))) for _ in range(8)]
+    threads[0].start()
+    started.wait(1.0)
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == ["value"] * 8
+    assert calls == [1]
+    assert flight._calls == {}
+
+
+def test_cancelled_leader_does_not_cancel_followers():
+    async def main():
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(flight.do_async("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return results, calls, flight._async_calls
+
+    results, calls, pending = asyncio.run(main())
+    assert results == ["value"] * 3
+    assert calls == [1]
+    assert pending == {}
+
+
+def test_error_reaches_every_caller_and_is_not_kept():
+    async def main():
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do_async("key", fetch) for _ in range(3)), return_exceptions=True)
+
+        async def succeed():
+            return "value"
+
+        return results, await flight.do_async("key", succeed)
+
+    results, retried = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert retried == "value"
+
+
+def test_call_outlives_every_cancelled_caller():
+    async def main():
+        flight = SingleFlight()
+        finished = asyncio.Event()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            finished.set()
+            raise ValueError("nobody listening")
+
+        caller = asyncio.create_task(flight.do_async("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.wait_for(finished.wait(), 1.0)
+        await asyncio.sleep(0)
+        return flight._async_calls
+
+    assert asyncio.run(main()) == {}
@@ -0,0 +1,63 @@
+import asyncio
+import socket
+
+import pytest
+
+from vercel.cache import configure_cache
+from vercel.triggers import EventBus, VercelEvent, WebhookReceiver
+
+
+@pytest.fixture
+def receiver():
+    with WebhookReceiver("secret", bus=EventBus()) as receiver:
+        yield receiver
+
+
+def post(receiver, content_length: str) -> bytes:
+    host, port = receiver._server.server_address[:2]
+    with socket.create_connection((host, port), timeout=5) as connection:
+        connection.sendall(f"POST / HTTP/1.1\r\nHost: {host}\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode())
+        received = b""
+        while chunk := connection.recv(4096):
+            received += chunk
+    return received
+
+
+@pytest.mark.parametrize("content_length", ["-1", "abc", "1.5"])
+def test_invalid_content_length_is_refused_and_the_connection_closed(receiver, content_length):
+    # `post` only returns once the receiver closes the connection.
+    assert post(receiver, content_length).startswith(b"HTTP/1.1 400 ")
+
+
+
+def test_bus_keeps_dispatching_after_a_failing_event():
+    errors, received = [], []
+
+    def on_error(event, error):
+        errors.append(event.id)
+        raise RuntimeError("on_error failed too")
+
+    configure_cache().set("cred", "env", "my-proj", {"envs": []}, 10)
+    bus = EventBus(on_error=on_error)
+    bus.subscribe(lambda event: received.append(event.id))
+    bus.publish(VercelEvent(id="bad", type="project.created", payload={"projectId": 123}))
+    bus.publish(VercelEvent(id="good", type="project.created", payload={"projectId": "prj_2WjyKQmM8ZnGcJsPWMrHRHrE"}))
+    bus.join()
+    assert errors == ["bad"]
+    assert received == ["bad", "good"]
+
+
+def test_errors_of_coroutine_subscribers_reach_on_error():
+    async def main():
+        reported = asyncio.get_running_loop().create_future()
+        bus = EventBus(invalidate=False, on_error=lambda event, error: reported.get_loop().call_soon_threadsafe(reported.set_result, error))
+
+        async def subscriber(event):
+            raise ValueError(event.id)
+
+        bus.subscribe(subscriber)
+        bus.publish(VercelEvent(id="evt_1", type="deployment.created"))
+        return await asyncio.wait_for(reported, 5)
+
+    error = asyncio.run(main())
+    assert isinstance(error, ValueError) and str(error) == "evt_1"
@@ -0,0 +1,366 @@
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from tool_runtime.credentials import credential_fingerprint
+from tool_runtime.ratelimit import RateLimiter, RetryPolicy
+
+from .instrumentation import Span
+
+if TYPE_CHECKING:
+    import requests
+
+BASE_URL = "https://api.vercel.com"
+
+# Responses meaning the credential is not, or no longer, allowed to act.
+AUTH_FAILURE_STATUSES = frozenset({401, 403})
+
+# Time the current thread spent waiting for pooled connections, see `_timed_pool_classes`.
+_pool_timing = threading.local()
+
+
+def _timed_pool_classes() -> dict:
+    """Return urllib3 connection pool classes that record the time spent checking out a connection."""
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+    def _get_conn(pool_class):
+        def get_conn(self, timeout=None):
+            start = time.perf_counter()
+            try:
+                return pool_class._get_conn(self, timeout)
+            finally:
+                _pool_timing.wait = getattr(_pool_timing, "wait", 0.0) + time.perf_counter() - start
+
+        return get_conn
+
+    return {
+        "http": type("TimedHTTPConnectionPool", (HTTPConnectionPool,), {"_get_conn": _get_conn(HTTPConnectionPool)}),
+        "https": type("TimedHTTPSConnectionPool", (HTTPSConnectionPool,), {"_get_conn": _get_conn(HTTPSConnectionPool)}),
+    }
+
+
+class _Trace:
+    """httpx `trace` extension callback recording when each connection and HTTP event first happened."""
+
+    __slots__ = ("start", "events")
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.events = {}
+
+    async def __call__(self, event: str, info: dict) -> None:
+        self.events.setdefault(event, time.perf_counter())
+
+    def _first(self, suffix: str):
+        times = [at for event, at in self.events.items() if event.endswith(suffix)]
+        return min(times) if times else None
+
+    def record(self, span: Span) -> None:
+        sent = self._first("send_request_headers.started")
+        received = self._first("receive_response_headers.complete")
+        connect_started = self.events.get("connection.connect_tcp.started")
+        if connect_started is not None:
+            span.add("pool_wait", connect_started - self.start)
+            connected = max(at for event, at in self.events.items() if event.startswith("connection.") and event.endswith(".complete"))
+            span.add("connect", connected - connect_started)
+        elif sent is not None:
+            span.add("pool_wait", sent - self.start)
+        if sent is not None and received is not None:
+            span.add("server", received - sent)
+
+
+def _refused(credential: str) -> None:
+    """Drop the cached validation of a credential the API just refused (see `vercel.connections`)."""
+    from .connections import get_connection_cache
+
+    get_connection_cache().invalidate(credential)
+
+
+class _Attempts:
+    """
+    Observer of the attempts of one request (see `RetryPolicy.run`): drops the cached validation of a refused
+    credential and, when a span is given, records the rate-limit, pool, server and backoff timings on it.
+    """
+
+    __slots__ = ("credential", "span", "traced", "trace")
+
+    def __init__(self, credential: str, span: Span, traced: bool = False):
+        self.credential = credential
+        self.span = span
+        self.traced = traced
+        self.trace = None
+
+    def waited(self, seconds: float) -> None:
+        if self.span is None:
+            return
+        if seconds > 0:
+            self.span.add("rate_limit", seconds)
+        if self.traced:
+            self.trace = _Trace()
+        else:
+            _pool_timing.wait = 0.0
+
+    def received(self, response) -> None:
+        if response.status_code in AUTH_FAILURE_STATUSES:
+            _refused(self.credential)
+        span = self.span
+        if span is None:
+            return
+        if self.traced:
+            self.trace.record(span)
+            span.bytes_sent += len(response.request.content)
+        else:
+            pool_wait = _pool_timing.wait
+            span.add("pool_wait", pool_wait)
+            span.add("server", response.elapsed.total_seconds() - pool_wait)
+            span.bytes_sent += len(response.request.body or b"")
+        span.status = response.status_code
+
+    def retried(self, attempt: int, delay: float) -> None:
+        if self.span is not None:
+            self.span.add("backoff", delay)
+            self.span.retries = attempt
+
+
+class VercelTransport:
+    """
+    Shared HTTP transport used by every Vercel action.
+
+    A single `requests.Session` is kept per transport so connections to the Vercel API are reused
+    across action invocations instead of paying a DNS lookup and a TCP/TLS handshake on every call.
+    The session is created lazily and is safe to share between threads: urllib3 keeps one
+    keep-alive pool per host and hands out connections under its own lock, and cookies are disabled
+    so that no state leaks between credentials.
+
+    The asyncio path uses one `httpx.AsyncClient` per running event loop, sharing the same timeouts.
+    `requests` and `httpx` are only imported when the sync and async paths are first used, so
+    importing the transport stays cheap for workers that load many tools at boot.
+
+    Both paths pace requests through a token bucket per credential and endpoint (`rate_limiter`) that follows
+    Vercel's `X-RateLimit-*` headers, and retry idempotent requests on 429, 5xx and connection errors
+    according to `retry_policy`. Non-idempotent requests are sent once; their rate-limit headers still
+    feed the bucket so the next requests are paced.
+
+    Args:
+        base_url: The Vercel API origin. Used for warm-up.
+        pool_connections: The number of per-host pools to keep.
+        pool_maxsize: The maximum number of keep-alive connections kept per host.
+        pool_block: Whether to wait for a free connection instead of opening an extra one when the pool is exhausted.
+        connect_timeout: Seconds to wait for a connection to be established.
+        read_timeout: Seconds to wait for the server to send a response.
+        async_max_connections: The maximum number of concurrent connections held by each async client.
+        rate_limiter: The token buckets per credential and endpoint. Defaults to a `RateLimiter` with default limits.
+        retry_policy: The retry and backoff policy. Defaults to a `RetryPolicy` with default settings.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        async_max_connections: int = 256,
+        rate_limiter: RateLimiter = None,
+        retry_policy: RetryPolicy = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.async_max_connections = async_max_connections
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self._session = None
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> tuple:
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def session(self) -> "requests.Session":
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    def _build_session(self) -> "requests.Session":
+        from http.cookiejar import DefaultCookiePolicy
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        adapter.poolmanager.pool_classes_by_scheme = _timed_pool_classes()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _bucket(self, method: str, url: str, credential: str, limit_group: str):
+        return self.rate_limiter.bucket(credential, limit_group or f"{method.upper()} {urlsplit(url).path}")
+
+    def request(
+        self, method: str, url: str, headers: dict = None, idempotent: bool = None, span: Span = None, limit_group: str = None, **kwargs
+    ) -> "requests.Response":
+        """
+        Send a request, pacing it through the credential's token bucket and retrying it if allowed.
+
+        Requests with the same `limit_group`, by default the method and URL path, share a bucket; pass the
+        endpoint's path template so that calls for different projects do. A request that would have to
+        wait longer than the retry policy's `backoff_max` for its bucket raises `RateLimitError` instead.
+        `idempotent` overrides the method-based retry decision of the `retry_policy`, set it for
+        requests such as PATCHes that are safe to repeat. When a `span` is given, the rate-limit, pool,
+        server and backoff timings, the bytes sent and the retry count are recorded on it.
+        """
+        import requests
+
+        kwargs.setdefault("timeout", self.timeout)
+        credential = credential_fingerprint(headers or {})
+        return self.retry_policy.run(
+            lambda: self.session.request(method, url, headers=headers, **kwargs),
+            self._bucket(method, url, credential, limit_group),
+            method,
+            idempotent,
+            errors=(requests.ConnectionError, requests.Timeout),
+            observer=_Attempts(credential, span),
+        )
+
+    def _async_client(self):
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            import httpx
+
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout, pool=None),
+                limits=httpx.Limits(
+                    max_connections=self.async_max_connections,
+                    max_keepalive_connections=self.pool_maxsize,
+                ),
+            )
+            with self._lock:
+                client = self._async_clients.setdefault(loop, client)
+        return client
+
+    async def request_async(
+        self, method: str, url: str, headers: dict = None, idempotent: bool = None, span: Span = None, limit_group: str = None, stream: bool = False, **kwargs
+    ):
+        """
+        Asyncio counterpart of `request`, returning an `httpx.Response`.
+
+        Accepts the same keyword arguments as `httpx.AsyncClient.request` (`json`, `content`, `params`, ...).
+        With `stream`, the response body is left unread, to be read with `aiter_bytes` and closed with `aclose`.
+        """
+        import httpx
+
+        client = self._async_client()
+        credential = credential_fingerprint(headers or {})
+        attempts = _Attempts(credential, span, traced=True)
+
+        async def send():
+            if attempts.trace is not None:
+                kwargs["extensions"] = {"trace": attempts.trace}
+            if stream:
+                return await client.send(client.build_request(method, url, headers=headers, **kwargs), stream=True)
+            return await client.request(method, url, headers=headers, **kwargs)
+
+        return await self.retry_policy.run_async(
+            send, self._bucket(method, url, credential, limit_group), method, idempotent, errors=(httpx.TransportError,), observer=attempts
+        )
+
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Open up to `connections` keep-alive connections to the API origin ahead of time.
+
+        Each connection is established with a lightweight HEAD request; the responses are discarded
+        and the connections are returned to the pool for the actions to reuse. Returns the number of
+        requests that completed, failures are ignored since warm-up is best effort.
+        """
+        import requests
+
+        connections = max(1, min(connections, self.pool_maxsize))
+
+        def _open(_):
+            try:
+                self.session.request("HEAD", self.base_url, timeout=self.timeout).close()
+                return True
+            except requests.RequestException:
+                return False
+
+        if connections == 1:
+            return int(_open(0))
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(_open, range(connections)))
+
+    def close(self) -> None:
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running event loop, if any."""
+        import asyncio
+
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> VercelTransport:
+    """Return the process-wide transport, creating it with default settings on first use."""
+    global _transport
+    transport = _transport
+    if transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = VercelTransport()
+            transport = _transport
+    return transport
+
+
+def configure_transport(**kwargs) -> VercelTransport:
+    """
+    Replace the process-wide transport with one built from `kwargs` (see `VercelTransport`).
+
+    The previous transport is closed, in-flight requests on it finish on their existing connections.
+    """
+    global _transport
+    transport = VercelTransport(**kwargs)
+    with _transport_lock:
+        previous, _transport = _transport, transport
+    if previous is not None:
+        previous.close()
+    return transport
+
+
+def warm_up(connections: int = 1) -> int:
+    """Warm up the process-wide transport, see `VercelTransport.warm_up`."""
+    return get_transport().warm_up(connections)
+
+
+__all__ = ["AUTH_FAILURE_STATUSES", "BASE_URL", "VercelTransport", "configure_transport", "get_transport", "warm_up"]
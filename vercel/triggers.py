@@ -0,0 +1,399 @@
+"""
+Vercel webhook triggers.
+
+Instead of polling `FindProjectAction` for deployment and project changes, register a webhook on Vercel
+pointing at a `WebhookReceiver` and subscribe to the events it receives:
+
+    bus = get_event_bus()
+    bus.subscribe(on_deployment, events=("deployment.succeeded", "deployment.error"))
+    with WebhookReceiver(secret=os.environ["VERCEL_WEBHOOK_SECRET"], port=8787):
+        ...
+
+The receiver verifies the `x-vercel-signature` of every delivery (an HMAC-SHA1 of the raw body keyed by
+the webhook secret), answers immediately and hands the decoded `VercelEvent` to the `EventBus`. The bus
+drops the cached reads of the project an event touches (see `vercel.cache` and `vercel.project_index`)
+and dispatches the event to its subscribers from a single worker thread, so slow subscribers never delay
+the acknowledgement Vercel waits for.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import inspect
+import queue
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from .cache import get_cache
+from .codec import get_codec
+from .project_index import get_project_index
+
+SIGNATURE_HEADER = "x-vercel-signature"
+
+# Events after which the project no longer exists.
+_REMOVALS = frozenset({"project.removed"})
+
+
+def sign(secret: str, body: bytes) -> str:
+    """Return the `x-vercel-signature` Vercel sends with `body` for a webhook with this `secret`."""
+    key = secret.encode() if isinstance(secret, str) else secret
+    return hmac.new(key, body, hashlib.sha1).hexdigest()
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Check the `x-vercel-signature` of a delivery in constant time."""
+    return bool(signature) and hmac.compare_digest(sign(secret, body), signature)
+
+
+@dataclass(frozen=True)
+class VercelEvent:
+    """
+    One webhook event.
+
+    Attributes:
+        id: The event ID. Vercel may deliver an event more than once; the bus dispatches each ID once.
+        type: The event type, e.g. `"deployment.succeeded"`.
+        created_at: When the event happened, in milliseconds since the epoch.
+        payload: The event-specific payload.
+        region: The region the event was emitted from, when given.
+    """
+
+    id: str
+    type: str
+    created_at: int = None
+    payload: dict = field(default_factory=dict)
+    region: str = None
+
+    @classmethod
+    def from_json(cls, body: bytes) -> "VercelEvent":
+        data = get_codec().loads(body)
+        if not isinstance(data, dict) or not isinstance(data.get("type"), str):
+            raise ValueError("Not a Vercel webhook event")
+        return cls(
+            id=data.get("id"),
+            type=data["type"],
+            created_at=data.get("createdAt"),
+            payload=data.get("payload") or {},
+            region=data.get("region"),
+        )
+
+    @property
+    def project_id(self):
+        project = self.payload.get("project")
+        if isinstance(project, dict) and project.get("id"):
+            return project["id"]
+        return self.payload.get("projectId")
+
+    @property
+    def deployment_id(self):
+        deployment = self.payload.get("deployment")
+        if isinstance(deployment, dict):
+            return deployment.get("id")
+        return None
+
+
+class Subscription:
+    """A subscriber of the `EventBus`, as returned by `EventBus.subscribe`. Call `cancel` to unsubscribe."""
+
+    __slots__ = ("callback", "events", "prefixes", "loop", "_bus")
+
+    def __init__(self, bus: "EventBus", callback: Callable, events):
+        self._bus = bus
+        self.callback = callback
+        patterns = tuple(events) if events else ("*",)
+        self.events = frozenset(pattern for pattern in patterns if not pattern.endswith("*"))
+        self.prefixes = tuple(pattern[:-1] for pattern in patterns if pattern.endswith("*"))
+        self.loop = None
+        if inspect.iscoroutinefunction(callback):
+            self.loop = asyncio.get_running_loop()
+
+    def matches(self, event_type: str) -> bool:
+        return event_type in self.events or event_type.startswith(self.prefixes)
+
+    def cancel(self) -> None:
+        self._bus.unsubscribe(self)
+
+
+class EventBus:
+    """
+    In-process queue dispatching webhook events to their subscribers.
+
+    `publish` only enqueues the event; a daemon worker thread, started with the first event, invalidates
+    the cached reads the event touches and then calls the matching subscribers in subscription order.
+    Coroutine function subscribers must subscribe from a running event loop and are scheduled on it.
+    The subscribers matching each event type are worked out once and reused until the subscriptions change.
+
+    Args:
+        invalidate: Whether events drop the cached project and environment-variable reads of their project.
+        on_error: Called with `(event, exception)` when a subscriber, coroutine subscribers included, or the
+            invalidation of an event raises. Errors are otherwise ignored so that one subscriber or event cannot
+            stop the others; errors raised by `on_error` itself are ignored too.
+        dedupe: The number of recent event IDs remembered to drop redelivered events.
+    """
+
+    def __init__(self, invalidate: bool = True, on_error: Callable = None, dedupe: int = 1024):
+        self.invalidate = invalidate
+        self.on_error = on_error
+        self.dedupe = dedupe
+        self._subscriptions = ()
+        self._matching = {}
+        self._seen = OrderedDict()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def subscribe(self, callback: Callable, events=None) -> Subscription:
+        """
+        Call `callback(event)` for every event whose type is in `events`, all events when not given.
+
+        An entry ending with `*` matches a prefix, e.g. `"deployment.*"`.
+        """
+        subscription = Subscription(self, callback, events)
+        with self._lock:
+            self._subscriptions = (*self._subscriptions, subscription)
+            self._matching = {}
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions = tuple(existing for existing in self._subscriptions if existing is not subscription)
+            self._matching = {}
+
+    def publish(self, event: VercelEvent) -> bool:
+        """Enqueue `event` for dispatch. Returns `False` when an event with the same ID was already published."""
+        with self._lock:
+            if event.id is not None:
+                if event.id in self._seen:
+                    return False
+                self._seen[event.id] = None
+                if len(self._seen) > self.dedupe:
+                    self._seen.popitem(last=False)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="vercel-events", daemon=True)
+                self._worker.start()
+        self._queue.put(event)
+        return True
+
+    def join(self) -> None:
+        """Block until every published event has been dispatched."""
+        self._queue.join()
+
+    def _subscribers(self, event_type: str) -> tuple:
+        matching = self._matching.get(event_type)
+        if matching is None:
+            with self._lock:
+                matching = tuple(subscription for subscription in self._subscriptions if subscription.matches(event_type))
+                self._matching[event_type] = matching
+        return matching
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            try:
+                self._dispatch(event)
+            except Exception:
+                # One event failing to dispatch must not stop the only worker: later events would never be delivered.
+                pass
+            finally:
+                self._queue.task_done()
+
+    def _dispatch(self, event: VercelEvent) -> None:
+        if self.invalidate:
+            try:
+                invalidate_event(event)
+            except Exception as e:
+                self._report(event, e)
+        for subscription in self._subscribers(event.type):
+            try:
+                if subscription.loop is not None:
+                    future = asyncio.run_coroutine_threadsafe(subscription.callback(event), subscription.loop)
+                    future.add_done_callback(lambda future, event=event: self._reported(event, future))
+                else:
+                    subscription.callback(event)
+            except Exception as e:
+                self._report(event, e)
+
+    def _reported(self, event: VercelEvent, future) -> None:
+        # Done callback of the coroutine subscribers, run on their event loop.
+        if not future.cancelled() and future.exception() is not None:
+            self._report(event, future.exception())
+
+    def _report(self, event: VercelEvent, error: Exception) -> None:
+        if self.on_error is None:
+            return
+        try:
+            self.on_error(event, error)
+        except Exception:
+            pass
+
+
+def invalidate_event(event: VercelEvent) -> None:
+    """Drop the cached reads of the project `event` touches, under every credential that has it cached."""
+    project_id = event.project_id
+    if not project_id:
+        return
+    get_cache().invalidate_project(None, project_id)
+    if event.type in _REMOVALS:
+        get_project_index().forget(None, project_id)
+
+
+class WebhookReceiver:
+    """
+    Local HTTP endpoint for Vercel webhook deliveries.
+
+    Deliveries are accepted on `path` only, as `POST` requests of at most `max_body` bytes carrying a valid
+    `x-vercel-signature`. Unsigned or wrongly signed deliveries are answered `403`, undecodable ones or ones
+    with an invalid `Content-Length` `400`; accepted events are published to `bus` and answered `200` without waiting for the subscribers.
+
+    Args:
+        secret: The webhook secret shown by Vercel when the webhook was created.
+        bus: The bus events are published to, the process-wide one by default.
+        host: The interface to listen on.
+        port: The port to listen on, `0` for any free port (see `url`).
+        path: The URL path deliveries are posted to.
+        max_body: The largest delivery accepted, in bytes.
+    """
+
+    def __init__(self, secret: str, bus: EventBus = None, host: str = "127.0.0.1", port: int = 0, path: str = "/", max_body: int = 1024 * 1024):
+        if not secret:
+            raise ValueError("A webhook secret is required to verify deliveries")
+        self.secret = secret
+        self.bus = bus
+        self.host = host
+        self.port = port
+        self.path = path
+        self.max_body = max_body
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{self.path}"
+
+    def start(self) -> "WebhookReceiver":
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                receiver._receive(self)
+
+        class Server(ThreadingHTTPServer):
+            daemon_threads = True
+
+        self._server = Server((self.host, self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, name="vercel-webhooks", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "WebhookReceiver":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, body: bytes, signature: str) -> int:
+        """Verify, decode and publish one delivery. Returns the HTTP status to answer with."""
+        if not verify_signature(self.secret, body, signature):
+            return 403
+        try:
+            event = VercelEvent.from_json(body)
+        except ValueError:
+            return 400
+        (self.bus or get_event_bus()).publish(event)
+        return 200
+
+    def _receive(self, handler: BaseHTTPRequestHandler) -> None:
+        length = (handler.headers.get("Content-Length") or "0").strip()
+        # Anything but a non-negative decimal length leaves the end of the body unknown.
+        valid_length = length.isascii() and length.isdecimal()
+        if handler.path.split("?", 1)[0] != self.path:
+            status = 404
+        elif not valid_length:
+            status = 400
+        elif int(length) > self.max_body:
+            status = 413
+        else:
+            status = self.handle(handler.rfile.read(int(length)), handler.headers.get(SIGNATURE_HEADER))
+        if status in (404, 413) or not valid_length:
+            # The body was not read, the connection cannot be reused.
+            handler.close_connection = True
+        handler.send_response(status)
+        handler.send_header("Content-Length", "0")
+        handler.end_headers()
+
+
+@dataclass(frozen=True)
+class Trigger:
+    """
+    A kind of Vercel change that can be subscribed to, as listed by `Vercel.triggers`.
+
+    Attributes:
+        name: The trigger name.
+        events: The webhook event types that fire the trigger.
+        description: What the trigger reports.
+    """
+
+    name: str
+    events: tuple
+    description: str
+
+    def subscribe(self, callback: Callable, bus: EventBus = None) -> Subscription:
+        """Call `callback(event)` for the events of this trigger received on `bus`, the process-wide one by default."""
+        return (bus or get_event_bus()).subscribe(callback, self.events)
+
+
+TRIGGERS = (
+    Trigger("DeploymentCreated", ("deployment.created",), "A deployment of a project was created."),
+    Trigger("DeploymentSucceeded", ("deployment.succeeded", "deployment.ready"), "A deployment finished building and is ready."),
+    Trigger("DeploymentFailed", ("deployment.error", "deployment.canceled"), "A deployment failed or was canceled."),
+    Trigger("DeploymentPromoted", ("deployment.promoted",), "A deployment was promoted to production."),
+    Trigger("ProjectCreated", ("project.created",), "A project was created."),
+    Trigger("ProjectRemoved", ("project.removed",), "A project was deleted."),
+    Trigger("DomainCreated", ("domain.created",), "A domain was added."),
+)
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus."""
+    return _bus
+
+
+def configure_event_bus(**kwargs) -> EventBus:
+    """Replace the process-wide event bus with one built from `kwargs` (see `EventBus`)."""
+    global _bus
+    _bus = EventBus(**kwargs)
+    return _bus
+
+
+__all__ = [
+    "EventBus",
+    "Subscription",
+    "TRIGGERS",
+    "Trigger",
+    "VercelEvent",
+    "WebhookReceiver",
+    "configure_event_bus",
+    "get_event_bus",
+    "invalidate_event",
+    "sign",
+    "verify_signature",
+]
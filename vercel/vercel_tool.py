@@ -1,29 +1,98 @@
 from shared.composio_tools.lib import Action, Tool
 
-from .actions import AddDomainAction, CreateEnvVarAction, CreateProjectAction, DeleteProjectAction, EditEnvVarAction, FindProjectAction, GetEnvVarsAction, PauseProjectAction, UnpauseProjectAction, UpdateProjectAction
+from . import actions as vercel_actions
 
+ACTION_NAMES = (
+    "GetEnvVarsAction",
+    "FindProjectAction",
+    "ListProjectsAction",
+    "AddDomainAction",
+    "CreateProjectAction",
+    "CreateEnvVarAction",
+    "DeleteProjectAction",
+    "EditEnvVarAction",
+    "ReconcileEnvVarsAction",
+    "PauseProjectAction",
+    "UnpauseProjectAction",
+    "UpdateProjectAction",
+    "BulkPauseProjectsAction",
+    "BulkUnpauseProjectsAction",
+    "BulkDeleteProjectsAction",
+)
 
 
 class Vercel(Tool):
     """
     Tool for managing Vercel projects.
+
+    Action classes are resolved lazily: `action` imports only the requested action's module, while
+    `actions` resolves all of them. The JSON schemas of every action are available precomputed from
+    `schemas` (see `vercel.schemas`), and the compiled request validators from `validator`. `batch` and
+    `batch_async` run several action calls concurrently (see `vercel.batch`). `triggers` lists the
+    changes that can be subscribed to through a webhook receiver instead of polling (see
+    `vercel.triggers`). `validate_connection` checks who a credential belongs to, answering from a
+    per-credential cache after the first call (see `vercel.connections`).
     """
 
     def actions(self) -> list:
-        return [
-            GetEnvVarsAction,
-            FindProjectAction,
-            AddDomainAction,
-            CreateProjectAction,
-            CreateEnvVarAction,
-            DeleteProjectAction,
-            EditEnvVarAction,
-            PauseProjectAction,
-            UnpauseProjectAction,
-            UpdateProjectAction,
-        ]
+        return [getattr(vercel_actions, name) for name in ACTION_NAMES]
+
+    def action(self, name: str) -> type:
+        if name not in ACTION_NAMES:
+            raise ValueError(f"Unknown Vercel action: {name}")
+        return getattr(vercel_actions, name)
+
+    def schemas(self) -> dict:
+        """Return the request and response JSON schemas of every action, keyed by action name."""
+        from .schemas import get_schema_registry
+
+        return get_schema_registry().schemas()
+
+    def validator(self, name: str):
+        """
+        Return the compiled validator of action `name`'s request model.
+
+        It is the pydantic-core validator the model built when it was defined, so callers validating requests
+        themselves reuse it instead of building a new one: `tool.validator(name).validate_python(data)`.
+        """
+        return self.action(name)._request_schema.__pydantic_validator__
+
+    def batch(self, items: list, authorisation_data: dict) -> list:
+        """
+        Run `BatchItem`s concurrently with the process-wide `BatchExecutor`.
+
+        Returns one `BatchResult` per item, in the order of `items`.
+        """
+        from .batch import get_batch_executor
+
+        return get_batch_executor().run(items, authorisation_data)
+
+    async def batch_async(self, items: list, authorisation_data: dict) -> list:
+        """Asyncio counterpart of `batch`."""
+        from .batch import get_batch_executor
+
+        return await get_batch_executor().run_async(items, authorisation_data)
 
     def triggers(self) -> list:
-        return []
+        """Return the `Trigger`s fed by Vercel webhooks (see `vercel.triggers`)."""
+        from .triggers import TRIGGERS
+
+        return list(TRIGGERS)
+
+    def validate_connection(self, authorisation_data: dict, force: bool = False) -> dict:
+        """
+        Return the user and team scope of the credential in `authorisation_data`, `{"valid": False, ...}` if
+        the API refuses it. The result is cached per credential until its TTL runs out or an action gets a
+        401 or 403 for it; `force` asks the API again.
+        """
+        from .connections import validate_connection
+
+        return validate_connection(authorisation_data, force)
+
+    async def validate_connection_async(self, authorisation_data: dict, force: bool = False) -> dict:
+        """Asyncio counterpart of `validate_connection`."""
+        from .connections import validate_connection_async
+
+        return await validate_connection_async(authorisation_data, force)
 
-__all__ = ["Vercel"]
\ No newline at end of file
+__all__ = ["Vercel"]